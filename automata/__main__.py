@@ -1,7 +1,38 @@
 """Entry point for running the cellular automata demo."""
 
-from automata.main import main
+import importlib
 import sys
 
+# Headless subcommands: name -> (module, function taking argv -> int).
+# Imported lazily so they never pull in curses or the UI package.
+COMMANDS = {
+    "run": ("automata.headless", "main"),
+    "replay": ("automata.headless", "replay_main"),
+    "survey": ("automata.survey", "main"),
+    "ensemble": ("automata.ensemble", "main"),
+    "serve": ("automata.server", "main"),
+}
+
+
+def dispatch(argv: list[str]) -> int:
+    """
+    Run a headless subcommand, or the interactive curses UI by default.
+
+    Args:
+        argv: Command line arguments (without the program name)
+
+    Returns:
+        Exit code
+    """
+    if argv and argv[0] in COMMANDS:
+        module_name, function_name = COMMANDS[argv[0]]
+        module = importlib.import_module(module_name)
+        return getattr(module, function_name)(argv[1:])
+
+    from automata.main import main
+
+    return main(argv)
+
+
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(dispatch(sys.argv[1:]))
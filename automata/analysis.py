@@ -0,0 +1,330 @@
+"""Streaming per-generation metrics over a row stream.
+
+Each metric is a generator stage: it takes an iterable of Sample records,
+adds its values to each and yields it on. Stages chain into one lazy
+pipeline, so every row passes through all of them before the next row is
+even computed: the metrics are fused into a single pass and nothing but the
+current row (and the perturbed twin, for damage) is ever held.
+
+    rows -> samples() -> density() -> entropy() -> runs() -> damage() -> out
+
+All metrics work on packed rows (see automata.packed) with popcounts and
+whole-row shifts rather than per-cell loops. Rows are treated as toroidal.
+"""
+
+import csv
+import json
+from collections import Counter
+from typing import NamedTuple
+
+from automata.entropy import BLOCK_SIZE, packed_block_entropy
+from automata.packed import evolve_packed_row, rotate_row, row_mask
+
+METRICS = ["density", "entropy", "runs", "damage"]
+
+OUTPUT_FORMATS = ["csv", "jsonl"]
+
+# Columns each metric adds to the output
+METRIC_FIELDS = {
+    "density": ["density"],
+    "entropy": ["entropy"],
+    "runs": ["runs", "mean_run", "max_run"],
+    "damage": ["damage"],
+}
+
+
+class Sample(NamedTuple):
+    """One generation flowing through the pipeline."""
+
+    generation: int
+    bits: int  # Packed row
+    values: dict  # Metric name -> value, filled in by the stages
+
+
+def samples(rows, start: int = 0):
+    """
+    Wrap a row stream as Samples.
+
+    Args:
+        rows: Iterable of packed rows
+        start: Generation number of the first row
+
+    Yields:
+        Sample with no values yet
+    """
+    for generation, bits in enumerate(rows, start):
+        yield Sample(generation, bits, {})
+
+
+def density(stream, width: int):
+    """
+    Add the live cell fraction.
+
+    Args:
+        stream: Iterable of Sample
+        width: Cells per row
+
+    Yields:
+        Samples with "density" set
+    """
+    for sample in stream:
+        sample.values["density"] = sample.bits.bit_count() / width
+        yield sample
+
+
+def entropy(stream, width: int, block: int = BLOCK_SIZE):
+    """
+    Add the block entropy (see entropy.block_entropy()).
+
+    Args:
+        stream: Iterable of Sample
+        width: Cells per row
+        block: Window length in cells
+
+    Yields:
+        Samples with "entropy" set, in bits per cell
+    """
+    for sample in stream:
+        sample.values["entropy"] = packed_block_entropy(sample.bits, width, block)
+        yield sample
+
+
+def run_lengths(bits: int, width: int) -> dict[int, int]:
+    """
+    Count the maximal runs of live cells in a toroidal row by length.
+
+    The row is rotated so that its last cell is dead, which stops any run
+    from wrapping around, and then split on dead cells in a single pass
+    over its binary string.
+
+    Args:
+        bits: Packed row
+        width: Cells per row
+
+    Returns:
+        Run length -> number of runs
+    """
+    if bits == row_mask(width):
+        return {width: 1} if width else {}
+    # Bring the least significant dead cell to the end of the row
+    dead = (~bits & (bits + 1)).bit_length() - 1
+    bits = rotate_row(bits, width, -dead)
+    return dict(Counter(len(run) for run in format(bits, "b").split("0") if run))
+
+
+def runs(stream, width: int):
+    """
+    Add the run-length distribution of live cells.
+
+    Args:
+        stream: Iterable of Sample
+        width: Cells per row
+
+    Yields:
+        Samples with "runs" (number of runs), "mean_run", "max_run" and
+        "run_lengths" (length -> count) set
+    """
+    for sample in stream:
+        lengths = run_lengths(sample.bits, width)
+        count = sum(lengths.values())
+        values = sample.values
+        values["run_lengths"] = lengths
+        values["runs"] = count
+        values["mean_run"] = sample.bits.bit_count() / count if count else 0.0
+        values["max_run"] = max(lengths, default=0)
+        yield sample
+
+
+def damage(stream, rule_number: int, width: int, cell: int | None = None):
+    """
+    Add the Hamming distance to a twin run with one cell flipped.
+
+    The twin starts from the first row of the stream with one cell
+    inverted and is evolved alongside it, so each value measures how far
+    that single-bit perturbation has spread.
+
+    Args:
+        stream: Iterable of consecutive Samples
+        rule_number: Integer 0-255 the stream's rows evolve under
+        width: Cells per row
+        cell: Column to flip (default: the center)
+
+    Yields:
+        Samples with "damage" (number of differing cells) set
+    """
+    if cell is None:
+        cell = width // 2
+    twin = None
+    for sample in stream:
+        if twin is None:
+            twin = sample.bits ^ (1 << (width - 1 - cell))
+        else:
+            twin = evolve_packed_row(twin, rule_number, width)
+        sample.values["damage"] = (sample.bits ^ twin).bit_count()
+        yield sample
+
+
+def analyze(
+    rows,
+    width: int,
+    metrics,
+    rule_number: int | None = None,
+    start: int = 0,
+    damage_cell: int | None = None,
+):
+    """
+    Build a fused pipeline computing several metrics per row.
+
+    Args:
+        rows: Iterable of packed rows
+        width: Cells per row
+        metrics: Metric names from METRICS
+        rule_number: Rule the rows evolve under (needed for "damage")
+        start: Generation number of the first row
+        damage_cell: Column flipped for "damage" (default: the center)
+
+    Returns:
+        Lazy iterator of Samples
+    """
+    stream = samples(rows, start)
+    for metric in metrics:
+        if metric == "density":
+            stream = density(stream, width)
+        elif metric == "entropy":
+            stream = entropy(stream, width)
+        elif metric == "runs":
+            stream = runs(stream, width)
+        elif metric == "damage":
+            if rule_number is None:
+                raise ValueError("damage needs the rule number")
+            stream = damage(stream, rule_number, width, damage_cell)
+        else:
+            raise ValueError(f"unknown metric: {metric!r}")
+    return stream
+
+
+def parse_metrics(text: str) -> list[str]:
+    """
+    Parse a comma-separated metric list.
+
+    Args:
+        text: For example "density,entropy"
+
+    Returns:
+        Metric names in the order given, without duplicates
+
+    Raises:
+        ValueError: If a name is not in METRICS
+    """
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    unknown = [name for name in names if name not in METRICS]
+    if not names or unknown:
+        raise ValueError(f"metrics must be chosen from {', '.join(METRICS)}")
+    return list(dict.fromkeys(names))
+
+
+def write_metrics(out, stream, metrics, fmt: str) -> None:
+    """
+    Write one line per sample as CSV or JSON lines, as samples arrive.
+
+    JSON lines also include the full run-length distribution.
+
+    Args:
+        out: Writable text file object
+        stream: Iterable of Sample, e.g. from analyze()
+        metrics: Metric names the stream computes
+        fmt: One of OUTPUT_FORMATS
+    """
+    fields = [field for metric in metrics for field in METRIC_FIELDS[metric]]
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(["generation"] + fields)
+        for sample in stream:
+            writer.writerow(
+                [sample.generation] + [sample.values[field] for field in fields]
+            )
+    else:
+        for sample in stream:
+            record = {"generation": sample.generation}
+            record.update((field, sample.values[field]) for field in fields)
+            if "runs" in metrics:
+                record["run_lengths"] = sample.values["run_lengths"]
+            out.write(json.dumps(record) + "\n")
+
+
+def format_values(values: dict) -> str:
+    """
+    Format metric values for the status line.
+
+    Args:
+        values: Sample.values
+
+    Returns:
+        Short one-line summary
+    """
+    parts = []
+    if "density" in values:
+        parts.append(f"density {values['density']:.3f}")
+    if "entropy" in values:
+        parts.append(f"entropy {values['entropy']:.3f}")
+    if "runs" in values:
+        parts.append(f"runs {values['runs']} max {values['max_run']}")
+    if "damage" in values:
+        parts.append(f"damage {values['damage']}")
+    return "  ".join(parts)
+
+
+class LiveAnalysis:
+    """
+    Drive an analyze() pipeline one row at a time.
+
+    The viewer produces rows as the simulation advances rather than as an
+    iterable, so rows are pushed in with update() and each is pulled
+    straight through the pipeline.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        metrics,
+        rule_number: int | None = None,
+        start: int = 0,
+    ):
+        """
+        Args:
+            width: Cells per row
+            metrics: Metric names from METRICS
+            rule_number: Rule the rows evolve under (needed for "damage")
+            start: Generation number of the first row pushed
+        """
+        self._pending = []
+        self._pipeline = analyze(self._drain(), width, metrics, rule_number, start)
+        self.values = {}
+
+    def _drain(self):
+        """Yield pushed rows; the pipeline only pulls after a push."""
+        while True:
+            yield self._pending.pop()
+
+    def update(self, bits: int) -> dict:
+        """
+        Feed the next generation through the pipeline.
+
+        Args:
+            bits: Packed row one generation after the previous one
+
+        Returns:
+            Metric values for this row
+        """
+        self._pending.append(bits)
+        self.values = next(self._pipeline).values
+        return self.values
+
+    def summary(self) -> str:
+        """
+        Format the latest values for the status line.
+
+        Returns:
+            Short one-line summary
+        """
+        return format_values(self.values)
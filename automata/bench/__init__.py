@@ -0,0 +1 @@
+"""Benchmarks for the simulation engines and the render path."""
@@ -0,0 +1,282 @@
+"""Command line entry point: python -m automata.bench."""
+
+import argparse
+import json
+import sys
+
+from automata.bench.compare import (
+    check_version,
+    compare,
+    format_params,
+    format_report,
+)
+from automata.bench.loop import (
+    DEFAULT_DURATION,
+    DEFAULT_LOOP_SIZES,
+    MODES,
+    loop_cases,
+    run_loop_suite,
+)
+from automata.bench.suite import (
+    DEFAULT_FRAME_SIZES,
+    DEFAULT_GENERATIONS,
+    DEFAULT_RULES,
+    DEFAULT_WIDTHS,
+    DEFAULT_ZOOMS,
+    ENGINES,
+    SUITE_VERSION,
+    engine_cases,
+    frame_cases,
+    run_suite,
+)
+
+
+def _int_list(text: str) -> list[int]:
+    return [int(item) for item in text.split(",") if item]
+
+
+def _size_list(text: str) -> list[tuple[int, int]]:
+    sizes = []
+    for item in text.split(","):
+        columns, _, lines = item.partition("x")
+        sizes.append((int(columns), int(lines)))
+    return sizes
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the benchmark suite.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m automata.bench",
+        description=(
+            "Measure engine throughput, frame-build time and the frame rate "
+            "of the interactive loop."
+        ),
+    )
+    sub = parser.add_subparsers(dest="command")
+
+    run = sub.add_parser("run", help="run the benchmarks (default)")
+    run.add_argument(
+        "-o", "--output", default=None, help="write the JSON results to this file"
+    )
+    run.add_argument(
+        "--engines",
+        default=",".join(ENGINES),
+        help="comma-separated engines to time",
+    )
+    run.add_argument(
+        "--widths",
+        type=_int_list,
+        default=DEFAULT_WIDTHS,
+        help="comma-separated row widths",
+    )
+    run.add_argument(
+        "--rules", type=_int_list, default=DEFAULT_RULES, help="comma-separated rules"
+    )
+    run.add_argument(
+        "--generations",
+        type=_int_list,
+        default=DEFAULT_GENERATIONS,
+        help="comma-separated generation counts",
+    )
+    run.add_argument(
+        "--sizes",
+        type=_size_list,
+        default=DEFAULT_FRAME_SIZES,
+        help='terminal sizes for frame builds, e.g. "80x24,200x60"',
+    )
+    run.add_argument(
+        "--zooms",
+        type=_int_list,
+        default=DEFAULT_ZOOMS,
+        help="viewport zoom levels for frame builds",
+    )
+    run.add_argument("--repeat", type=int, default=3, help="samples per case")
+    run.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="minimum seconds per sample",
+    )
+    run.add_argument(
+        "--baseline", default=None, help="compare against this results file"
+    )
+    run.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression",
+    )
+
+    loop = sub.add_parser("loop", help="drive the interactive loop on a fake terminal")
+    loop.add_argument(
+        "-o", "--output", default=None, help="write the JSON results to this file"
+    )
+    loop.add_argument(
+        "--sizes",
+        type=_size_list,
+        default=DEFAULT_LOOP_SIZES,
+        help='terminal sizes, e.g. "80x24,200x60"',
+    )
+    loop.add_argument(
+        "--modes",
+        default=",".join(MODES),
+        help="comma-separated simulation modes (auto, step)",
+    )
+    loop.add_argument(
+        "--menu",
+        choices=["closed", "open", "both"],
+        default="both",
+        help="run with the menu closed, open or both",
+    )
+    loop.add_argument(
+        "--duration",
+        type=float,
+        default=DEFAULT_DURATION,
+        help="virtual seconds of scripted input per scenario",
+    )
+    loop.add_argument("--repeat", type=int, default=3, help="runs per scenario")
+    loop.add_argument(
+        "--baseline", default=None, help="compare against this results file"
+    )
+    loop.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression",
+    )
+
+    cmp = sub.add_parser("compare", help="compare two results files")
+    cmp.add_argument("baseline", help="results file to compare against")
+    cmp.add_argument("current", help="results file to check")
+    cmp.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression",
+    )
+    return parser
+
+
+def _load(parser: argparse.ArgumentParser, path: str) -> dict:
+    """Read a results file, exiting with a usage error if it is unusable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as exc:
+        parser.error(f"cannot read {path}: {exc}")
+
+
+def _report(parser, baseline: dict, current: dict, threshold: float, file=None) -> int:
+    """Print a comparison and return 1 if anything regressed."""
+    try:
+        comparisons = compare(baseline, current, threshold)
+    except ValueError as exc:
+        parser.error(f"cannot compare: {exc}")
+    print(format_report(comparisons), file=file)
+    return 1 if any(c.regressed for c in comparisons) else 0
+
+
+def _progress(result: dict) -> None:
+    if result["name"] == "loop":
+        latency = result["latency_median"]
+        latency = f"{latency * 1e3:8.3f} ms" if latency is not None else "       - ms"
+        print(
+            f"{result['name']:<7} {format_params(result['params']):<50} "
+            f"{result['rate']:>10,.0f} frames/s "
+            f"{result['bytes_per_frame']:>8,.0f} B/frame {latency}",
+            file=sys.stderr,
+        )
+        return
+    unit = "cells/s" if result["name"] == "evolve" else "frames/s"
+    print(
+        f"{result['name']:<7} {format_params(result['params']):<50} "
+        f"{result['rate']:>14,.0f} {unit}",
+        file=sys.stderr,
+    )
+
+
+def _finish(
+    parser, results: dict, output: str | None, baseline, threshold: float
+) -> int:
+    """Write the results, then compare them against the baseline if any."""
+    text = json.dumps(results, indent=2)
+    if output is None:
+        print(text)
+    else:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    if baseline is not None:
+        # Keep standard output clean for the JSON
+        return _report(parser, baseline, results, threshold, sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point for the benchmark suite.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
+    Returns:
+        Exit code: 0, or 1 if a comparison found a regression (results
+        that cannot be compared are a usage error)
+    """
+    parser = build_parser()
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ("run", "loop", "compare", "-h", "--help"):
+        argv = ["run"] + argv
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        baseline = _load(parser, args.baseline)
+        current = _load(parser, args.current)
+        return _report(parser, baseline, current, args.threshold)
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    baseline = _load(parser, args.baseline) if args.baseline else None
+    if baseline is not None:
+        # Fail before spending minutes on a run that cannot be compared
+        try:
+            check_version(baseline, SUITE_VERSION)
+        except ValueError as exc:
+            parser.error(f"cannot compare: {exc}")
+
+    if args.command == "loop":
+        modes = [name for name in args.modes.split(",") if name]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            parser.error(f"unknown modes: {', '.join(sorted(unknown))}")
+        if args.duration <= 0:
+            parser.error("--duration must be positive")
+        menus = {"closed": [False], "open": [True], "both": [False, True]}[args.menu]
+        cases = loop_cases(args.sizes, modes, menus, args.duration)
+        try:
+            results = run_loop_suite(cases, args.repeat, _progress)
+        except KeyboardInterrupt:
+            return 130
+        return _finish(parser, results, args.output, baseline, args.threshold)
+
+    engines = [name for name in args.engines.split(",") if name]
+    unknown = set(engines) - set(ENGINES)
+    if unknown:
+        parser.error(f"unknown engines: {', '.join(sorted(unknown))}")
+
+    cases = list(engine_cases(engines, args.rules, args.widths, args.generations))
+    cases += list(frame_cases(args.sizes, args.zooms))
+    try:
+        results = run_suite(cases, args.repeat, args.min_time, _progress)
+    except KeyboardInterrupt:
+        return 130
+    return _finish(parser, results, args.output, baseline, args.threshold)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
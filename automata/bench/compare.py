@@ -0,0 +1,114 @@
+"""Compare benchmark results against a stored baseline."""
+
+from typing import NamedTuple
+
+
+class Comparison(NamedTuple):
+    """One case present in both the baseline and the current results."""
+
+    name: str
+    params: dict
+    baseline: float  # Seconds per call
+    current: float
+    change: float  # current / baseline - 1; positive means slower
+    regressed: bool
+
+
+def case_key(result: dict) -> tuple:
+    """
+    Identify a result by its case name and params.
+
+    Args:
+        result: Entry from the "results" list of run_suite()
+
+    Returns:
+        Hashable key
+    """
+    return result["name"], tuple(sorted(result["params"].items()))
+
+
+def check_version(results: dict, version) -> None:
+    """
+    Make sure results were measured by the given suite version.
+
+    Args:
+        results: Output of run_suite()
+        version: Expected metadata "suite_version"
+
+    Raises:
+        ValueError: If the versions differ, since the cases then measure
+            different work under the same names
+    """
+    found = results.get("metadata", {}).get("suite_version")
+    if found != version:
+        raise ValueError(
+            f"results are from suite version {found}, expected {version}; "
+            "rerun the baseline with this version"
+        )
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.1) -> list[Comparison]:
+    """
+    Match cases between two runs and flag slowdowns.
+
+    Args:
+        baseline: Output of run_suite() to compare against
+        current: Output of run_suite() to check
+        threshold: Relative slowdown that counts as a regression (0.1 is
+            10% slower)
+
+    Returns:
+        Comparisons for the cases both runs contain, in current order
+
+    Raises:
+        ValueError: If the suite versions differ or no case is in both runs
+    """
+    check_version(baseline, current.get("metadata", {}).get("suite_version"))
+    previous = {case_key(result): result for result in baseline["results"]}
+    comparisons = []
+    for result in current["results"]:
+        old = previous.get(case_key(result))
+        if old is None or not old["seconds"]:
+            continue
+        change = result["seconds"] / old["seconds"] - 1
+        comparisons.append(
+            Comparison(
+                result["name"],
+                result["params"],
+                old["seconds"],
+                result["seconds"],
+                change,
+                change > threshold,
+            )
+        )
+    if not comparisons:
+        raise ValueError("no case in the results matches the baseline")
+    return comparisons
+
+
+def format_params(params: dict) -> str:
+    """Format case params as "key=value" pairs."""
+    return " ".join(f"{key}={value}" for key, value in params.items())
+
+
+def format_report(comparisons: list[Comparison]) -> str:
+    """
+    Render comparisons as a table, regressions marked with "!".
+
+    Args:
+        comparisons: Output of compare()
+
+    Returns:
+        Multi-line report
+    """
+    lines = []
+    for c in comparisons:
+        mark = "!" if c.regressed else " "
+        lines.append(
+            f"{mark} {c.name:<7} {format_params(c.params):<50} "
+            f"{c.baseline * 1e3:>10.3f} ms -> {c.current * 1e3:>10.3f} ms "
+            f"{c.change:+7.1%}"
+        )
+    regressions = sum(c.regressed for c in comparisons)
+    lines.append(f"{regressions} of {len(comparisons)} cases regressed")
+    return "\n".join(lines)
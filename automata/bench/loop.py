@@ -0,0 +1,327 @@
+"""Frame-rate benchmarks of the interactive main loop on a fake terminal.
+
+The real main._run() loop is driven end to end (input handling, pacing,
+evolution, frame building and output) against a FakeScreen standing in for
+the curses window. Keys come from a script of timestamped events replayed
+on a virtual clock: waiting for a key or a deadline advances the clock
+instantly instead of sleeping, so every run of a scenario computes exactly
+the same generations and draws exactly the same frames, and only the time
+spent doing the work is measured.
+"""
+
+import curses
+import statistics
+import time
+from contextlib import contextmanager
+from typing import NamedTuple
+
+MODES = ["auto", "step"]
+DEFAULT_LOOP_SIZES = [(80, 24), (132, 43), (200, 60)]
+DEFAULT_DURATION = 20.0  # Virtual seconds per scenario
+KEY_INTERVAL = 0.25  # Virtual seconds between probe keys
+
+STEP_DELAY = 0.1  # main._run()'s initial step delay
+
+
+class EndOfScript(Exception):
+    """Raised by the fake screen once every scripted key has been read."""
+
+
+class ScriptedInput:
+    """
+    Replay timestamped keys against a virtual clock.
+
+    Reading with a timeout returns the next key if it is due by then,
+    moving the clock to its timestamp, or returns -1 with the clock moved
+    on by the timeout, exactly as a blocking getch() would have.
+    """
+
+    def __init__(self, events):
+        """
+        Args:
+            events: (seconds, key code) pairs in time order
+        """
+        self.events = list(events)
+        self.index = 0
+        self.now = 0.0
+
+    def clock(self) -> float:
+        """Current virtual time in seconds, for main._run(clock=...)."""
+        return self.now
+
+    def read(self, timeout_ms: int) -> int:
+        """
+        Return the next key due within the timeout.
+
+        Args:
+            timeout_ms: Milliseconds to wait (-1 waits for the next key)
+
+        Returns:
+            Key code, or -1 if none arrived in time
+
+        Raises:
+            EndOfScript: If every key has been read and the loop would
+                wait forever or past the last event
+        """
+        if self.index == len(self.events):
+            raise EndOfScript
+        at, key = self.events[self.index]
+        if timeout_ms < 0 or at <= self.now + timeout_ms / 1000:
+            self.now = max(self.now, at)
+            self.index += 1
+            return key
+        self.now += timeout_ms / 1000
+        return -1
+
+
+class FakeScreen:
+    """
+    Stand-in for the curses window that records output instead of drawing.
+
+    Bytes are counted as UTF-8 text passed to addstr(); a real terminal
+    also receives cursor movement and attribute sequences, so the count is
+    a lower bound that still tracks how much each frame rewrites.
+    """
+
+    def __init__(self, lines: int, columns: int, script: ScriptedInput):
+        """
+        Args:
+            lines: Terminal height
+            columns: Terminal width
+            script: Source of keys and of the virtual clock
+        """
+        self.size = (lines, columns)
+        self.script = script
+        self._timeout = -1
+        self.addstr_calls = 0
+        self.bytes = 0
+        self.scrolls = 0
+        self.erases = 0
+        self.refreshes = 0
+        self.keys = 0
+        self.latencies = []  # Seconds from reading a key to the next flush
+        self._key_time = None
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return self.size
+
+    def addstr(self, y: int, x: int, text: str) -> None:
+        self.addstr_calls += 1
+        self.bytes += len(text.encode())
+
+    def erase(self) -> None:
+        self.erases += 1
+
+    def scroll(self, lines: int = 1) -> None:
+        self.scrolls += 1
+
+    def idlok(self, flag: bool) -> None:
+        pass
+
+    def scrollok(self, flag: bool) -> None:
+        pass
+
+    def setscrreg(self, top: int, bottom: int) -> None:
+        pass
+
+    def nodelay(self, flag: bool) -> None:
+        pass
+
+    def keypad(self, flag: bool) -> None:
+        pass
+
+    def noutrefresh(self) -> None:
+        pass
+
+    def timeout(self, delay: int) -> None:
+        self._timeout = delay
+
+    def getch(self) -> int:
+        # A key that caused no redraw has no latency to report
+        self._key_time = None
+        key = self.script.read(self._timeout)
+        if key != -1:
+            self.keys += 1
+            self._key_time = time.perf_counter()
+        return key
+
+    def doupdate(self) -> None:
+        """Module-level curses.doupdate() replacement; one call per frame."""
+        self.refreshes += 1
+        if self._key_time is not None:
+            self.latencies.append(time.perf_counter() - self._key_time)
+            self._key_time = None
+
+
+@contextmanager
+def fake_terminal(screen: FakeScreen):
+    """
+    Route the module-level curses calls of the UI to a fake screen.
+
+    Args:
+        screen: FakeScreen receiving curses.doupdate()
+    """
+    saved = curses.doupdate, curses.curs_set
+    curses.doupdate = screen.doupdate
+    curses.curs_set = lambda visibility: 1
+    try:
+        yield screen
+    finally:
+        curses.doupdate, curses.curs_set = saved
+
+
+def scenario_events(mode: str, menu: bool, duration: float = DEFAULT_DURATION):
+    """
+    Build the key script for one scenario.
+
+    Auto mode starts with Enter and lets the scheduler step every
+    STEP_DELAY; step mode starts with Space and presses Space every
+    STEP_DELAY. With the menu open, ESC opens it and menu navigation keys
+    are the probes; otherwise auto mode probes by scrolling back one row
+    and forward again, and step mode's Space presses are the probes.
+
+    Args:
+        mode: One of MODES
+        menu: Open the menu after choosing the mode
+        duration: Virtual seconds until the script ends
+
+    Returns:
+        List of (seconds, key code) pairs
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {', '.join(MODES)}")
+    events = [(0.0, 10 if mode == "auto" else ord(" "))]
+    if menu:
+        events.append((0.0, 27))
+
+    if mode == "step" and not menu:
+        probes, interval = [ord(" ")], STEP_DELAY
+    elif menu:
+        probes, interval = [ord("j")], KEY_INTERVAL
+    else:
+        probes, interval = [curses.KEY_UP, curses.KEY_DOWN], KEY_INTERVAL
+
+    count = int(duration / interval)
+    for i in range(1, count + 1):
+        events.append((i * interval, probes[i % len(probes)]))
+    return events
+
+
+class LoopResult(NamedTuple):
+    """Measurements of one scripted run of the main loop."""
+
+    seconds: float  # Wall time of the whole run
+    frames: int  # Frames flushed to the screen
+    bytes: int
+    addstr_calls: int
+    scrolls: int
+    keys: int
+    latencies: list  # Seconds from each redrawing key to its frame
+
+
+def run_loop(lines: int, columns: int, events) -> LoopResult:
+    """
+    Run main._run() once against a fake terminal.
+
+    Args:
+        lines: Terminal height
+        columns: Terminal width
+        events: Key script, e.g. from scenario_events()
+
+    Returns:
+        LoopResult
+    """
+    from automata.main import _run
+
+    script = ScriptedInput(events)
+    screen = FakeScreen(lines, columns, script)
+    with fake_terminal(screen):
+        start = time.perf_counter()
+        try:
+            _run(screen, clock=script.clock)
+        except EndOfScript:
+            pass
+        seconds = time.perf_counter() - start
+    return LoopResult(
+        seconds,
+        screen.refreshes,
+        screen.bytes,
+        screen.addstr_calls,
+        screen.scrolls,
+        screen.keys,
+        screen.latencies,
+    )
+
+
+def loop_cases(sizes, modes, menus, duration: float = DEFAULT_DURATION):
+    """
+    Build the main-loop scenarios.
+
+    Args:
+        sizes: (columns, lines) terminal sizes
+        modes: Names from MODES
+        menus: Menu states to try, e.g. [False, True]
+        duration: Virtual seconds per scenario
+
+    Yields:
+        (params, events) pairs for run_loop_suite()
+    """
+    for columns, lines in sizes:
+        for mode in modes:
+            for menu in menus:
+                params = {
+                    "columns": columns,
+                    "lines": lines,
+                    "mode": mode,
+                    "menu": menu,
+                }
+                yield params, scenario_events(mode, menu, duration)
+
+
+def run_loop_suite(cases, repeat: int = 3, progress=None) -> dict:
+    """
+    Run every scenario, keeping the fastest of repeat runs.
+
+    Runs of one scenario draw identical frames, so only the timings differ
+    between them. Results use the same layout as suite.run_suite(), with
+    "seconds" per frame and "rate" in frames per second, so they can be
+    compared against a baseline the same way.
+
+    Args:
+        cases: Iterable of (params, events) pairs, e.g. from loop_cases()
+        repeat: Runs per scenario
+        progress: Optional callable receiving each result as it finishes
+
+    Returns:
+        Dict with "metadata" and a list of "results"
+    """
+    from automata.bench.suite import machine_metadata
+
+    results = []
+    for params, events in cases:
+        best = min(
+            (
+                run_loop(params["lines"], params["columns"], events)
+                for _ in range(repeat)
+            ),
+            key=lambda run: run.seconds,
+        )
+        frames = max(best.frames, 1)
+        latencies = sorted(best.latencies)
+        result = {
+            "name": "loop",
+            "params": params,
+            "seconds": best.seconds / frames,
+            "rate": best.frames / best.seconds if best.seconds > 0 else None,
+            "frames": best.frames,
+            "bytes_per_frame": best.bytes / frames,
+            "addstr_per_frame": best.addstr_calls / frames,
+            "scrolls": best.scrolls,
+            "keys": best.keys,
+            "latency_median": statistics.median(latencies) if latencies else None,
+            "latency_max": latencies[-1] if latencies else None,
+        }
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return {"metadata": machine_metadata(), "results": results}
@@ -0,0 +1,243 @@
+"""Benchmark cases, timing and machine metadata."""
+
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from automata.hashlife import HashlifeEngine
+from automata.packed import evolve_packed_row, unpack_row
+from automata.rules import decode_rule
+from automata.simulation import evolve_next_row, random_row, reset_simulation
+from automata.state import State
+
+# Bump when cases change in a way that makes old results incomparable
+SUITE_VERSION = 2
+
+DEFAULT_WIDTHS = [80, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_RULES = [0, 30, 90, 110, 184]
+DEFAULT_GENERATIONS = [100]
+DEFAULT_FRAME_SIZES = [(80, 24), (132, 43), (200, 60), (320, 100)]
+DEFAULT_ZOOMS = [0, 2]
+
+SEED = 12345
+
+
+def _run_reference(bits: int, rule_number: int, width: int, generations: int):
+    """Evolve with the per-cell list engine, one row at a time."""
+    transitions = decode_rule(rule_number)
+    grid = [unpack_row(bits, width), [0] * width]
+    for _ in range(generations):
+        evolve_next_row(grid, 0, transitions, width)
+        grid.reverse()
+
+
+def _run_packed(bits: int, rule_number: int, width: int, generations: int):
+    """Evolve with the bit-parallel packed engine."""
+    for _ in range(generations):
+        bits = evolve_packed_row(bits, rule_number, width)
+
+
+def _run_hashlife(bits: int, rule_number: int, width: int, generations: int):
+    """Jump straight to the last generation with a cold hashlife engine."""
+    HashlifeEngine(rule_number).advance(bits, width, generations)
+
+
+# name -> (function, largest width * generations worth running)
+ENGINES = {
+    "reference": (_run_reference, 2_000_000),
+    "packed": (_run_packed, 1_000_000_000),
+    "hashlife": (_run_hashlife, 20_000_000),
+}
+
+
+def _sample(func, loops: int, setup=None) -> float:
+    """Return the seconds loops calls of func take, excluding setup."""
+    if setup is None:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        return time.perf_counter() - start
+    elapsed = 0.0
+    for _ in range(loops):
+        setup()
+        start = time.perf_counter()
+        func()
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def measure(func, repeat: int = 3, min_time: float = 0.2, setup=None) -> float:
+    """
+    Time a callable, timeit-style.
+
+    The loop count is doubled until one sample takes at least min_time,
+    then the best of repeat samples is kept, which filters out scheduler
+    noise better than the mean.
+
+    Args:
+        func: Callable taking no arguments
+        repeat: Number of samples
+        min_time: Minimum duration of one sample in seconds
+        setup: Optional callable run before every call of func and left
+            out of the timing
+
+    Returns:
+        Best seconds per call
+    """
+    loops = 1
+    while True:
+        elapsed = _sample(func, loops, setup)
+        if elapsed >= min_time:
+            break
+        loops *= 2
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        best = min(best, _sample(func, loops, setup) / loops)
+    return best
+
+
+def engine_cases(engines, rules, widths, generations_list):
+    """
+    Build the engine throughput cases.
+
+    Every case evolves the same seeded random row; cases whose cell count
+    exceeds the engine's limit in ENGINES are skipped.
+
+    Args:
+        engines: Names from ENGINES
+        rules: Rule numbers
+        widths: Row widths
+        generations_list: Generation counts per call
+
+    Yields:
+        (name, params, callable, cells per call, None) tuples for
+        run_suite()
+    """
+    for engine in engines:
+        func, limit = ENGINES[engine]
+        for width in widths:
+            start = random_row(width, 0.5, random.Random(SEED))
+            for rule in rules:
+                for generations in generations_list:
+                    if width * generations > limit:
+                        continue
+                    params = {
+                        "engine": engine,
+                        "rule": rule,
+                        "width": width,
+                        "generations": generations,
+                    }
+
+                    def run(f=func, bits=start, r=rule, w=width, g=generations):
+                        f(bits, r, w, g)
+
+                    yield "evolve", params, run, width * generations, None
+
+
+def frame_cases(sizes, zooms):
+    """
+    Build the frame-build cases.
+
+    Each call builds a full frame, reusing the row cache the way the UI
+    does. The simulation is advanced one generation before every call, so
+    each frame has a new row to format, but only the frame build is timed.
+
+    Args:
+        sizes: (columns, lines) terminal sizes
+        zooms: Indexes into viewport.ZOOM_LEVELS
+
+    Yields:
+        (name, params, build, 1, advance) tuples for run_suite()
+    """
+    from automata.simulation import advance_simulation
+    from automata.ui.renderer import build_display_lines
+
+    for columns, lines in sizes:
+        for zoom in zooms:
+            state = State(width=columns * 4, height=lines * 8, view_zoom=zoom)
+            reset_simulation(state)
+            advance_simulation(state, state.height)
+            row_cache = {}
+
+            def build(state=state, columns=columns, lines=lines, cache=row_cache):
+                build_display_lines(state, columns, lines, cache)
+
+            def advance(state=state):
+                advance_simulation(state)
+
+            params = {"columns": columns, "lines": lines, "zoom": zoom}
+            yield "frame", params, build, 1, advance
+
+
+def machine_metadata() -> dict:
+    """
+    Describe the machine and software the suite ran on.
+
+    Returns:
+        JSON-serializable dict
+    """
+    metadata = {
+        "suite_version": SUITE_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        import numpy
+
+        metadata["numpy"] = numpy.__version__
+    except ImportError:
+        metadata["numpy"] = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=5,
+        ).stdout.strip()
+        metadata["commit"] = commit or None
+    except (OSError, subprocess.SubprocessError):
+        metadata["commit"] = None
+    return metadata
+
+
+def run_suite(cases, repeat: int = 3, min_time: float = 0.2, progress=None) -> dict:
+    """
+    Time every case.
+
+    Args:
+        cases: Iterable of (name, params, callable, work, setup) tuples,
+            where work is the number of cells (or frames) one call
+            processes and setup is None or an untimed callable run before
+            each call (see measure())
+        repeat: Samples per case
+        min_time: Minimum duration of one sample in seconds
+        progress: Optional callable receiving each result as it finishes
+
+    Returns:
+        Dict with "metadata" and a list of "results", each holding the
+        case name and params, best seconds per call and work per second
+    """
+    results = []
+    for name, params, func, work, setup in cases:
+        seconds = measure(func, repeat, min_time, setup)
+        result = {
+            "name": name,
+            "params": params,
+            "seconds": seconds,
+            "rate": work / seconds if seconds > 0 else None,
+        }
+        results.append(result)
+        if progress is not None:
+            progress(result)
+    return {"metadata": machine_metadata(), "results": results}
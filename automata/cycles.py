@@ -0,0 +1,202 @@
+"""Cycle detection and fast-forward for finite toroidal runs.
+
+A row of fixed width has finitely many states, so every toroidal run is
+eventually periodic: after a transient of ``transient`` generations it
+repeats with period ``period``. Once both are known, any generation can be
+mapped into the first transient + period rows by arithmetic.
+"""
+
+from typing import NamedTuple
+
+from automata.packed import evolve_packed_row
+
+
+class CycleDetector:
+    """
+    Incremental Brent cycle detection over a stream of packed rows.
+
+    Feed every generation after the initial row to observe(). Only one
+    saved row is kept, and each observation costs a single row comparison.
+    Once a repeat is found the transient is located by re-running the
+    simulation from the initial row, which costs transient + period steps.
+    If the rows turn out not to be that run (the re-run does not reach the
+    cycle by the generation the repeat was seen), detection gives up.
+    """
+
+    def __init__(self, initial: int, rule_number: int, width: int):
+        """
+        Args:
+            initial: Packed initial row (generation 0)
+            rule_number: Integer 0-255 representing the CA rule
+            width: Number of cells in the row
+        """
+        self.initial = initial
+        self.rule_number = rule_number
+        self.width = width
+        self.transient = None
+        self.period = None
+        self.failed = False  # The rows are not this rule's toroidal run
+        self._generation = 0  # Generation of the latest observation
+        self._tortoise = initial
+        self._power = 1
+        self._distance = 1  # Generations between tortoise and next row
+
+    @property
+    def found(self) -> bool:
+        """Whether the transient and period are known."""
+        return self.period is not None
+
+    def observe(self, bits: int) -> bool:
+        """
+        Consider the next generation.
+
+        Args:
+            bits: Packed row one generation after the previous observation
+
+        Returns:
+            True once the cycle has been found
+        """
+        if self.found:
+            return True
+        if self.failed:
+            return False
+
+        self._generation += 1
+        if bits == self._tortoise:
+            transient = self._find_transient(self._distance)
+            if transient is None:
+                self.failed = True
+                return False
+            self.period = self._distance
+            self.transient = transient
+            return True
+
+        if self._distance == self._power:
+            self._tortoise = bits
+            self._power *= 2
+            self._distance = 0
+        self._distance += 1
+        return False
+
+    def _step(self, bits: int) -> int:
+        """Evolve a row by one generation."""
+        return evolve_packed_row(bits, self.rule_number, self.width)
+
+    def _find_transient(self, period: int) -> int | None:
+        """
+        Return the first generation that belongs to the cycle.
+
+        The repeat was seen at the latest observation, so a genuine run
+        enters the cycle by then; searching further would never end if the
+        observed rows did not come from this rule on a torus.
+
+        Args:
+            period: Cycle length found by observe()
+
+        Returns:
+            Transient length, or None if the search passed the latest
+            observation without finding it
+        """
+        tortoise = self.initial
+        hare = self.initial
+        for _ in range(period):
+            hare = self._step(hare)
+
+        transient = 0
+        while tortoise != hare:
+            if transient + period >= self._generation:
+                return None
+            tortoise = self._step(tortoise)
+            hare = self._step(hare)
+            transient += 1
+        return transient
+
+    def reduce(self, t: int) -> int:
+        """
+        Map a generation number onto an equivalent one before the cycle repeats.
+
+        Args:
+            t: Any generation number
+
+        Returns:
+            Generation in [0, transient + period) with the same row
+        """
+        if not self.found or t < self.transient:
+            return t
+        return self.transient + (t - self.transient) % self.period
+
+    def row_at(self, t: int) -> int:
+        """
+        Return generation t, simulating at most transient + period steps.
+
+        Args:
+            t: Generation number
+
+        Returns:
+            Packed row
+        """
+        bits = self.initial
+        for _ in range(self.reduce(t)):
+            bits = self._step(bits)
+        return bits
+
+
+class RowQuery(NamedTuple):
+    """Result of row_at(): the row plus whatever cycle data was learned."""
+
+    row: int
+    transient: int | None
+    period: int | None
+
+
+def find_cycle(
+    bits: int, rule_number: int, width: int, max_steps: int | None = None
+) -> tuple[int, int] | None:
+    """
+    Find the transient length and period of a toroidal run.
+
+    Args:
+        bits: Packed initial row
+        rule_number: Integer 0-255 representing the CA rule
+        width: Number of cells in the row
+        max_steps: Give up after this many generations (None for no limit)
+
+    Returns:
+        (transient, period), or None if max_steps was reached first
+    """
+    detector = CycleDetector(bits, rule_number, width)
+    steps = 0
+    while max_steps is None or steps < max_steps:
+        bits = evolve_packed_row(bits, rule_number, width)
+        steps += 1
+        if detector.observe(bits):
+            return detector.transient, detector.period
+    return None
+
+
+def row_at(bits: int, rule_number: int, width: int, t: int) -> RowQuery:
+    """
+    Compute generation t, skipping whole cycles once one is detected.
+
+    The cost is O(min(t, transient + period)) generations, however large
+    t is.
+
+    Args:
+        bits: Packed initial row
+        rule_number: Integer 0-255 representing the CA rule
+        width: Number of cells in the row
+        t: Generation number
+
+    Returns:
+        RowQuery with the row and, if the cycle was reached, its transient
+        length and period
+    """
+    detector = CycleDetector(bits, rule_number, width)
+    for generation in range(1, t + 1):
+        bits = evolve_packed_row(bits, rule_number, width)
+        if detector.observe(bits):
+            # This generation is already inside the cycle
+            for _ in range((t - generation) % detector.period):
+                bits = evolve_packed_row(bits, rule_number, width)
+            return RowQuery(bits, detector.transient, detector.period)
+    return RowQuery(bits, None, None)
@@ -0,0 +1,60 @@
+"""Block entropy of packed rows, shared by the survey, ensemble and analysis.
+
+Kept free of the survey's process pool and the ensemble's batch machinery,
+so the live metrics can import it without slowing down startup.
+"""
+
+import math
+from collections import Counter
+
+from automata.packed import rotate_row, row_mask
+
+BLOCK_SIZE = 4  # Cells per block for block entropy
+
+
+def block_entropy(bits: int, width: int, block: int = BLOCK_SIZE) -> float:
+    """
+    Shannon entropy of the cyclic length-block windows of a row.
+
+    Args:
+        bits: Packed row
+        width: Number of cells in the row
+        block: Window length in cells
+
+    Returns:
+        Entropy in bits per cell, from 0 (uniform) to 1 (all blocks equally
+        likely)
+    """
+    block = min(block, width)
+    cells = format(bits, f"0{width}b")
+    wrapped = cells + cells[: block - 1]
+    counts = Counter(wrapped[i : i + block] for i in range(width))
+    entropy = sum(n / width * math.log2(width / n) for n in counts.values())
+    return entropy / block
+
+
+def packed_block_entropy(bits: int, width: int, block: int = BLOCK_SIZE) -> float:
+    """
+    Same as block_entropy(), computed with whole-row operations.
+
+    Each window pattern is counted by intersecting rotated copies of the
+    row (or their complements) and taking a popcount, so the cost grows
+    with 2**block rather than with the width in Python-level steps.
+
+    Args:
+        bits: Packed row
+        width: Number of cells in the row
+        block: Window length in cells
+
+    Returns:
+        Entropy in bits per cell
+    """
+    block = min(block, width)
+    mask = row_mask(width)
+    planes = [mask]
+    for shift in range(block):
+        cells = rotate_row(bits, width, shift)
+        planes = [p & q for p in planes for q in (cells, cells ^ mask)]
+    counts = (plane.bit_count() for plane in planes)
+    entropy = sum(n / width * math.log2(width / n) for n in counts if n)
+    return entropy / block
@@ -0,0 +1,491 @@
+"""Headless command line runner that streams generations without curses."""
+
+import argparse
+import io
+import os
+import sys
+
+from automata import analysis
+from automata.export import AGGREGATE_MODES, IMAGE_FORMATS, write_image
+from automata.kstate import BLOCK_MAX_RADIUS, initial_cells, iter_packed, iter_rows
+from automata.packed import iter_packed_rows, pack_row, row_to_bytes
+from automata.rules import outer_totalistic_rule, totalistic_rule, wolfram_rule
+from automata.simulation import initial_row
+from automata.storage import BOUNDARIES, SpacetimeReader, SpacetimeWriter, StorageError
+from automata.tape import is_quiescent, iter_tape_rows, tape_from_row
+
+OUTPUT_FORMATS = ["text", "packed"] + IMAGE_FORMATS
+
+# --rule-type -> function decoding a code into a rules.GeneralRule
+RULE_TYPES = {
+    "wolfram": wolfram_rule,
+    "totalistic": totalistic_rule,
+    "outer": outer_totalistic_rule,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the run subcommand.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m automata run",
+        description="Evolve an elementary cellular automaton and stream its rows.",
+    )
+    parser.add_argument(
+        "-r",
+        "--rule",
+        type=int,
+        default=30,
+        help="rule number (0-255 for elementary rules)",
+    )
+    parser.add_argument(
+        "-k", "--states", type=int, default=2, help="number of cell states"
+    )
+    parser.add_argument(
+        "--radius", type=int, default=1, help="neighborhood radius in cells"
+    )
+    parser.add_argument(
+        "-t",
+        "--rule-type",
+        choices=sorted(RULE_TYPES),
+        default="wolfram",
+        help="how --rule encodes the transition table",
+    )
+    parser.add_argument("-w", "--width", type=int, default=80, help="number of cells")
+    parser.add_argument(
+        "-g",
+        "--generations",
+        type=int,
+        default=159,
+        help="generations to compute after the initial row",
+    )
+    parser.add_argument(
+        "-i",
+        "--init",
+        default="center",
+        help='initial row: "center", "random", or a 0/1 pattern placed at the center',
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed for --init random")
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=0.5,
+        help="live cell fraction for --init random",
+    )
+    parser.add_argument(
+        "-b",
+        "--boundary",
+        choices=BOUNDARIES,
+        default="torus",
+        help="wrap the row around (torus) or evolve an unbounded line seen "
+        "through a --width window (infinite; even rules only)",
+    )
+    parser.add_argument(
+        "--record", default=None, help="also write the rows to a spacetime file"
+    )
+    add_output_arguments(parser)
+    return parser
+
+
+def add_output_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the options shared by every row-streaming subcommand.
+
+    Args:
+        parser: Parser to extend
+    """
+    parser.add_argument(
+        "-f", "--format", choices=OUTPUT_FORMATS, default="text", help="output format"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file (default: standard output)"
+    )
+    parser.add_argument(
+        "--alive", default="#", help="text format character for live cells"
+    )
+    parser.add_argument(
+        "--dead", default=".", help="text format character for dead cells"
+    )
+    parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="image formats: cells per pixel along each axis",
+    )
+    parser.add_argument(
+        "--aggregate",
+        choices=AGGREGATE_MODES,
+        default="any",
+        help="image formats: downscaled pixel is black if any cell is alive, "
+        "or gray by live-cell density",
+    )
+    parser.add_argument(
+        "-m",
+        "--metrics",
+        default=None,
+        help="write these per-generation metrics instead of rows, e.g. "
+        f'"density,entropy" (from {", ".join(analysis.METRICS)}); '
+        "not combined with --format, --scale or --aggregate",
+    )
+    parser.add_argument(
+        "--metrics-format",
+        choices=analysis.OUTPUT_FORMATS,
+        default="csv",
+        help="format of the --metrics lines",
+    )
+
+
+def validate_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Reject option values the engine cannot run with.
+
+    Args:
+        parser: Parser used to report errors (exits on failure)
+        args: Parsed arguments
+    """
+    if is_elementary(args) and not 0 <= args.rule <= 255:
+        parser.error("--rule must be between 0 and 255")
+    if args.width < 1:
+        parser.error("--width must be at least 1")
+    if args.generations < 0:
+        parser.error("--generations must not be negative")
+    if not 0.0 <= args.density <= 1.0:
+        parser.error("--density must be between 0 and 1")
+    if args.boundary == "infinite":
+        if not is_elementary(args):
+            parser.error("--boundary infinite only supports elementary rules")
+        if not is_quiescent(args.rule):
+            parser.error("--boundary infinite needs an even rule (000 -> 0)")
+    validate_output_args(parser, args)
+    if args.metrics is not None:
+        if args.states > 2:
+            parser.error("--metrics only supports 2-state rules")
+        if "damage" in args.metrics and (
+            not is_elementary(args) or args.boundary == "infinite"
+        ):
+            parser.error("damage needs an elementary rule on a torus")
+
+
+def is_elementary(args: argparse.Namespace) -> bool:
+    """Whether the run options select an elementary (2-state, radius 1) rule."""
+    return args.states == 2 and args.radius == 1 and args.rule_type == "wolfram"
+
+
+def general_rows(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """
+    Build the row stream for a k-state or radius-r rule.
+
+    Args:
+        parser: Parser used to report errors (exits on failure)
+        args: Parsed run arguments
+
+    Returns:
+        Iterable of packed rows for binary rules that fit the block table
+        engine, otherwise of lists of cell states
+    """
+    if args.record is not None:
+        parser.error("--record only supports elementary rules")
+    try:
+        rule = RULE_TYPES[args.rule_type](args.rule, args.states, args.radius)
+        cells = initial_cells(
+            args.width, args.states, args.init, args.seed, args.density
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if rule.states == 2 and rule.radius <= BLOCK_MAX_RADIUS:
+        return iter_packed(pack_row(cells), rule, args.width, args.generations)
+    if rule.states == 2:
+        return map(pack_row, iter_rows(cells, rule, args.generations))
+    if args.format != "text":
+        parser.error("rules with more than 2 states only support text output")
+    return iter_rows(cells, rule, args.generations)
+
+
+def validate_output_args(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> None:
+    """
+    Reject invalid values for the options from add_output_arguments().
+
+    Args:
+        parser: Parser used to report errors (exits on failure)
+        args: Parsed arguments
+    """
+    if len(args.alive) != 1 or len(args.dead) != 1:
+        parser.error("--alive and --dead must be single characters")
+    if args.metrics is not None:
+        if args.format != "text":
+            parser.error("--metrics writes text; use --metrics-format, not --format")
+        if args.scale != 1 or args.aggregate != "any":
+            parser.error("--scale and --aggregate do not apply to --metrics")
+    if args.scale < 1:
+        parser.error("--scale must be at least 1")
+    if args.scale > 1 and args.format not in IMAGE_FORMATS:
+        parser.error("--scale only applies to image formats")
+    if args.aggregate == "density" and args.scale > 1:
+        if args.format == "pbm":
+            parser.error("pbm is 1 bit deep; use pgm or png with --aggregate density")
+        if args.scale > 255:
+            parser.error("--aggregate density supports --scale up to 255")
+    if args.metrics is not None:
+        try:
+            args.metrics = analysis.parse_metrics(args.metrics)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+
+def write_rows(
+    out,
+    rows,
+    width: int,
+    height: int,
+    fmt: str,
+    alive: str = "#",
+    dead: str = ".",
+    scale: int = 1,
+    aggregate: str = "any",
+) -> None:
+    """
+    Stream packed rows to a binary file object as they are produced.
+
+    Args:
+        out: Writable binary file object
+        rows: Iterable of packed rows
+        width: Number of cells per row
+        height: Total number of rows (needed for image headers)
+        fmt: One of OUTPUT_FORMATS
+        alive: Text format character for live cells
+        dead: Text format character for dead cells
+        scale: Image formats: cells per pixel along each axis
+        aggregate: Image formats: one of export.AGGREGATE_MODES
+    """
+    if fmt == "text":
+        table = str.maketrans("01", dead + alive)
+        for bits in rows:
+            line = format(bits, f"0{width}b").translate(table)
+            out.write(line.encode() + b"\n")
+    elif fmt in IMAGE_FORMATS:
+        write_image(out, rows, width, height, fmt, scale, aggregate)
+    else:
+        for bits in rows:
+            out.write(row_to_bytes(bits, width))
+
+
+def write_state_rows(out, rows, alive: str = "#", dead: str = ".") -> None:
+    """
+    Stream rows of cell states as text, one character per cell.
+
+    States 0 and 1 use the dead and alive characters; higher states are
+    written as base-36 digits.
+
+    Args:
+        out: Writable binary file object
+        rows: Iterable of lists of cell states
+        alive: Character for state 1
+        dead: Character for state 0
+    """
+    symbols = dead + alive + "23456789abcdefghijklmnopqrstuvwxyz"
+    for cells in rows:
+        out.write("".join([symbols[cell] for cell in cells]).encode() + b"\n")
+
+
+def recorded(rows, writer):
+    """
+    Pass rows through while appending each one to a spacetime file.
+
+    Args:
+        rows: Iterable of packed rows
+        writer: storage.SpacetimeWriter to append to
+
+    Yields:
+        The rows, unchanged
+    """
+    for bits in rows:
+        writer.append(bits)
+        yield bits
+
+
+def emit(
+    args: argparse.Namespace,
+    rows,
+    width: int,
+    height: int,
+    states: int = 2,
+    rule_number: int | None = None,
+    start: int = 0,
+) -> int:
+    """
+    Stream rows, or their metrics, to the destination selected on the
+    command line.
+
+    Args:
+        args: Parsed arguments with the options from add_output_arguments()
+        rows: Iterable of packed rows
+        width: Number of cells per row
+        height: Total number of rows
+        states: Number of cell states; above 2, rows are lists of states
+            written as text
+        rule_number: Elementary rule the rows follow (for the damage metric)
+        start: Generation number of the first row
+
+    Returns:
+        Exit code
+    """
+
+    def write(out):
+        if args.metrics is not None:
+            text = io.TextIOWrapper(out, encoding="utf-8", newline="")
+            stream = analysis.analyze(rows, width, args.metrics, rule_number, start)
+            analysis.write_metrics(text, stream, args.metrics, args.metrics_format)
+            text.flush()
+            text.detach()
+        elif states > 2:
+            write_state_rows(out, rows, args.alive, args.dead)
+        else:
+            write_rows(
+                out,
+                rows,
+                width,
+                height,
+                args.format,
+                args.alive,
+                args.dead,
+                args.scale,
+                args.aggregate,
+            )
+
+    try:
+        if args.output == "-":
+            write(sys.stdout.buffer)
+            sys.stdout.flush()
+        else:
+            with open(args.output, "wb") as out:
+                write(out)
+    except BrokenPipeError:
+        # Downstream closed early (e.g. piped into head); silence the
+        # flush at interpreter exit as recommended by the signal docs
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    except KeyboardInterrupt:
+        return 130
+
+    return 0
+
+
+def describe_init(args: argparse.Namespace) -> str:
+    """
+    Describe the initial condition for a spacetime file header.
+
+    Args:
+        args: Parsed run arguments
+
+    Returns:
+        Human-readable description such as "random seed=7 density=0.5"
+    """
+    if args.init == "random":
+        return f"random seed={args.seed} density={args.density}"
+    return args.init
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point for the run subcommand.
+
+    Args:
+        argv: Command line arguments after "run" (defaults to sys.argv)
+
+    Returns:
+        Exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    validate_args(parser, args)
+
+    height = args.generations + 1
+    if is_elementary(args):
+        try:
+            start = initial_row(args.width, args.init, args.seed, args.density)
+        except ValueError as exc:
+            parser.error(str(exc))
+        if args.boundary == "infinite":
+            tape = tape_from_row(start, args.width)
+            rows = iter_tape_rows(tape, args.rule, 0, args.width, args.generations)
+        else:
+            rows = iter_packed_rows(start, args.rule, args.width, args.generations)
+    else:
+        rows = general_rows(parser, args)
+        if args.states > 2:
+            return emit(args, rows, args.width, height, args.states)
+
+    rule_number = args.rule if is_elementary(args) else None
+    if args.record is None:
+        return emit(args, rows, args.width, height, rule_number=rule_number)
+
+    with SpacetimeWriter(
+        args.record, args.rule, args.width, args.boundary, describe_init(args)
+    ) as writer:
+        return emit(
+            args, recorded(rows, writer), args.width, height, rule_number=rule_number
+        )
+
+
+def build_replay_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the replay subcommand.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m automata replay",
+        description="Stream rows from a spacetime file recorded with run --record.",
+    )
+    parser.add_argument("path", help="spacetime file to read")
+    parser.add_argument("--start", type=int, default=0, help="first generation")
+    parser.add_argument(
+        "--stop", type=int, default=None, help="one past the last generation"
+    )
+    add_output_arguments(parser)
+    return parser
+
+
+def replay_main(argv: list[str] | None = None) -> int:
+    """
+    Entry point for the replay subcommand.
+
+    Args:
+        argv: Command line arguments after "replay" (defaults to sys.argv)
+
+    Returns:
+        Exit code
+    """
+    parser = build_replay_parser()
+    args = parser.parse_args(argv)
+    validate_output_args(parser, args)
+
+    try:
+        reader = SpacetimeReader(args.path)
+    except (OSError, StorageError) as exc:
+        parser.error(str(exc))
+
+    if args.metrics is not None and "damage" in args.metrics:
+        if reader.boundary != "torus":
+            parser.error("damage needs a file recorded on a torus")
+
+    with reader:
+        start, stop, _ = slice(args.start, args.stop).indices(len(reader))
+        stop = max(start, stop)
+        rows = (reader.row(t) for t in range(start, stop))
+        return emit(
+            args,
+            rows,
+            reader.width,
+            stop - start,
+            rule_number=reader.rule_number,
+            start=start,
+        )
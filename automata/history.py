@@ -0,0 +1,243 @@
+"""Random access to any generation of a long run without storing every row.
+
+A History is fed each new row as the simulation produces it and keeps a
+bit-packed checkpoint every ``interval`` generations. Row t is rebuilt by
+evolving forward from the nearest checkpoint at or before t, so a query
+costs at most interval - 1 steps. Rebuilt rows go into a least-recently
+used cache bounded in bytes; since the whole stretch from the checkpoint
+to t is cached, scrolling back one row at a time mostly hits it. A window
+of consecutive rows is read with rows(), which evolves forward once from
+the first row's checkpoint instead of rebuilding every row separately.
+
+With no fixed interval the History tunes itself to a memory budget: it
+starts by checkpointing every generation and, whenever the checkpoints
+outgrow the budget, doubles the interval and drops every other one. Memory
+then stays within the budget however long the run, and the interval (the
+worst-case recompute cost) grows only with run length divided by budget.
+"""
+
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from automata.packed import evolve_packed_row, row_nbytes
+
+DEFAULT_BUDGET = 16 << 20  # Bytes of checkpoints when auto-tuning
+DEFAULT_CACHE_BYTES = 4 << 20  # Bytes of reconstructed rows kept
+
+
+class HistoryStats(NamedTuple):
+    """Memory use and query costs of a History."""
+
+    interval: int  # Generations between checkpoints
+    checkpoints: int
+    checkpoint_bytes: int
+    cached_rows: int
+    cache_bytes: int
+    hits: int
+    misses: int
+    recomputed: int  # Generations evolved to answer misses
+    recompute_seconds: float
+
+
+class History:
+    """Checkpointed, cached random access to the rows of one run."""
+
+    def __init__(
+        self,
+        initial: int,
+        rule_number: int,
+        width: int,
+        start: int = 0,
+        interval: int | None = None,
+        budget: int = DEFAULT_BUDGET,
+        cache_bytes: int = DEFAULT_CACHE_BYTES,
+    ):
+        """
+        Args:
+            initial: Packed row of generation start
+            rule_number: Integer 0-255 representing the CA rule
+            width: Number of cells in the row
+            start: Generation number of initial
+            interval: Generations between checkpoints, or None to tune it
+                to budget
+            budget: Checkpoint memory limit in bytes when interval is None
+            cache_bytes: Memory limit of the reconstructed-row cache
+        """
+        if interval is not None and interval < 1:
+            raise ValueError("interval must be at least 1")
+        self.rule_number = rule_number
+        self.width = width
+        self.start = start
+        self.auto = interval is None
+        self.interval = interval or 1
+        self.budget = budget
+        self.row_bytes = row_nbytes(width)
+        self._checkpoints = [initial]  # Generation start + i * interval
+        self._cache = OrderedDict()
+        self._cache_limit = max(1, cache_bytes // max(self.row_bytes, 1))
+        self.latest = initial
+        self.generation = start  # Generation of latest
+        self.hits = 0
+        self.misses = 0
+        self.recomputed = 0
+        self.recompute_seconds = 0.0
+
+    def __len__(self) -> int:
+        """Number of generations recorded, the initial row included."""
+        return self.generation - self.start + 1
+
+    def record(self, bits: int) -> None:
+        """
+        Add the next generation.
+
+        Args:
+            bits: Packed row one generation after the previous one
+        """
+        self.generation += 1
+        self.latest = bits
+        if (self.generation - self.start) % self.interval:
+            return
+        self._checkpoints.append(bits)
+        if self.auto and len(self._checkpoints) * self.row_bytes > self.budget:
+            # Keep generations that are multiples of the doubled interval
+            self._checkpoints = self._checkpoints[::2]
+            self.interval *= 2
+
+    def row(self, t: int) -> int:
+        """
+        Return generation t.
+
+        Generations after the latest recorded one are evolved forward from
+        it (and not cached).
+
+        Args:
+            t: Generation number, at least start
+
+        Returns:
+            Packed row
+
+        Raises:
+            IndexError: If t precedes the first recorded generation
+        """
+        if t < self.start:
+            raise IndexError(f"generation {t} precedes the history")
+        if t == self.generation:
+            return self.latest
+
+        bits = self._cache.get(t)
+        if bits is not None:
+            self._cache.move_to_end(t)
+            self.hits += 1
+            return bits
+        self.misses += 1
+
+        began = time.perf_counter()
+        if t > self.generation:
+            bits = self.latest
+            for _ in range(t - self.generation):
+                bits = evolve_packed_row(bits, self.rule_number, self.width)
+            self.recomputed += t - self.generation
+        else:
+            index = (t - self.start) // self.interval
+            generation = self.start + index * self.interval
+            bits = self._checkpoints[index]
+            self._remember(generation, bits)
+            while generation < t:
+                bits = evolve_packed_row(bits, self.rule_number, self.width)
+                generation += 1
+                self._remember(generation, bits)
+            self.recomputed += t - (self.start + index * self.interval)
+        self.recompute_seconds += time.perf_counter() - began
+        return bits
+
+    def rows(self, start: int, stop: int) -> list[int]:
+        """
+        Return generations start to stop - 1.
+
+        Only the first row not already cached is rebuilt from its
+        checkpoint; every later one is evolved from the row before it, so
+        a window costs at most interval - 1 + (stop - start) steps.
+
+        Args:
+            start: First generation, at least the history's start
+            stop: One past the last generation
+
+        Returns:
+            List of packed rows
+
+        Raises:
+            IndexError: If start precedes the first recorded generation
+        """
+        rows = []
+        bits = None
+        for t in range(start, stop):
+            if bits is None or t == self.generation or t in self._cache:
+                bits = self.row(t)
+            else:
+                self.misses += 1
+                began = time.perf_counter()
+                bits = evolve_packed_row(bits, self.rule_number, self.width)
+                self.recompute_seconds += time.perf_counter() - began
+                self.recomputed += 1
+                if t < self.generation:
+                    self._remember(t, bits)
+            rows.append(bits)
+        return rows
+
+    def cell(self, x: int, t: int) -> int:
+        """
+        Return one cell of generation t.
+
+        Args:
+            x: Column, 0 to width - 1
+            t: Generation number
+
+        Returns:
+            0 or 1
+        """
+        if not 0 <= x < self.width:
+            raise IndexError(f"column {x} is outside the row")
+        return (self.row(t) >> (self.width - 1 - x)) & 1
+
+    def _remember(self, generation: int, bits: int) -> None:
+        """Cache a reconstructed row, evicting the least recently used."""
+        self._cache[generation] = bits
+        self._cache.move_to_end(generation)
+        if len(self._cache) > self._cache_limit:
+            self._cache.popitem(last=False)
+
+    def stats(self) -> HistoryStats:
+        """
+        Report memory use and query costs.
+
+        Returns:
+            HistoryStats
+        """
+        return HistoryStats(
+            self.interval,
+            len(self._checkpoints),
+            len(self._checkpoints) * self.row_bytes,
+            len(self._cache),
+            len(self._cache) * self.row_bytes,
+            self.hits,
+            self.misses,
+            self.recomputed,
+            self.recompute_seconds,
+        )
+
+    def summary(self) -> str:
+        """
+        Format the stats for the status line.
+
+        Returns:
+            Short one-line summary
+        """
+        stats = self.stats()
+        queries = stats.hits + stats.misses
+        hit_rate = f"{100 * stats.hits / queries:.0f}%" if queries else "-"
+        return (
+            f"ckpt {stats.checkpoints}x{stats.interval} "
+            f"{stats.checkpoint_bytes / 1024:.0f}K "
+            f"hit {hit_rate} recompute {stats.recomputed}"
+        )
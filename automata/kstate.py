@@ -0,0 +1,212 @@
+"""Table-driven engine for k-state, radius-r rules (see rules.GeneralRule).
+
+Rows of any rule are lists of cell states. The neighborhood index is
+updated incrementally as the window slides: multiply by k, drop the digit
+that left the window, add the one that entered. That costs one table lookup
+per cell whatever the radius.
+
+Binary rules with radius up to BLOCK_MAX_RADIUS can also run on packed
+rows. A block table maps the 8 + 2r cells around each byte of the row to
+that byte's 8 next cells, so a generation costs one lookup per 8 cells.
+"""
+
+from functools import lru_cache
+
+from automata.packed import row_mask
+from automata.rules import GeneralRule
+
+BLOCK_CELLS = 8  # Output cells per block table lookup
+
+# Block tables have 2 ** (8 + 2r) entries; beyond this, use evolve_row()
+BLOCK_MAX_RADIUS = 4
+
+
+def _wrapped(cells: list[int], radius: int) -> list[int]:
+    """Return cells with radius cells of toroidal context on each side."""
+    width = len(cells)
+    left = [cells[i % width] for i in range(-radius, 0)]
+    right = [cells[i % width] for i in range(radius)]
+    return left + cells + right
+
+
+def evolve_row(cells: list[int], rule: GeneralRule) -> list[int]:
+    """
+    Compute the next generation of a toroidal row.
+
+    Args:
+        cells: Cell states 0 to k - 1
+        rule: Rule to apply
+
+    Returns:
+        Next row as a new list
+    """
+    if not cells:
+        return []
+    k = rule.states
+    size = len(rule.table)
+    table = rule.table
+    extended = _wrapped(cells, rule.radius)
+
+    # Prime the index with all but the last cell of the first window
+    index = 0
+    for cell in extended[: 2 * rule.radius]:
+        index = index * k + cell
+
+    next_row = []
+    for cell in extended[2 * rule.radius :]:
+        index = (index * k + cell) % size
+        next_row.append(table[index])
+    return next_row
+
+
+def iter_rows(cells: list[int], rule: GeneralRule, generations: int):
+    """
+    Yield a row and its next generations.
+
+    Args:
+        cells: Initial cell states
+        rule: Rule to apply
+        generations: Number of generations after the initial row
+
+    Yields:
+        generations + 1 rows, starting with the initial row
+    """
+    yield cells
+    for _ in range(generations):
+        cells = evolve_row(cells, rule)
+        yield cells
+
+
+@lru_cache(maxsize=16)
+def block_table(rule: GeneralRule) -> tuple[int, ...]:
+    """
+    Build the lookup table from 8 + 2r input cells to 8 output cells.
+
+    Args:
+        rule: Binary rule with radius at most BLOCK_MAX_RADIUS
+
+    Returns:
+        Tuple indexed by the packed input cells (leftmost in the high bit)
+        holding the packed next cells of the middle 8
+
+    Raises:
+        ValueError: If the rule is not binary or its radius is too large
+    """
+    if rule.states != 2:
+        raise ValueError("block tables need a 2-state rule")
+    if rule.radius > BLOCK_MAX_RADIUS:
+        raise ValueError(f"block tables need radius at most {BLOCK_MAX_RADIUS}")
+
+    span = rule.span
+    input_cells = BLOCK_CELLS + 2 * rule.radius
+    span_mask = (1 << span) - 1
+    table = rule.table
+    blocks = []
+    for window in range(1 << input_cells):
+        out = 0
+        for shift in range(BLOCK_CELLS - 1, -1, -1):
+            out = (out << 1) | table[(window >> shift) & span_mask]
+        blocks.append(out)
+    return tuple(blocks)
+
+
+def evolve_packed(bits: int, rule: GeneralRule, width: int) -> int:
+    """
+    Compute the next generation of a packed toroidal row of a binary rule.
+
+    Args:
+        bits: Packed row (see automata.packed)
+        rule: Binary rule with radius at most BLOCK_MAX_RADIUS
+        width: Number of cells in the row
+
+    Returns:
+        Packed next row
+    """
+    if width <= 0:
+        return 0
+    table = block_table(rule)
+    radius = rule.radius
+
+    # One byte of wrapped context on each side keeps every block aligned
+    if width >= BLOCK_CELLS:
+        head = bits >> (width - BLOCK_CELLS)
+        tail = bits & 0xFF
+    else:
+        cells = format(bits, f"0{width}b") * (BLOCK_CELLS // width + 1)
+        head = int(cells[:BLOCK_CELLS], 2)
+        tail = int(cells[-BLOCK_CELLS:], 2)
+    blocks = -(-width // BLOCK_CELLS)
+    pad = blocks * BLOCK_CELLS - width
+    extended = (((tail << width) | bits) << BLOCK_CELLS | head) << pad
+    data = extended.to_bytes(blocks + 2, "big")
+
+    shift = BLOCK_CELLS - radius
+    mask = (1 << (BLOCK_CELLS + 2 * radius)) - 1
+    out = bytes(
+        table[(((a << 16) | (b << 8) | c) >> shift) & mask]
+        for a, b, c in zip(data, data[1:], data[2:])
+    )
+    return (int.from_bytes(out, "big") >> pad) & row_mask(width)
+
+
+def iter_packed(bits: int, rule: GeneralRule, width: int, generations: int):
+    """
+    Yield a packed row and its next generations.
+
+    Args:
+        bits: Packed initial row
+        rule: Binary rule with radius at most BLOCK_MAX_RADIUS
+        width: Number of cells in the row
+        generations: Number of generations after the initial row
+
+    Yields:
+        generations + 1 packed rows, starting with the initial row
+    """
+    yield bits
+    for _ in range(generations):
+        bits = evolve_packed(bits, rule, width)
+        yield bits
+
+
+def initial_cells(
+    width: int,
+    states: int,
+    pattern: str = "center",
+    seed: int | None = None,
+    density: float = 0.5,
+) -> list[int]:
+    """
+    Build an initial row of cell states.
+
+    Args:
+        width: Number of cells
+        states: Number of cell states k
+        pattern: "center" for a single cell in state 1, "random" for random
+            cells, or a string of digits below k placed at the center
+        seed: Random seed used by the "random" pattern
+        density: Fraction of non-zero cells for the "random" pattern; each
+            gets a uniformly random non-zero state
+
+    Returns:
+        List of width cell states
+    """
+    import random
+
+    cells = [0] * width
+    if pattern == "center":
+        if width > 0:
+            cells[width // 2] = 1
+        return cells
+    if pattern == "random":
+        rng = random.Random(seed)
+        return [
+            rng.randrange(1, states) if rng.random() < density else 0
+            for _ in range(width)
+        ]
+
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"[:states]
+    if not pattern or set(pattern) - set(digits) or len(pattern) > width:
+        raise ValueError(f"invalid initial pattern: {pattern!r}")
+    start = (width - len(pattern)) // 2
+    cells[start : start + len(pattern)] = [digits.index(c) for c in pattern]
+    return cells
@@ -0,0 +1,410 @@
+"""Sparse engine for two-dimensional Life-like automata.
+
+Live cells are stored in 64x64 tiles keyed by tile coordinates; a tile is
+one 4096-bit int with row 0 in the top 64 bits and column 0 in the high bit
+of each row, the same left-to-right order as automata.packed. Empty tiles
+are not stored at all.
+
+A tile can only change if it or one of its eight neighbors changed in the
+previous generation, so each step only visits those tiles. Inside a tile
+the update is bit-parallel: the tile and a one-cell border from its
+neighbors are laid out as a single 66x66 int, the eight neighbor planes are
+shifted copies of it, and a small adder network counts neighbors for every
+cell at once. Time and memory therefore scale with the active area, not
+with the bounding box of the pattern.
+"""
+
+TILE = 64
+TILE_MASK = (1 << TILE) - 1
+
+_STRIDE = TILE + 2  # Row length of the bordered tile
+
+# Common rules by name
+PRESETS = {
+    "life": "B3/S23",
+    "highlife": "B36/S23",
+    "seeds": "B2/S",
+    "daynight": "B3678/S34678",
+    "lifewithoutdeath": "B3/S012345678",
+    "maze": "B3/S12345",
+}
+
+# Cells of a tile that touch each neighbor: (dx, dy) -> mask
+_EDGES = {
+    (-1, 0): sum(1 << (row * TILE) for row in range(TILE)),  # Last column
+    (1, 0): sum(1 << (row * TILE + TILE - 1) for row in range(TILE)),  # First
+    (0, -1): TILE_MASK,  # Last row
+    (0, 1): TILE_MASK << ((TILE - 1) * TILE),  # First row
+    (-1, -1): 1,
+    (1, -1): 1 << (TILE - 1),
+    (-1, 1): 1 << ((TILE - 1) * TILE),
+    (1, 1): 1 << (TILE * TILE - 1),
+}
+
+_NEIGHBORS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy]
+
+
+def parse_rule(text: str) -> tuple[frozenset, frozenset]:
+    """
+    Parse a Life-like rule in B/S notation, or a preset name.
+
+    Args:
+        text: Rule such as "B3/S23" or "B36/S23", or a key of PRESETS
+
+    Returns:
+        (birth counts, survival counts)
+
+    Raises:
+        ValueError: If the rule is malformed or has births on 0 neighbors,
+            which would fill the infinite plane
+    """
+    spec = PRESETS.get(text.strip().lower(), text).strip().upper()
+    parts = spec.split("/")
+    if len(parts) != 2:
+        raise ValueError(f"invalid Life rule: {text!r}")
+    counts = {}
+    for part in parts:
+        if not part or part[0] not in "BS" or part[0] in counts:
+            raise ValueError(f"invalid Life rule: {text!r}")
+        digits = part[1:]
+        if not all(c in "012345678" for c in digits):
+            raise ValueError(f"invalid Life rule: {text!r}")
+        counts[part[0]] = frozenset(int(c) for c in digits)
+    if 0 in counts["B"]:
+        raise ValueError("rules with birth on 0 neighbors are not supported")
+    return counts["B"], counts["S"]
+
+
+def format_rule(birth, survive) -> str:
+    """
+    Format birth and survival counts in B/S notation.
+
+    Args:
+        birth: Neighbor counts that bring a dead cell to life
+        survive: Neighbor counts that keep a live cell alive
+
+    Returns:
+        Rule string such as "B3/S23"
+    """
+    return (
+        "B"
+        + "".join(map(str, sorted(birth)))
+        + "/S"
+        + "".join(map(str, sorted(survive)))
+    )
+
+
+def _tile_row(tile: int, row: int) -> int:
+    """Return one 64-cell row of a tile."""
+    return (tile >> ((TILE - 1 - row) * TILE)) & TILE_MASK
+
+
+def _half_add(a: int, b: int) -> tuple[int, int]:
+    return a ^ b, a & b
+
+
+def _full_add(a: int, b: int, c: int) -> tuple[int, int]:
+    s = a ^ b
+    return s ^ c, (a & b) | (s & c)
+
+
+class LifeGrid:
+    """
+    Unbounded plane of cells evolving under a Life-like rule.
+
+    Coordinates may be negative; x grows to the right and y downwards.
+    """
+
+    def __init__(self, rule: str = "B3/S23"):
+        """
+        Args:
+            rule: Rule in B/S notation or a PRESETS name
+
+        Raises:
+            ValueError: If the rule cannot be parsed
+        """
+        self.birth, self.survive = parse_rule(rule)
+        self.rule = format_rule(self.birth, self.survive)
+        self.tiles = {}  # (tile x, tile y) -> 4096-bit int
+        self.generation = 0
+        # Tiles that changed in the last step (or were edited since)
+        self._changed = set()
+
+    def __len__(self) -> int:
+        """Number of live cells."""
+        return sum(tile.bit_count() for tile in self.tiles.values())
+
+    @property
+    def population(self) -> int:
+        """Number of live cells."""
+        return len(self)
+
+    def get_cell(self, x: int, y: int) -> int:
+        """
+        Args:
+            x: Column
+            y: Row
+
+        Returns:
+            1 if the cell is alive, else 0
+        """
+        tile = self.tiles.get((x // TILE, y // TILE), 0)
+        shift = (TILE - 1 - y % TILE) * TILE + (TILE - 1 - x % TILE)
+        return (tile >> shift) & 1
+
+    def set_cell(self, x: int, y: int, alive: int = 1) -> None:
+        """
+        Set or clear one cell.
+
+        Args:
+            x: Column
+            y: Row
+            alive: Truthy to make the cell alive
+        """
+        key = (x // TILE, y // TILE)
+        bit = 1 << ((TILE - 1 - y % TILE) * TILE + (TILE - 1 - x % TILE))
+        tile = self.tiles.get(key, 0)
+        tile = tile | bit if alive else tile & ~bit
+        if tile:
+            self.tiles[key] = tile
+        else:
+            self.tiles.pop(key, None)
+        self._changed.add(key)
+
+    def set_cells(self, cells) -> None:
+        """
+        Make cells alive.
+
+        Args:
+            cells: Iterable of (x, y) coordinates
+        """
+        for x, y in cells:
+            self.set_cell(x, y)
+
+    def cells(self):
+        """
+        Iterate over live cells.
+
+        Yields:
+            (x, y) for every live cell, tile by tile
+        """
+        for (tx, ty), tile in self.tiles.items():
+            for row in range(TILE):
+                bits = _tile_row(tile, row)
+                while bits:
+                    top = bits.bit_length() - 1
+                    yield tx * TILE + TILE - 1 - top, ty * TILE + row
+                    bits ^= 1 << top
+
+    def bounding_box(self) -> tuple[int, int, int, int] | None:
+        """
+        Return the smallest rectangle containing every live cell.
+
+        Returns:
+            (x0, y0, x1, y1) with exclusive x1 and y1, or None if empty
+        """
+        if not self.tiles:
+            return None
+        x0 = y0 = None
+        x1 = y1 = None
+        for (tx, ty), tile in self.tiles.items():
+            columns = 0
+            for row in range(TILE):
+                bits = _tile_row(tile, row)
+                if bits:
+                    columns |= bits
+                    y = ty * TILE + row
+                    y0 = y if y0 is None else min(y0, y)
+                    y1 = y + 1 if y1 is None else max(y1, y + 1)
+            left = tx * TILE + TILE - columns.bit_length()
+            right = tx * TILE + TILE - (columns & -columns).bit_length() + 1
+            x0 = left if x0 is None else min(x0, left)
+            x1 = right if x1 is None else max(x1, right)
+        return x0, y0, x1, y1
+
+    def clear(self) -> None:
+        """Remove every live cell and restart at generation 0."""
+        self.tiles.clear()
+        self._changed.clear()
+        self.generation = 0
+
+    def restore(self, tiles: dict, generation: int) -> None:
+        """
+        Replace the plane with saved tiles (see snapshot.py).
+
+        Args:
+            tiles: (tile x, tile y) -> 4096-bit int, as in self.tiles
+            generation: Generation number the tiles belong to
+        """
+        self.tiles = {key: tile for key, tile in tiles.items() if tile}
+        # Every tile may differ from what step() last saw
+        self._changed = set(self.tiles)
+        self.generation = generation
+
+    def region(self, x0: int, y0: int, width: int, height: int) -> list[int]:
+        """
+        Read a rectangle of cells as packed rows.
+
+        Args:
+            x0: Left column
+            y0: Top row
+            width: Number of columns
+            height: Number of rows
+
+        Returns:
+            height packed rows of width cells (see automata.packed)
+        """
+        if width <= 0:
+            return [0] * max(height, 0)
+        tx0 = x0 // TILE
+        tx1 = (x0 + width - 1) // TILE
+        # Bits of the assembled tile rows that lie right of the rectangle
+        drop = (tx1 + 1) * TILE - (x0 + width)
+        mask = (1 << width) - 1
+        rows = []
+        for y in range(y0, y0 + height):
+            ty, row = divmod(y, TILE)
+            bits = 0
+            for tx in range(tx0, tx1 + 1):
+                tile = self.tiles.get((tx, ty))
+                bits = (bits << TILE) | (_tile_row(tile, row) if tile else 0)
+            rows.append((bits >> drop) & mask)
+        return rows
+
+    def _bordered(self, tx: int, ty: int) -> int:
+        """Lay out a tile and a one-cell border as a 66x66 int."""
+        get = self.tiles.get
+        center = get((tx, ty), 0)
+        west = get((tx - 1, ty), 0)
+        east = get((tx + 1, ty), 0)
+
+        def edge_row(key_row: int, tile_y: int) -> int:
+            # Row from the tiles above or below, including corner cells
+            west_corner = get((tx - 1, tile_y), 0)
+            middle = get((tx, tile_y), 0)
+            east_corner = get((tx + 1, tile_y), 0)
+            return (
+                (_tile_row(west_corner, key_row) & 1) << (TILE + 1)
+                | _tile_row(middle, key_row) << 1
+                | _tile_row(east_corner, key_row) >> (TILE - 1)
+            )
+
+        bordered = edge_row(TILE - 1, ty - 1)
+        for row in range(TILE):
+            bordered = (bordered << _STRIDE) | (
+                (_tile_row(west, row) & 1) << (TILE + 1)
+                | _tile_row(center, row) << 1
+                | _tile_row(east, row) >> (TILE - 1)
+            )
+        return (bordered << _STRIDE) | edge_row(0, ty + 1)
+
+    def _next_tile(self, tx: int, ty: int) -> int:
+        """Compute the next generation of one tile."""
+        get = self.tiles.get
+        if (tx, ty) not in self.tiles and not any(
+            get((tx + dx, ty + dy), 0) & edge for (dx, dy), edge in _EDGES.items()
+        ):
+            return 0  # Nothing alive within reach (births need neighbors)
+        cells = self._bordered(tx, ty)
+
+        # Neighbor planes: each cell's neighbor in one direction, aligned
+        # with the cell; garbage only reaches the discarded border
+        up = cells >> _STRIDE
+        down = cells << _STRIDE
+        n = (
+            up >> 1,
+            up,
+            up << 1,
+            cells >> 1,
+            cells << 1,
+            down >> 1,
+            down,
+            down << 1,
+        )
+
+        s_a, c_a = _full_add(n[0], n[1], n[2])
+        s_b, c_b = _full_add(n[3], n[4], n[5])
+        s_c, c_c = _half_add(n[6], n[7])
+        ones, carry_1 = _full_add(s_a, s_b, s_c)
+        t, carry_2 = _full_add(c_a, c_b, c_c)
+        twos, carry_3 = _half_add(t, carry_1)
+        fours, eights = _half_add(carry_2, carry_3)
+
+        def count_is(count: int) -> int:
+            result = eights if count & 8 else ~eights
+            result &= fours if count & 4 else ~fours
+            result &= twos if count & 2 else ~twos
+            return result & (ones if count & 1 else ~ones)
+
+        born = 0
+        for count in self.birth:
+            born |= count_is(count)
+        kept = 0
+        for count in self.survive:
+            kept |= count_is(count)
+        after = (cells & kept) | (~cells & born)
+
+        tile = 0
+        for row in range(1, TILE + 1):
+            shift = (_STRIDE - 1 - row) * _STRIDE + 1
+            tile = (tile << TILE) | ((after >> shift) & TILE_MASK)
+        return tile
+
+    def step(self, generations: int = 1) -> None:
+        """
+        Advance the plane.
+
+        Args:
+            generations: Number of generations to compute
+        """
+        for _ in range(generations):
+            candidates = set()
+            for tx, ty in self._changed:
+                candidates.add((tx, ty))
+                for dx, dy in _NEIGHBORS:
+                    candidates.add((tx + dx, ty + dy))
+
+            updates = {}
+            for key in candidates:
+                tile = self._next_tile(*key)
+                if tile != self.tiles.get(key, 0):
+                    updates[key] = tile
+
+            for key, tile in updates.items():
+                if tile:
+                    self.tiles[key] = tile
+                else:
+                    del self.tiles[key]
+            self._changed = set(updates)
+            self.generation += 1
+
+
+def random_soup(
+    grid: LifeGrid,
+    x0: int,
+    y0: int,
+    width: int,
+    height: int,
+    density: float = 0.35,
+    rng=None,
+) -> None:
+    """
+    Fill a rectangle with random live cells.
+
+    Args:
+        grid: Plane to fill
+        x0: Left column
+        y0: Top row
+        width: Number of columns
+        height: Number of rows
+        density: Probability that each cell is alive
+        rng: random.Random instance (defaults to the module-level generator)
+    """
+    from automata.simulation import random_row
+
+    for y in range(y0, y0 + height):
+        bits = random_row(width, density, rng)
+        while bits:
+            top = bits.bit_length() - 1
+            grid.set_cell(x0 + width - 1 - top, y)
+            bits ^= 1 << top
@@ -1,21 +1,63 @@
 """Main application loop for cellular automata demo."""
 
+import argparse
 import curses
 import time
 
+from automata.life import parse_rule
+from automata.profiling import Profiler
 from automata.state import State
-from automata.simulation import reset_simulation
-from automata.ui.renderer import render
+from automata.scheduler import StepScheduler
+from automata.simulation import advance_simulation, reset_simulation
+from automata.snapshot import SNAPSHOT_ROWS, SnapshotError, load_snapshot, restore_state
+from automata.storage import BOUNDARIES, SpacetimeReader, StorageError
+from automata.ui.renderer import Frame, render
 from automata.ui.input import configure_input, read_key, handle_input
-from automata.simulation import evolve_next_row
 
 
-def _run(stdscr) -> int:
+def _sync_profiler(state) -> None:
+    """Keep a profiler only while the stats overlay or a trace needs one."""
+    if state.show_stats and state.profiler is None:
+        state.profiler = Profiler()
+    elif not state.show_stats and state.profiler is not None:
+        if not state.profiler.tracing:
+            state.profiler = None
+            state.stats_text = ""
+
+
+def _run(
+    stdscr,
+    replay=None,
+    life_rule: str | None = None,
+    trace: str | None = None,
+    snapshot=None,
+    snapshot_path: str = "automata.snap",
+    snapshot_rows: str = "window",
+    boundary: str = "torus",
+    history_interval: int = 0,
+    history_budget: int = 16 << 20,
+    width: int = 80,
+    clock=time.monotonic,
+) -> int:
     """
     Main application loop.
 
     Args:
         stdscr: curses window object
+        replay: Optional storage.SpacetimeReader to replay instead of
+            simulating
+        life_rule: Start in 2D mode with this Life-like rule
+        trace: Write a Chrome trace of the main loop to this file
+        snapshot: Optional snapshot.Snapshot to resume from
+        snapshot_path: File used by the Save/Load Snapshot menu entries
+        snapshot_rows: "window" or "last" rows kept in saved snapshots
+        boundary: "torus" or "infinite" for 1D rows
+        history_interval: Generations between history checkpoints (0 tunes
+            the interval to history_budget)
+        history_budget: Bytes of history checkpoints when auto-tuning
+        width: Cells per row (or per line of the 2D plane)
+        clock: Returns the current time in seconds for pacing (a virtual
+            clock makes the loop deterministic, see automata.bench.loop)
 
     Returns:
         Exit code (0 for success)
@@ -26,58 +68,241 @@ def _run(stdscr) -> int:
     state = State(
         rule_number=30,
         step_delay=0.1,
-        width=80,
+        width=width,
         height=160,
         simulation_mode="none",
         menu_open=False,
+        replay=replay,
+        dimensions=1 if life_rule is None else 2,
+        life_rule=life_rule or "B3/S23",
+        snapshot_path=snapshot_path,
+        snapshot_rows=snapshot_rows,
+        boundary=boundary,
+        history_interval=history_interval,
+        history_budget=history_budget,
     )
-    reset_simulation(state)
-
-    last_step_time = time.monotonic()
-
-    while state.running:
-        now = time.monotonic()
-
-        # Evolution step logic
-        if state.simulation_mode == "auto":
-            if now - last_step_time >= state.step_delay:
-                if state.current_row < state.height - 1:
-                    evolve_next_row(
-                        state.grid, state.current_row, state.rule_transitions, state.width
-                    )
-                    state.current_row += 1
-                last_step_time = now
-        elif state.simulation_mode == "step":
-            if state.step_requested:
-                if state.current_row < state.height - 1:
-                    evolve_next_row(
-                        state.grid, state.current_row, state.rule_transitions, state.width
-                    )
-                    state.current_row += 1
-                state.step_requested = False
-
-        # Input handling
-        key = read_key(stdscr)
-        if key is not None:
-            handle_input(state, key)
-
-        # Rendering
-        render(stdscr, state)
-
-        # Small sleep to prevent CPU spinning
-        time.sleep(0.01)
+    if snapshot is not None:
+        restore_state(state, snapshot)
+    else:
+        reset_simulation(state)
+    frame = Frame()
+
+    scheduler = StepScheduler()
+    if trace is not None:
+        state.profiler = Profiler(trace)
+
+    try:
+        while state.running:
+            profiler = state.profiler
+            if profiler is not None:
+                start = time.perf_counter_ns()
+            now = clock()
+
+            # Evolution step logic
+            generations = 0
+            if state.simulation_mode == "auto":
+                generations = scheduler.due(now, state.step_delay)
+                if generations:
+                    advance_simulation(state, generations)
+            else:
+                scheduler.stop()
+                if state.simulation_mode == "step" and state.step_requested:
+                    advance_simulation(state)
+                    state.step_requested = False
+                    generations = 1
+
+            if profiler is not None:
+                profiler.record("evolve", start)
+                profiler.count(generations=generations)
+                state.stats_text = ""
+                if state.show_stats:
+                    state.stats_text = profiler.summary()
+                    if state.history is not None:
+                        state.stats_text += "  " + state.history.summary()
+
+            # Rendering (only the latest state, however many generations ran)
+            drawn = render(stdscr, state, frame)
+
+            # Idle iterations that drew nothing would drag the frame
+            # percentiles towards zero
+            if profiler is not None and drawn:
+                profiler.record("frame", start)
+                profiler.count(frames=1)
+
+            # Block until a key arrives or the next generation is due
+            key = read_key(stdscr, scheduler.timeout_ms(clock()))
+            if key is not None:
+                if profiler is not None:
+                    start = time.perf_counter_ns()
+                handle_input(state, key)
+                if profiler is not None:
+                    profiler.record("input", start)
+                _sync_profiler(state)
+    finally:
+        if state.profiler is not None:
+            state.profiler.close()
 
     return 0
 
 
-def main() -> int:
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the interactive UI.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m automata",
+        description="Interactive terminal cellular automata viewer.",
+        epilog="Subcommands: run, replay, survey, ensemble, serve (see python -m automata run -h).",
+    )
+    parser.add_argument(
+        "--replay", default=None, help="replay a spacetime file instead of simulating"
+    )
+    parser.add_argument(
+        "-w",
+        "--width",
+        type=int,
+        default=None,
+        help=(
+            "cells per row (default 80); pan wide rows with the arrow keys "
+            "and zoom out with -"
+        ),
+    )
+    parser.add_argument(
+        "--life",
+        nargs="?",
+        const="B3/S23",
+        default=None,
+        metavar="RULE",
+        help='start in 2D mode with a Life-like rule (default "B3/S23")',
+    )
+    parser.add_argument(
+        "--trace",
+        default=None,
+        metavar="FILE",
+        help="write a Chrome trace of the main loop's hot path to FILE",
+    )
+    parser.add_argument(
+        "--resume",
+        default=None,
+        metavar="FILE",
+        help="continue from a snapshot saved with the Save Snapshot menu entry",
+    )
+    parser.add_argument(
+        "--snapshot",
+        default=None,
+        metavar="FILE",
+        help="snapshot file for the Save/Load Snapshot menu entries "
+        "(default: the --resume file, else automata.snap)",
+    )
+    parser.add_argument(
+        "--snapshot-rows",
+        choices=SNAPSHOT_ROWS,
+        default="window",
+        help="save every retained row or only the newest one",
+    )
+    parser.add_argument(
+        "--boundary",
+        choices=BOUNDARIES,
+        default="torus",
+        help="wrap rows around (torus) or grow an unbounded line (infinite; "
+        "even rules only)",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=0,
+        metavar="K",
+        help="keep every Kth generation for scrolling back past the retained "
+        "rows (default: tuned to --history-mb)",
+    )
+    parser.add_argument(
+        "--history-mb",
+        type=float,
+        default=16,
+        help="memory for history checkpoints when --checkpoint-every is not set",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
     """
     Entry point for the application.
 
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
     Returns:
         Exit code
     """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.trace is not None:
+        try:
+            open(args.trace, "w").close()
+        except OSError as exc:
+            parser.error(str(exc))
+
+    if args.life is not None:
+        if args.replay is not None:
+            parser.error("--life cannot be combined with --replay")
+        try:
+            parse_rule(args.life)
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    if args.width is not None:
+        if args.width < 1:
+            parser.error("--width must be at least 1")
+        if args.replay or args.resume:
+            parser.error("--width cannot be combined with --replay or --resume")
+
+    if args.checkpoint_every < 0:
+        parser.error("--checkpoint-every must not be negative")
+    if args.history_mb <= 0:
+        parser.error("--history-mb must be positive")
+
+    if args.boundary == "infinite" and (args.replay or args.life):
+        parser.error("--boundary infinite cannot be combined with --replay or --life")
+
+    snapshot = None
+    if args.resume is not None:
+        if args.replay is not None or args.life is not None:
+            parser.error("--resume cannot be combined with --replay or --life")
+        try:
+            snapshot = load_snapshot(args.resume)
+        except (OSError, SnapshotError) as exc:
+            parser.error(f"cannot resume from {args.resume}: {exc}")
+    snapshot_path = args.snapshot or args.resume or "automata.snap"
+
+    replay = None
+    if args.replay is not None:
+        try:
+            replay = SpacetimeReader(args.replay)
+        except (OSError, StorageError) as exc:
+            parser.error(str(exc))
+        if len(replay) == 0:
+            parser.error(f"{args.replay} contains no rows")
+
     try:
-        return curses.wrapper(_run)
+        return curses.wrapper(
+            _run,
+            replay,
+            args.life,
+            args.trace,
+            snapshot,
+            snapshot_path,
+            args.snapshot_rows,
+            args.boundary,
+            args.checkpoint_every,
+            int(args.history_mb * (1 << 20)),
+            80 if args.width is None else args.width,
+        )
     except KeyboardInterrupt:
         return 0
+    finally:
+        if replay is not None:
+            replay.close()
@@ -0,0 +1,318 @@
+"""Multi-process engine for very wide toroidal rows.
+
+The row is split into contiguous segments, one per worker process. The
+current and next rows live in two shared-memory buffers in the byte layout
+of row_to_bytes(), and segment boundaries fall on byte boundaries so no two
+workers ever write the same byte.
+
+Each round a worker reads its segment plus ``halo`` cells on either side
+from the current buffer, evolves that strip ``halo`` generations with no
+wrap-around (the damage from the unknown outside spreads one cell per
+generation, so it never reaches the segment), and writes the segment into
+the next buffer. One barrier per round keeps the workers in step, so a
+larger halo trades a little redundant work for fewer synchronizations.
+
+Commands are handed out and collected through semaphores that the calling
+process polls, so a worker that dies is noticed within POLL_INTERVAL and
+reported as a RuntimeError instead of blocking the caller forever.
+"""
+
+import multiprocessing
+import os
+import threading
+from multiprocessing import shared_memory
+
+from automata.packed import apply_rule, row_from_bytes, row_nbytes, row_to_bytes
+
+DEFAULT_HALO = 64
+POLL_INTERVAL = 0.1  # Seconds between checks that the other side is alive
+
+# Control slots shared with the workers
+_GENERATIONS = 0  # Generations to run; negative tells workers to exit
+_CURRENT = 1  # Index of the buffer holding the current row
+_HALO = 2  # Generations per synchronization round
+
+
+def _read_cells(buf, width: int, start: int, count: int) -> int:
+    """
+    Read count consecutive cells of a toroidal row, wrapping around.
+
+    Args:
+        buf: Buffer in row_to_bytes() layout
+        width: Number of cells in the row
+        start: First cell (may be negative or past the end)
+        count: Number of cells to read
+
+    Returns:
+        Packed cells
+    """
+    result = 0
+    start %= width
+    while count:
+        take = min(count, width - start)
+        first = start // 8
+        last = (start + take + 7) // 8
+        chunk = int.from_bytes(buf[first:last], "big")
+        chunk >>= last * 8 - (start + take)
+        result = (result << take) | (chunk & ((1 << take) - 1))
+        count -= take
+        start = 0
+    return result
+
+
+def _write_cells(buf, start: int, bits: int, count: int) -> None:
+    """
+    Write a byte-aligned run of cells.
+
+    Args:
+        buf: Buffer in row_to_bytes() layout
+        start: First cell, a multiple of 8
+        bits: Packed cells
+        count: Number of cells; a multiple of 8 unless the run ends the row
+    """
+    nbytes = row_nbytes(count)
+    first = start // 8
+    buf[first : first + nbytes] = row_to_bytes(bits, count)
+
+
+def _segments(width: int, workers: int) -> list[tuple[int, int]]:
+    """Split a row into byte-aligned (start, stop) segments."""
+    nbytes = row_nbytes(width)
+    bounds = [min(width, (nbytes * i // workers) * 8) for i in range(workers + 1)]
+    return [(bounds[i], bounds[i + 1]) for i in range(workers)]
+
+
+def _worker(names, control, go, done, step_barrier, rule_number, width, span):
+    """Worker process loop: wait for a command, run it, report back."""
+    parent = os.getppid()
+    blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    buffers = [block.buf for block in blocks]
+    start, stop = span
+    count = stop - start
+    try:
+        while True:
+            while not go.acquire(timeout=POLL_INTERVAL):
+                if os.getppid() != parent:
+                    return  # Orphaned: the engine's process is gone
+            generations = control[_GENERATIONS]
+            if generations < 0:
+                break
+            current = control[_CURRENT]
+            while generations:
+                halo = min(control[_HALO], generations)
+                strip = count + 2 * halo
+                mask = (1 << strip) - 1
+                bits = _read_cells(buffers[current], width, start - halo, strip)
+                for _ in range(halo):
+                    bits = apply_rule(
+                        bits >> 1, bits, (bits << 1) & mask, rule_number, mask
+                    )
+                bits = (bits >> halo) & ((1 << count) - 1)
+                _write_cells(buffers[1 - current], start, bits, count)
+                step_barrier.wait()
+                current = 1 - current
+                generations -= halo
+            done.release()
+    except threading.BrokenBarrierError:
+        pass  # Another worker died and the engine aborted the round
+    finally:
+        del buffers
+        for block in blocks:
+            block.close()
+
+
+class ParallelEngine:
+    """
+    Evolve one wide toroidal row across several worker processes.
+
+    The row stays in shared memory between calls, so a run can be advanced
+    in pieces with step() and only converted back to an int by row().
+    Use as a context manager, or call close(), to stop the workers and free
+    the shared memory. If a worker dies, the call waiting on it raises
+    RuntimeError and the engine is closed.
+    """
+
+    def __init__(
+        self,
+        rule_number: int,
+        width: int,
+        workers: int | None = None,
+        halo: int = DEFAULT_HALO,
+    ):
+        """
+        Args:
+            rule_number: Integer 0-255 representing the CA rule
+            width: Number of cells in the row
+            workers: Worker processes (default: one per CPU); capped so
+                every segment holds at least one byte of cells
+            halo: Generations per synchronization round, and the number of
+                cells read from each neighbor per round
+        """
+        if width < 1:
+            raise ValueError("width must be at least 1")
+        if halo < 1:
+            raise ValueError("halo must be at least 1")
+        self.rule_number = rule_number
+        self.width = width
+        self.halo = halo
+        self.workers = max(1, min(workers or os.cpu_count() or 1, row_nbytes(width)))
+
+        nbytes = row_nbytes(width)
+        self._blocks = [
+            shared_memory.SharedMemory(create=True, size=nbytes) for _ in range(2)
+        ]
+        self._control = multiprocessing.RawArray("q", 3)
+        self._control[_HALO] = halo
+        self._go = multiprocessing.Semaphore(0)
+        self._done = multiprocessing.Semaphore(0)
+        self._step_barrier = multiprocessing.Barrier(self.workers)
+        names = [block.name for block in self._blocks]
+        self._processes = [
+            multiprocessing.Process(
+                target=_worker,
+                args=(
+                    names,
+                    self._control,
+                    self._go,
+                    self._done,
+                    self._step_barrier,
+                    rule_number,
+                    width,
+                    span,
+                ),
+                daemon=True,
+            )
+            for span in _segments(width, self.workers)
+        ]
+        for process in self._processes:
+            process.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _command(self, generations: int) -> None:
+        """
+        Run one command on every worker and wait until all have finished.
+
+        Each worker takes exactly one go token: a command with generations
+        to run holds every worker at the step barrier until all have
+        started, and the exit command ends the worker loop.
+
+        Raises:
+            RuntimeError: If a worker died
+        """
+        if not self._processes:
+            raise RuntimeError("the parallel engine is closed")
+        self._control[_GENERATIONS] = generations
+        for _ in self._processes:
+            self._go.release()
+        if generations < 0:
+            return
+        remaining = len(self._processes)
+        while remaining:
+            if self._done.acquire(timeout=POLL_INTERVAL):
+                remaining -= 1
+            elif not all(process.is_alive() for process in self._processes):
+                self._shutdown()
+                raise RuntimeError("a parallel worker exited unexpectedly")
+
+    def _shutdown(self) -> None:
+        """Stop the workers, waiting briefly before killing them."""
+        self._step_barrier.abort()  # Release workers stuck mid-round
+        for process in self._processes:
+            process.join(timeout=POLL_INTERVAL * 10)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._processes = []
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+
+    def load(self, bits: int) -> None:
+        """
+        Set the current row.
+
+        Args:
+            bits: Packed row (see automata.packed)
+        """
+        data = row_to_bytes(bits, self.width)
+        self._blocks[self._control[_CURRENT]].buf[: len(data)] = data
+
+    def row(self) -> int:
+        """
+        Return the current row.
+
+        Returns:
+            Packed row
+        """
+        buf = self._blocks[self._control[_CURRENT]].buf
+        return row_from_bytes(buf[: row_nbytes(self.width)], self.width)
+
+    def step(self, generations: int = 1) -> None:
+        """
+        Advance the current row in place.
+
+        Args:
+            generations: Number of generations to advance
+
+        Raises:
+            RuntimeError: If a worker died or the engine is closed
+        """
+        if generations <= 0:
+            return
+        self._command(generations)
+        rounds = -(-generations // self.halo)
+        self._control[_CURRENT] ^= rounds & 1
+
+    def advance(self, bits: int, generations: int) -> int:
+        """
+        Advance a toroidal row by any number of generations.
+
+        Args:
+            bits: Packed row (see automata.packed)
+            generations: Number of generations to advance
+
+        Returns:
+            Packed row after the given number of generations
+        """
+        self.load(bits)
+        self.step(generations)
+        return self.row()
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        if not self._processes:
+            return
+        self._command(-1)
+        self._shutdown()
+
+
+def advance(
+    bits: int,
+    rule_number: int,
+    width: int,
+    generations: int,
+    workers: int | None = None,
+) -> int:
+    """
+    Advance a toroidal row with a temporary ParallelEngine.
+
+    Starting the workers costs tens of milliseconds, so reuse a
+    ParallelEngine directly when advancing the same row repeatedly.
+
+    Args:
+        bits: Packed row (see automata.packed)
+        rule_number: Integer 0-255 representing the CA rule
+        width: Number of cells in the row
+        generations: Number of generations to advance
+        workers: Worker processes (default: one per CPU)
+
+    Returns:
+        Packed row after the given number of generations
+    """
+    with ParallelEngine(rule_number, width, workers) as engine:
+        return engine.advance(bits, generations)
@@ -0,0 +1,199 @@
+"""Low-overhead timing of the main loop's hot path.
+
+Durations are recorded in nanoseconds into fixed-size log-linear
+histograms: each power of two is split into 8 buckets, so a bucket is
+never more than 12.5% wide and recording is a few integer operations with
+no allocation. Optionally every timed section is also written to a trace
+file in the Chrome trace event format (one event per line), which
+chrome://tracing and Perfetto can open directly.
+
+Nothing here runs unless a Profiler exists; the main loop keeps none when
+the stats overlay is hidden and no trace was requested.
+"""
+
+import json
+import os
+import time
+
+SUB_BITS = 3  # 2**SUB_BITS buckets per power of two
+BUCKETS = (64 + 1) << SUB_BITS
+
+SECTIONS = ("evolve", "build", "output", "input", "frame")
+
+SUMMARY_INTERVAL_NS = 500_000_000  # How often the overlay numbers change
+
+
+def _bucket(value: int) -> int:
+    """Return the histogram bucket for a non-negative value."""
+    if value < (2 << SUB_BITS):
+        return value
+    shift = value.bit_length() - (SUB_BITS + 1)
+    return (shift << SUB_BITS) + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """Return the [low, high) range of values in a bucket."""
+    if index < (2 << SUB_BITS):
+        return index, index + 1
+    shift = (index >> SUB_BITS) - 1
+    mantissa = index - (shift << SUB_BITS)
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class Histogram:
+    """Fixed-size log-linear histogram of non-negative integers."""
+
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+
+    def record(self, value: int) -> None:
+        """
+        Add one value.
+
+        Args:
+            value: Non-negative integer (negative values count as 0)
+        """
+        if value < 0:
+            value = 0
+        self.counts[_bucket(value)] += 1
+        self.count += 1
+        self.total += value
+
+    def percentile(self, p: float) -> float:
+        """
+        Estimate a percentile.
+
+        Args:
+            p: Percentile between 0 and 100
+
+        Returns:
+            Midpoint of the bucket holding the percentile, or 0.0 if empty
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, round(self.count * p / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                low, high = _bucket_bounds(index)
+                return (low + high - 1) / 2
+        return 0.0
+
+    def mean(self) -> float:
+        """Return the mean of the recorded values, or 0.0 if empty."""
+        return self.total / self.count if self.count else 0.0
+
+    def reset(self) -> None:
+        """Forget every recorded value."""
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0
+
+
+class Profiler:
+    """
+    Per-section histograms, rate counters and an optional trace file.
+
+    Sections are "evolve", "build" (build_display_lines), "output" (curses
+    writes and refresh), "input" (key handling) and "frame" (one whole
+    loop iteration that drew a frame, excluding the wait for the next key
+    or step).
+    """
+
+    def __init__(self, trace_path: str | None = None):
+        """
+        Args:
+            trace_path: Write a Chrome trace to this file (optional)
+        """
+        self.histograms = {name: Histogram() for name in SECTIONS}
+        self.generations = 0
+        self.frames = 0
+        self._origin = time.perf_counter_ns()
+        self._window = (self._origin, 0, 0)  # (time, generations, frames)
+        self._summary = ""
+        self._trace = None
+        if trace_path is not None:
+            self._trace = open(trace_path, "w", encoding="utf-8")
+            # The closing bracket is optional in the array format, so the
+            # file stays loadable even if the program is killed
+            self._trace.write("[")
+            self._separator = "\n"
+            self._pid = os.getpid()
+
+    @property
+    def tracing(self) -> bool:
+        """Whether a trace file is being written."""
+        return self._trace is not None
+
+    def record(self, section: str, start_ns: int) -> int:
+        """
+        Record a section that started at start_ns and ends now.
+
+        Args:
+            section: One of SECTIONS
+            start_ns: time.perf_counter_ns() when the section began
+
+        Returns:
+            The end time, so consecutive sections can chain
+        """
+        end_ns = time.perf_counter_ns()
+        self.histograms[section].record(end_ns - start_ns)
+        if self._trace is not None:
+            event = {
+                "name": section,
+                "ph": "X",
+                "ts": (start_ns - self._origin) / 1000,
+                "dur": (end_ns - start_ns) / 1000,
+                "pid": self._pid,
+                "tid": 0,
+            }
+            self._trace.write(self._separator + json.dumps(event))
+            self._separator = ",\n"
+        return end_ns
+
+    def count(self, generations: int = 0, frames: int = 0) -> None:
+        """
+        Add to the generation and frame counters.
+
+        Args:
+            generations: Generations computed
+            frames: Frames drawn
+        """
+        self.generations += generations
+        self.frames += frames
+
+    def summary(self) -> str:
+        """
+        Describe recent throughput and frame times for the status line.
+
+        Rates are averaged over the last SUMMARY_INTERVAL_NS or more, and
+        the text only changes that often so the overlay does not force a
+        redraw on every frame.
+
+        Returns:
+            Text such as "1200 gen/s  60 fps  frame p50 0.4ms p99 2.1ms"
+        """
+        now = time.perf_counter_ns()
+        start, generations, frames = self._window
+        elapsed = now - start
+        if elapsed >= SUMMARY_INTERVAL_NS or not self._summary:
+            seconds = max(elapsed, 1) / 1e9
+            frame = self.histograms["frame"]
+            self._summary = (
+                f"{(self.generations - generations) / seconds:.0f} gen/s  "
+                f"{(self.frames - frames) / seconds:.0f} fps  "
+                f"frame p50 {frame.percentile(50) / 1e6:.1f}ms "
+                f"p99 {frame.percentile(99) / 1e6:.1f}ms"
+            )
+            self._window = (now, self.generations, self.frames)
+        return self._summary
+
+    def close(self) -> None:
+        """Finish and close the trace file, if any."""
+        if self._trace is not None:
+            self._trace.write("\n]\n")
+            self._trace.close()
+            self._trace = None
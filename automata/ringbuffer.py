@@ -0,0 +1,91 @@
+"""Fixed-capacity ring buffer of recent generations."""
+
+
+class RowRing:
+    """
+    Keep the most recent ``capacity`` rows of a simulation.
+
+    Rows are appended one generation at a time; once the buffer is full the
+    oldest row is overwritten, so memory stays bounded no matter how long the
+    simulation runs. Index 0 is always the oldest retained row and index -1
+    the newest, which is the scrolling-window view the renderer wants.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Maximum number of rows retained (at least 1)
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._rows = [None] * capacity
+        self._start = 0
+        self._count = 0
+        # Absolute generation number of the next appended row
+        self.next_generation = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("ring index out of range")
+        return self._rows[(self._start + index) % self.capacity]
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._rows[(self._start + i) % self.capacity]
+
+    @property
+    def first_generation(self) -> int:
+        """Absolute generation number of the oldest retained row."""
+        return self.next_generation - self._count
+
+    def append(self, row) -> None:
+        """
+        Add the next generation, evicting the oldest row when full.
+
+        Args:
+            row: Row to store
+        """
+        if self._count < self.capacity:
+            self._rows[(self._start + self._count) % self.capacity] = row
+            self._count += 1
+        else:
+            self._rows[self._start] = row
+            self._start = (self._start + 1) % self.capacity
+        self.next_generation += 1
+
+    def latest(self):
+        """
+        Return the newest row.
+
+        Returns:
+            The most recently appended row
+        """
+        return self[-1]
+
+    def window(self, count: int, offset: int = 0) -> list:
+        """
+        Return up to ``count`` consecutive rows, oldest first.
+
+        Args:
+            count: Maximum number of rows to return
+            offset: Number of newest rows to skip
+
+        Returns:
+            List of rows ending ``offset`` rows before the newest
+        """
+        stop = max(0, self._count - max(offset, 0))
+        start = max(0, stop - max(count, 0))
+        return [self[i] for i in range(start, stop)]
+
+    def clear(self) -> None:
+        """Drop all rows and restart generation numbering at 0."""
+        self._rows = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+        self.next_generation = 0
@@ -1,4 +1,11 @@
-"""Elementary cellular automata rule encoding/decoding."""
+"""Cellular automata rule encoding/decoding.
+
+Elementary rules use the 8-entry tables from decode_rule(); GeneralRule
+covers k-state, radius-r rules given as Wolfram, totalistic or outer
+totalistic codes.
+"""
+
+from typing import NamedTuple
 
 
 def decode_rule(rule_number: int) -> list[int]:
@@ -62,3 +69,140 @@ def get_next_cell(
     """
     index = neighborhood_to_index(left, center, right)
     return rule_transitions[index]
+
+
+class GeneralRule(NamedTuple):
+    """
+    A k-state, radius-r rule expanded into a full transition table.
+
+    Neighborhoods are read left to right as base-k digits, so the leftmost
+    cell is the most significant: with k=2, r=1 this is the same indexing
+    as decode_rule().
+    """
+
+    states: int
+    radius: int
+    table: tuple[int, ...]  # Next state for every neighborhood index
+
+    @property
+    def span(self) -> int:
+        """Number of cells in a neighborhood (2r + 1)."""
+        return 2 * self.radius + 1
+
+
+# Largest expanded table accepted (k ** (2r + 1) entries)
+MAX_TABLE_SIZE = 1 << 20
+
+
+def _check_shape(states: int, radius: int) -> int:
+    """Validate k and r and return the number of neighborhoods."""
+    if states < 2:
+        raise ValueError("a rule needs at least 2 states")
+    if radius < 0:
+        raise ValueError("radius must not be negative")
+    size = states ** (2 * radius + 1)
+    if size > MAX_TABLE_SIZE:
+        raise ValueError(
+            f"{states}-state radius-{radius} rules have too many neighborhoods"
+        )
+    return size
+
+
+def _digits(code: int, base: int, count: int, kind: str) -> list[int]:
+    """Expand a rule code into count base-k digits, least significant first."""
+    if not 0 <= code < base**count:
+        raise ValueError(f"{kind} code must be between 0 and {base}**{count} - 1")
+    digits = []
+    for _ in range(count):
+        code, digit = divmod(code, base)
+        digits.append(digit)
+    return digits
+
+
+def _neighborhood_digits(index: int, states: int, span: int) -> list[int]:
+    """Return the cells of a neighborhood index, leftmost first."""
+    cells = []
+    for _ in range(span):
+        index, cell = divmod(index, states)
+        cells.append(cell)
+    return cells[::-1]
+
+
+def wolfram_rule(code: int, states: int = 2, radius: int = 1) -> GeneralRule:
+    """
+    Decode a Wolfram rule code for any number of states and radius.
+
+    Digit i of the code in base k is the next state for neighborhood index
+    i, so wolfram_rule(30) matches decode_rule(30).
+
+    Args:
+        code: Rule code, 0 to k ** (k ** (2r + 1)) - 1
+        states: Number of cell states k
+        radius: Neighborhood radius r
+
+    Returns:
+        GeneralRule
+
+    Raises:
+        ValueError: If the code or shape is out of range
+    """
+    size = _check_shape(states, radius)
+    return GeneralRule(states, radius, tuple(_digits(code, states, size, "rule")))
+
+
+def totalistic_rule(code: int, states: int = 2, radius: int = 1) -> GeneralRule:
+    """
+    Decode a totalistic code: the next state depends on the neighborhood sum.
+
+    Digit s of the code in base k is the next state when the 2r + 1 cells
+    sum to s.
+
+    Args:
+        code: Totalistic code, 0 to k ** ((2r + 1)(k - 1) + 1) - 1
+        states: Number of cell states k
+        radius: Neighborhood radius r
+
+    Returns:
+        GeneralRule
+
+    Raises:
+        ValueError: If the code or shape is out of range
+    """
+    size = _check_shape(states, radius)
+    span = 2 * radius + 1
+    outputs = _digits(code, states, span * (states - 1) + 1, "totalistic")
+    table = tuple(
+        outputs[sum(_neighborhood_digits(index, states, span))] for index in range(size)
+    )
+    return GeneralRule(states, radius, table)
+
+
+def outer_totalistic_rule(code: int, states: int = 2, radius: int = 1) -> GeneralRule:
+    """
+    Decode an outer totalistic code: the next state depends on the center
+    cell and the sum of the other 2r cells.
+
+    Digit k * s + c of the code in base k is the next state for center c
+    and outer sum s.
+
+    Args:
+        code: Outer totalistic code, 0 to k ** (k * (2r(k - 1) + 1)) - 1
+        states: Number of cell states k
+        radius: Neighborhood radius r
+
+    Returns:
+        GeneralRule
+
+    Raises:
+        ValueError: If the code or shape is out of range
+    """
+    size = _check_shape(states, radius)
+    span = 2 * radius + 1
+    outer_sums = 2 * radius * (states - 1) + 1
+    outputs = _digits(code, states, states * outer_sums, "outer totalistic")
+    table = []
+    for index in range(size):
+        cells = _neighborhood_digits(index, states, span)
+        center = cells[radius]
+        table.append(outputs[states * (sum(cells) - center) + center])
+    return GeneralRule(states, radius, tuple(table))
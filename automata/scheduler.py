@@ -0,0 +1,87 @@
+"""Deadline-driven pacing for automatic evolution."""
+
+import math
+
+# Most generations reported at once, as in the HTML front end: a longer
+# stall (a suspended process, a slow frame at a tiny delay) skips ahead
+# rather than freezing the loop while it computes a huge burst
+MAX_CATCH_UP = 256
+
+
+class StepScheduler:
+    """
+    Decide how many generations are due and how long the loop may sleep.
+
+    Generations are due on a fixed grid of deadlines ``step_delay`` apart,
+    so the long-run rate matches the requested delay exactly, however
+    long each frame takes. If the loop falls behind, every overdue
+    generation is reported at once so the caller can compute them all and
+    render only the latest state.
+    """
+
+    def __init__(self, max_catch_up: int = MAX_CATCH_UP):
+        """
+        Args:
+            max_catch_up: Most generations reported in one call; anything
+                beyond that is dropped instead of computed in a burst
+        """
+        self.max_catch_up = max_catch_up
+        self.next_deadline = None
+
+    def start(self, now: float, step_delay: float) -> None:
+        """
+        Restart pacing, with the first generation due one delay from now.
+
+        Args:
+            now: Current time.monotonic() value
+            step_delay: Seconds between generations
+        """
+        self.next_deadline = now + step_delay
+
+    def stop(self) -> None:
+        """Stop pacing until start() is called again."""
+        self.next_deadline = None
+
+    @property
+    def running(self) -> bool:
+        """Whether generations are currently being scheduled."""
+        return self.next_deadline is not None
+
+    def due(self, now: float, step_delay: float) -> int:
+        """
+        Return the number of generations due and move the deadline on.
+
+        Args:
+            now: Current time.monotonic() value
+            step_delay: Seconds between generations
+
+        Returns:
+            Number of generations to compute now (0 if none are due)
+        """
+        if self.next_deadline is None:
+            self.start(now, step_delay)
+            return 0
+        if now < self.next_deadline:
+            return 0
+
+        count = int((now - self.next_deadline) / step_delay) + 1
+        if count > self.max_catch_up:
+            self.next_deadline = now + step_delay
+            return self.max_catch_up
+        self.next_deadline += count * step_delay
+        return count
+
+    def timeout_ms(self, now: float) -> int:
+        """
+        Return how long the loop may block waiting for input.
+
+        Args:
+            now: Current time.monotonic() value
+
+        Returns:
+            Milliseconds until the next deadline, or -1 to wait
+            indefinitely when nothing is scheduled
+        """
+        if self.next_deadline is None:
+            return -1
+        return max(0, math.ceil((self.next_deadline - now) * 1000))
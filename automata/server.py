@@ -0,0 +1,482 @@
+"""Local streaming server: one shared simulation, any number of browsers.
+
+The page (cellular-automata.html) is served as-is; when it is loaded over
+HTTP it renders rows streamed from this process instead of running its own
+JavaScript engine. Everything uses the standard library and listens on
+localhost by default.
+
+Routes:
+
+    GET  /          the HTML front end
+    GET  /events    server-sent event stream (see below)
+    GET  /state     current settings as JSON
+    POST /control   JSON object with any of "rule", "delay", "mode",
+                    "step" (generations to advance) and "reset"
+
+Events on /events:
+
+    config  {"rule", "width", "height", "delay", "mode", "generation"}
+    rows    {"start", "count", "replace", "data"}: count packed rows (see
+            packed.row_to_bytes), base64-encoded back to back, the first
+            being generation start; replace is true when the rows are the
+            whole retained window rather than new generations
+
+Each generation is computed once and encoded once; the same event bytes
+are queued for every viewer. A viewer's queue holds at most queue_size
+events: when a slow viewer falls that far behind, its queue is dropped and
+it is sent a single resync (config plus the current window) once it
+catches up, so no viewer can make the server buffer without bound.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from http import HTTPStatus
+
+from automata.packed import row_to_bytes
+from automata.scheduler import StepScheduler
+from automata.simulation import advance_simulation, reset_simulation
+from automata.state import State
+
+PAGE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "cellular-automata.html",
+)
+
+MODES = ("none", "auto", "step")
+MAX_REQUEST_BYTES = 64 * 1024
+MAX_STEP = 100_000  # Most generations one "step" command may ask for
+HEARTBEAT_SECONDS = 15.0
+
+
+def _event(name: str, payload: dict) -> bytes:
+    """Encode one server-sent event."""
+    data = json.dumps(payload, separators=(",", ":"))
+    return f"event: {name}\ndata: {data}\n\n".encode()
+
+
+class Viewer:
+    """Bounded outgoing event queue for one connected browser."""
+
+    def __init__(self, queue_size: int):
+        """
+        Args:
+            queue_size: Events held before the viewer is marked for resync
+        """
+        self.queue_size = queue_size
+        self.queue = deque()
+        self.resync = True  # The first thing sent is the full state
+        self.dropped = 0
+        self.ready = asyncio.Event()
+        self.ready.set()
+
+    def publish(self, event: bytes) -> None:
+        """
+        Queue an event, coalescing into a resync if the viewer is behind.
+
+        Args:
+            event: Encoded event shared by every viewer
+        """
+        if self.resync:
+            # The resync will include this generation anyway
+            return
+        if len(self.queue) >= self.queue_size:
+            self.dropped += len(self.queue)
+            self.queue.clear()
+            self.resync = True
+        else:
+            self.queue.append(event)
+        self.ready.set()
+
+
+class SharedSimulation:
+    """One simulation stepped on its own schedule and broadcast to viewers."""
+
+    def __init__(
+        self,
+        rule_number: int = 30,
+        width: int = 80,
+        height: int = 160,
+        step_delay: float = 0.1,
+        mode: str = "none",
+        queue_size: int = 16,
+    ):
+        """
+        Args:
+            rule_number: Integer 0-255 representing the CA rule
+            width: Number of cells per row
+            height: Generations retained and sent to new viewers
+            step_delay: Seconds between generations in auto mode
+            mode: "none", "auto" or "step"
+            queue_size: Events queued per viewer before it is resynced
+        """
+        self.state = State(
+            rule_number=rule_number,
+            width=width,
+            height=height,
+            step_delay=step_delay,
+            simulation_mode=mode,
+        )
+        reset_simulation(self.state)
+        self.queue_size = queue_size
+        self.viewers = set()
+        self.scheduler = StepScheduler()
+        self._wake = asyncio.Event()
+
+    def config(self) -> dict:
+        """Return the settings every viewer shares."""
+        state = self.state
+        return {
+            "rule": state.rule_number,
+            "width": state.width,
+            "height": state.height,
+            "delay": state.step_delay,
+            "mode": state.simulation_mode,
+            "generation": state.current_row,
+        }
+
+    def _rows_event(self, rows: list[int], replace: bool) -> bytes:
+        """Encode rows ending at the newest generation."""
+        width = self.state.width
+        data = b"".join(row_to_bytes(bits, width) for bits in rows)
+        return _event(
+            "rows",
+            {
+                "start": self.state.current_row - len(rows) + 1,
+                "count": len(rows),
+                "replace": replace,
+                "data": base64.b64encode(data).decode("ascii"),
+            },
+        )
+
+    def snapshot_events(self) -> bytes:
+        """Return the events that bring a new or lagging viewer up to date."""
+        return _event("config", self.config()) + self._rows_event(
+            list(self.state.grid), True
+        )
+
+    def broadcast(self, event: bytes) -> None:
+        """
+        Queue an event for every viewer.
+
+        Args:
+            event: Encoded event
+        """
+        for viewer in self.viewers:
+            viewer.publish(event)
+
+    def advance(self, generations: int) -> None:
+        """
+        Compute generations and send the new rows to every viewer.
+
+        Args:
+            generations: Number of generations to compute
+        """
+        advance_simulation(self.state, generations)
+        new_rows = self.state.grid.window(min(generations, len(self.state.grid)))
+        if self.viewers:
+            self.broadcast(self._rows_event(new_rows, False))
+
+    def control(self, command: dict) -> None:
+        """
+        Apply a control command from a viewer.
+
+        Rule changes and "reset" restart the simulation, as in the curses
+        UI; every viewer then receives the new settings and window.
+
+        Args:
+            command: Dict with any of "rule", "delay", "mode", "step" and
+                "reset"
+
+        Raises:
+            ValueError: If a value is out of range (nothing is applied)
+        """
+        state = self.state
+        rule = command.get("rule", state.rule_number)
+        delay = command.get("delay", state.step_delay)
+        mode = command.get("mode", state.simulation_mode)
+        step = command.get("step", 0)
+        # Exact types, so JSON true/false (a bool is an int) are rejected
+        if type(rule) is not int or not 0 <= rule <= 255:
+            raise ValueError("rule must be an integer between 0 and 255")
+        if type(delay) not in (int, float) or not math.isfinite(delay) or delay <= 0:
+            raise ValueError("delay must be a positive, finite number")
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {', '.join(MODES)}")
+        if type(step) is not int or not 0 <= step <= MAX_STEP:
+            raise ValueError(f"step must be an integer between 0 and {MAX_STEP}")
+
+        restart = bool(command.get("reset")) or rule != state.rule_number
+        state.rule_number = rule
+        state.step_delay = float(delay)
+        state.simulation_mode = mode
+        if restart:
+            reset_simulation(state)
+            self.scheduler.stop()
+            self.broadcast(self.snapshot_events())
+        else:
+            self.broadcast(_event("config", self.config()))
+        if step and mode != "auto":
+            self.advance(step)
+        self._wake.set()
+
+    async def run(self) -> None:
+        """Step the simulation whenever generations are due; runs forever."""
+        while True:
+            timeout = None
+            try:
+                if self.state.simulation_mode == "auto":
+                    generations = self.scheduler.due(
+                        time.monotonic(), self.state.step_delay
+                    )
+                    if generations:
+                        self.advance(generations)
+                    timeout = self.scheduler.timeout_ms(time.monotonic()) / 1000
+                else:
+                    self.scheduler.stop()
+            except Exception as exc:
+                # Pause rather than let one bad step end the stepper task,
+                # which would leave every viewer on a frozen simulation
+                print(f"stepping failed, pausing: {exc!r}", file=sys.stderr)
+                self.state.simulation_mode = "none"
+                self.scheduler.stop()
+                self.broadcast(_event("config", self.config()))
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def stream(self, writer: asyncio.StreamWriter) -> None:
+        """
+        Send events to one viewer until it disconnects.
+
+        Args:
+            writer: Connection to write the event stream to
+        """
+        viewer = Viewer(self.queue_size)
+        self.viewers.add(viewer)
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(viewer.ready.wait(), HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    writer.write(b": keep-alive\n\n")
+                viewer.ready.clear()
+                if viewer.resync:
+                    viewer.resync = False
+                    viewer.queue.clear()
+                    writer.write(self.snapshot_events())
+                while viewer.queue:
+                    writer.write(viewer.queue.popleft())
+                # While this waits, new events queue up (or coalesce)
+                await writer.drain()
+        finally:
+            self.viewers.discard(viewer)
+
+
+async def _read_request(reader: asyncio.StreamReader):
+    """
+    Read one HTTP request.
+
+    Returns:
+        (method, path, body), or None if the request is malformed
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+        return None
+    lines = head.decode("latin-1").split("\r\n")
+    parts = lines[0].split()
+    if len(parts) != 3:
+        return None
+    method, target, _ = parts
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        return None
+    if not 0 <= length <= MAX_REQUEST_BYTES:
+        return None
+    body = await reader.readexactly(length) if length else b""
+    return method, target.split("?", 1)[0], body
+
+
+def _response(
+    status: HTTPStatus, body: bytes = b"", content_type: str = "text/plain"
+) -> bytes:
+    """Encode a complete HTTP response."""
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Cache-Control: no-store\r\n"
+        "Connection: close\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+async def _handle(simulation: SharedSimulation, reader, writer) -> None:
+    """Serve one connection (one request; event streams stay open)."""
+    try:
+        request = await _read_request(reader)
+        if request is None:
+            writer.write(_response(HTTPStatus.BAD_REQUEST))
+            return
+        method, path, body = request
+
+        if method == "GET" and path in ("/", "/index.html"):
+            try:
+                with open(PAGE_PATH, "rb") as f:
+                    page = f.read()
+            except OSError:
+                writer.write(_response(HTTPStatus.NOT_FOUND))
+            else:
+                writer.write(_response(HTTPStatus.OK, page, "text/html; charset=utf-8"))
+        elif method == "GET" and path == "/events":
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/event-stream\r\n"
+                b"Cache-Control: no-store\r\n"
+                b"Connection: keep-alive\r\n\r\n"
+            )
+            await simulation.stream(writer)
+        elif method == "GET" and path == "/state":
+            config = json.dumps(simulation.config()).encode()
+            writer.write(_response(HTTPStatus.OK, config, "application/json"))
+        elif method == "POST" and path == "/control":
+            try:
+                command = json.loads(body or b"{}")
+                if not isinstance(command, dict):
+                    raise ValueError("expected a JSON object")
+                simulation.control(command)
+            except ValueError as exc:
+                writer.write(_response(HTTPStatus.BAD_REQUEST, str(exc).encode()))
+            else:
+                writer.write(_response(HTTPStatus.NO_CONTENT))
+        elif path in ("/", "/index.html", "/events", "/state", "/control"):
+            writer.write(_response(HTTPStatus.METHOD_NOT_ALLOWED))
+        else:
+            writer.write(_response(HTTPStatus.NOT_FOUND))
+        await writer.drain()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(simulation: SharedSimulation, host: str, port: int) -> None:
+    """
+    Run the server and the simulation until cancelled.
+
+    Args:
+        simulation: Simulation to share
+        host: Interface to listen on
+        port: TCP port (0 picks a free one)
+    """
+
+    async def handle(reader, writer):
+        try:
+            await _handle(simulation, reader, writer)
+        except asyncio.CancelledError:
+            # Open event streams are cancelled at shutdown; finishing
+            # quietly keeps asyncio from logging each one as an error
+            pass
+
+    server = await asyncio.start_server(handle, host, port)
+    stepper = asyncio.create_task(simulation.run())
+    host, port = server.sockets[0].getsockname()[:2]
+    print(f"Serving on http://{host}:{port}/", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        stepper.cancel()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the serve subcommand.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m automata serve",
+        description="Stream a shared simulation to the HTML front end.",
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="interface to listen on (default: localhost)",
+    )
+    parser.add_argument("--port", type=int, default=8000, help="TCP port")
+    parser.add_argument("-r", "--rule", type=int, default=30, help="rule number 0-255")
+    parser.add_argument("-w", "--width", type=int, default=80, help="cells per row")
+    parser.add_argument(
+        "--height", type=int, default=160, help="generations sent to new viewers"
+    )
+    parser.add_argument(
+        "--delay", type=float, default=0.1, help="seconds between generations"
+    )
+    parser.add_argument(
+        "--auto", action="store_true", help="start running instead of waiting"
+    )
+    parser.add_argument(
+        "--queue",
+        type=int,
+        default=16,
+        help="events queued per viewer before it is resynced",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point for the serve subcommand.
+
+    Args:
+        argv: Command line arguments after "serve" (defaults to sys.argv)
+
+    Returns:
+        Exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not 0 <= args.rule <= 255:
+        parser.error("--rule must be between 0 and 255")
+    if args.width < 1 or args.height < 1:
+        parser.error("--width and --height must be at least 1")
+    if args.delay <= 0:
+        parser.error("--delay must be positive")
+    if args.queue < 1:
+        parser.error("--queue must be at least 1")
+
+    async def start():
+        simulation = SharedSimulation(
+            args.rule,
+            args.width,
+            args.height,
+            args.delay,
+            "auto" if args.auto else "none",
+            args.queue,
+        )
+        await serve(simulation, args.host, args.port)
+
+    try:
+        asyncio.run(start())
+    except KeyboardInterrupt:
+        return 0
+    except OSError as exc:
+        print(f"python -m automata serve: error: {exc}", file=sys.stderr)
+        return 1
+    return 0
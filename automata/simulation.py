@@ -1,22 +1,34 @@
 """Cellular automata simulation engine."""
 
+import numbers
+
+from automata.cycles import CycleDetector
+from automata.history import History
+from automata.life import LifeGrid, random_soup
+from automata.packed import evolve_packed_row
+from automata.ringbuffer import RowRing
 from automata.rules import decode_rule, get_next_cell
+from automata.tape import evolve_tape, tape_from_row, tape_to_row
 
 
-def initialize_grid(width: int, height: int) -> list[list[int]]:
+def initialize_grid(width: int, height: int) -> RowRing:
     """
-    Create an empty grid with a single cell in the center of the first row.
+    Create a row buffer holding a single cell in the center of the first row.
+
+    Rows are stored as packed ints (see automata.packed) in a ring buffer
+    that keeps the newest ``height`` generations, so the simulation can run
+    indefinitely in bounded memory.
 
     Args:
         width: Number of columns
-        height: Number of rows
+        height: Number of generations retained for display
 
     Returns:
-        2D grid with first row initialized, rest empty
+        Row buffer with the first row initialized
     """
-    grid = [[0] * width for _ in range(height)]
+    grid = RowRing(height)
     # Place a single cell at the center of the first row
-    grid[0][width // 2] = 1
+    grid.append(initial_row(width))
     return grid
 
 
@@ -29,6 +41,9 @@ def evolve_next_row(
     """
     Compute the next generation row based on the current row.
 
+    This is the reference per-cell engine for list-of-lists grids; the
+    application itself stores packed rows and uses advance_simulation().
+
     Uses toroidal boundary conditions where edges wrap around.
 
     Args:
@@ -56,14 +71,430 @@ def evolve_next_row(
         next_row[x] = get_next_cell(rule_transitions, left_val, center_val, right_val)
 
 
+def advance_simulation(state, generations: int = 1) -> None:
+    """
+    Evolve the simulation by one or more generations.
+
+    Each new row is computed from the newest row with the packed-row engine
+    and appended to the ring buffer, evicting the oldest row once full. When
+    replaying a recorded spacetime, rows are read from the file instead and
+    advancing stops at its last row. On an infinite tape only the active
+    span is evolved, and the retained rows are widened whenever it outgrows
+    them. In 2D mode the Life plane is stepped.
+
+    Args:
+        state: State object to advance
+        generations: Number of generations to compute
+    """
+    if state.dimensions == 2:
+        state.life.step(generations)
+        state.current_row = state.life.generation
+        return
+
+    cycle = state.cycle if state.cycle is not None and not state.cycle.found else None
+
+    if state.replay is not None:
+        stop = min(state.current_row + 1 + generations, len(state.replay))
+        for t in range(state.current_row + 1, stop):
+            bits = state.replay.row(t)
+            state.grid.append(bits)
+            if state.analysis is not None:
+                state.analysis.update(bits)
+            if cycle is not None:
+                cycle.observe(bits)
+    elif state.tape is not None:
+        for _ in range(generations):
+            state.tape = evolve_tape(state.tape, state.rule_number)
+            _fit_tape(state)
+            state.grid.append(tape_to_row(state.tape, state.origin, state.width))
+    else:
+        history = state.history
+        bits = state.grid.latest()
+        for _ in range(generations):
+            bits = evolve_packed_row(bits, state.rule_number, state.width)
+            state.grid.append(bits)
+            if history is not None:
+                history.record(bits)
+            if state.analysis is not None:
+                state.analysis.update(bits)
+            if cycle is not None:
+                cycle.observe(bits)
+    state.current_row = state.grid.next_generation - 1
+
+
+def _fit_tape(state) -> None:
+    """
+    Widen the retained rows until the infinite tape's active span fits.
+
+    Each side that overflows grows by at least the current width, so the
+    occasional re-layout of the retained rows is amortized.
+
+    Args:
+        state: State object on an infinite tape
+    """
+    tape = state.tape
+    if not tape.width:
+        return
+    grow_left = max(0, state.origin - tape.left)
+    grow_right = max(0, tape.right - state.origin - state.width)
+    if not grow_left and not grow_right:
+        return
+    if grow_left:
+        grow_left = max(grow_left, state.width)
+    if grow_right:
+        grow_right = max(grow_right, state.width)
+
+    grid = RowRing(state.height)
+    for bits in state.grid:
+        grid.append(bits << grow_right)
+    grid.next_generation = state.grid.next_generation
+    state.grid = grid
+    state.origin -= grow_left
+    state.width += grow_left + grow_right
+
+
 def reset_simulation(state) -> None:
     """
     Reinitialize the grid and apply the current rule.
 
+    When replaying, the rule and width come from the recorded file and the
+    replay restarts from its first row. Otherwise the width goes back to
+    state.base_width, undoing any growth of an infinite tape, and on an
+    infinite tape the first row is placed at absolute cells 0 to width - 1. In 2D mode a fresh Life
+    plane is seeded with a random soup the width of the display.
+
     Args:
         state: State object to reset
     """
-    state.grid = initialize_grid(state.width, state.height)
+    if state.base_width is None:
+        state.base_width = state.width
+    if state.replay is None:
+        state.width = state.base_width
+
+    if state.dimensions == 2:
+        state.life = LifeGrid(state.life_rule)
+        random_soup(state.life, 0, 0, state.width, state.width // 2)
+        state.tape = None
+        state.history = None
+        state.analysis = None
+        state.cycle = None
+        state.current_row = 0
+        state.step_requested = False
+        return
+
+    if state.replay is not None:
+        state.rule_number = state.replay.rule_number
+        state.width = state.replay.width
+        state.grid = RowRing(state.height)
+        state.grid.append(state.replay.row(0))
+    else:
+        state.grid = initialize_grid(state.width, state.height)
     state.rule_transitions = decode_rule(state.rule_number)
+    state.tape = None
+    state.origin = 0
+    state.history = None
+    state.cycle = None
+    if state.replay is not None:
+        # Rows recorded on an infinite tape are windows of an unbounded
+        # line, not a toroidal orbit, so they cannot be checked for cycles
+        if state.replay.boundary == "torus":
+            state.cycle = CycleDetector(state.grid[0], state.rule_number, state.width)
+    elif state.boundary == "infinite":
+        state.tape = tape_from_row(state.grid[0], state.width)
+    else:
+        state.cycle = CycleDetector(state.grid[0], state.rule_number, state.width)
+        state.history = start_history(state)
+    start_analysis(state)
     state.current_row = 0
     state.step_requested = False
+
+
+def start_history(state) -> History:
+    """
+    Begin checkpointing a live 1D run from the rows already retained.
+
+    Args:
+        state: State object with a torus row buffer
+
+    Returns:
+        History covering the retained rows and every later generation
+    """
+    rows = iter(state.grid)
+    history = History(
+        next(rows),
+        state.rule_number,
+        state.width,
+        start=state.grid.first_generation,
+        interval=state.history_interval or None,
+        budget=state.history_budget,
+    )
+    for bits in rows:
+        history.record(bits)
+    return history
+
+
+def start_analysis(state) -> None:
+    """
+    Start or stop the live metrics to match state.show_metrics.
+
+    Metrics cover 1D rows on a torus, starting from the newest row; the
+    damage twin is perturbed from that row.
+
+    Args:
+        state: State object
+    """
+    state.analysis = None
+    if not state.show_metrics or state.dimensions != 1 or state.tape is not None:
+        return
+    from automata.analysis import METRICS, LiveAnalysis
+
+    state.analysis = LiveAnalysis(
+        state.width, METRICS, state.rule_number, state.current_row
+    )
+    state.analysis.update(state.grid.latest())
+
+
+def first_available(state) -> int:
+    """
+    Return the oldest 1D generation that can still be shown.
+
+    Args:
+        state: State object
+
+    Returns:
+        Generation number: 0 when replaying, the start of the history when
+        checkpointing, otherwise the oldest row in the ring buffer
+    """
+    if state.replay is not None:
+        return 0
+    if state.history is not None:
+        return state.history.start
+    return state.grid.first_generation
+
+
+def rows_window(state, count: int, offset: int = 0) -> list[int]:
+    """
+    Return up to count consecutive 1D rows, oldest first.
+
+    Like RowRing.window(), but rows older than the ring buffer are read
+    from the replayed file or rebuilt from the history's checkpoints, so
+    the view can scroll back to the start of the run.
+
+    Args:
+        state: State object
+        count: Maximum number of rows to return
+        offset: Number of newest rows to skip
+
+    Returns:
+        List of packed rows ending offset rows before the newest
+    """
+    grid = state.grid
+    stop = grid.next_generation - max(offset, 0)  # One past the last row
+    start = max(first_available(state), stop - max(count, 0))
+    kept = grid.first_generation
+    if start >= kept:
+        return grid.window(count, offset)
+
+    if state.replay is not None:
+        rows = [state.replay.row(t) for t in range(start, min(stop, kept))]
+    else:
+        rows = state.history.rows(start, min(stop, kept))
+    if stop > kept:
+        rows += grid.window(stop - kept, offset)
+    return rows
+
+
+def _load_numpy():
+    """
+    Import NumPy on demand.
+
+    Returns:
+        The numpy module, or None if it is not installed
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _batch_rules(rules, batch: int) -> list[int]:
+    """
+    Expand a rule argument into one rule number per batch entry.
+
+    Args:
+        rules: Single rule number or sequence of rule numbers
+        batch: Number of rows in the batch
+
+    Returns:
+        List of batch rule numbers
+    """
+    if isinstance(rules, numbers.Integral):
+        return [int(rules)] * batch
+    rules = [int(rule) for rule in rules]
+    if len(rules) != batch:
+        raise ValueError(f"expected {batch} rules, got {len(rules)}")
+    return rules
+
+
+def iter_batch(
+    rows, rules, generations: int, width: int | None = None, packed: bool = False
+):
+    """
+    Evolve a batch of rows together, yielding one generation at a time.
+
+    With NumPy installed, rows is a (batch, width) uint8 array of 0/1 cells,
+    or a (batch, ceil(width / 8)) array from numpy.packbits when packed is
+    true. Neighborhood indices are built with numpy.roll and looked up in
+    the stacked decode_rule() tables, so every row and rule advances in one
+    vectorized call. Without NumPy, rows is a list of 0/1 lists and each row
+    is evolved with the packed-row engine instead.
+
+    Uses toroidal boundary conditions where edges wrap around.
+
+    Args:
+        rows: Initial rows, one per batch entry
+        rules: Rule number for all rows, or one rule number per row
+        generations: Number of generations to compute after the initial rows
+        width: Number of columns (required when packed is true)
+        packed: Whether rows are bit-packed with numpy.packbits
+
+    Yields:
+        generations + 1 batches of rows (the initial batch first), in the
+        same form as rows but always unpacked
+    """
+    np = _load_numpy()
+
+    if np is None:
+        from automata.packed import evolve_packed_row, pack_row, unpack_row
+
+        if packed:
+            raise ValueError("packed batches require NumPy")
+        if width is None:
+            width = len(rows[0]) if rows else 0
+        rule_list = _batch_rules(rules, len(rows))
+        bits = [pack_row(row) for row in rows]
+        yield [unpack_row(b, width) for b in bits]
+        for _ in range(generations):
+            bits = [
+                evolve_packed_row(b, rule, width) for b, rule in zip(bits, rule_list)
+            ]
+            yield [unpack_row(b, width) for b in bits]
+        return
+
+    rows = np.asarray(rows, dtype=np.uint8)
+    if packed:
+        if width is None:
+            raise ValueError("width is required for packed rows")
+        rows = np.unpackbits(rows, axis=1, count=width)
+    else:
+        rows = rows & 1
+
+    tables = np.array(
+        [decode_rule(rule) for rule in _batch_rules(rules, rows.shape[0])],
+        dtype=np.uint8,
+    )
+
+    yield rows
+    for _ in range(generations):
+        index = (
+            (np.roll(rows, 1, axis=1) << 2) | (rows << 1) | np.roll(rows, -1, axis=1)
+        )
+        rows = np.take_along_axis(tables, index, axis=1)
+        yield rows
+
+
+def evolve_batch(
+    rows, rules, generations: int, width: int | None = None, packed: bool = False
+):
+    """
+    Evolve a batch of rows and return the whole spacetime.
+
+    See iter_batch() for the accepted row formats.
+
+    Args:
+        rows: Initial rows, one per batch entry
+        rules: Rule number for all rows, or one rule number per row
+        generations: Number of generations to compute after the initial rows
+        width: Number of columns (required when packed is true)
+        packed: Whether rows are bit-packed with numpy.packbits
+
+    Returns:
+        (generations + 1, batch, width) uint8 array with NumPy, otherwise a
+        nested list indexed the same way
+    """
+    spacetime = list(iter_batch(rows, rules, generations, width, packed))
+    np = _load_numpy()
+    if np is None:
+        return spacetime
+    return np.stack(spacetime)
+
+
+def random_row(width: int, density: float = 0.5, rng=None) -> int:
+    """
+    Generate a random packed row with the given fraction of live cells.
+
+    Whole rows of random bits are combined with AND/OR according to the
+    binary expansion of density, so the cost is a handful of getrandbits()
+    calls regardless of width. Density is honoured to 1/65536.
+
+    Args:
+        width: Number of cells in the row
+        density: Probability that each cell is alive (0.0-1.0)
+        rng: random.Random instance (defaults to the module-level generator)
+
+    Returns:
+        Packed row (see automata.packed)
+    """
+    import random
+
+    getrandbits = rng.getrandbits if rng is not None else random.getrandbits
+    if width <= 0:
+        return 0
+
+    level = round(min(max(density, 0.0), 1.0) * 65536)
+    if level >= 65536:
+        return (1 << width) - 1
+    if level == 0:
+        return 0
+
+    # Consume the 16-bit binary fraction from its lowest set bit upwards:
+    # OR with fresh bits adds half the remaining mass, AND removes half.
+    position = (level & -level).bit_length() - 1
+    bits = getrandbits(width)
+    for position in range(position + 1, 16):
+        if (level >> position) & 1:
+            bits |= getrandbits(width)
+        else:
+            bits &= getrandbits(width)
+    return bits
+
+
+def initial_row(
+    width: int, pattern: str = "center", seed: int | None = None, density: float = 0.5
+) -> int:
+    """
+    Build a packed initial row.
+
+    Args:
+        width: Number of columns
+        pattern: "center" for a single live cell (as in initialize_grid()),
+            "random" for random cells, or a string of 0/1 characters placed
+            at the center of the row
+        seed: Random seed used by the "random" pattern
+        density: Fraction of live cells for the "random" pattern
+
+    Returns:
+        Packed row (see automata.packed)
+    """
+    import random
+
+    if pattern == "center":
+        return 1 << (width - 1 - width // 2) if width > 0 else 0
+    if pattern == "random":
+        return random_row(width, density, random.Random(seed))
+
+    if not pattern or set(pattern) - {"0", "1"} or len(pattern) > width:
+        raise ValueError(f"invalid initial pattern: {pattern!r}")
+    start = (width - len(pattern)) // 2
+    return int(pattern, 2) << (width - start - len(pattern))
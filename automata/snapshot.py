@@ -0,0 +1,307 @@
+"""Compact, checksummed snapshots of a running simulation.
+
+A snapshot holds what is needed to carry on from where a run stopped: the
+rule, step delay and mode, the generation number and either the retained
+window of packed rows or just the newest row. Resuming costs one decode of
+those rows, however many generations came before them. 2D runs store the
+live tiles of the Life plane instead of rows, and runs on an infinite tape
+record where their rows sit on the line.
+
+File layout (all integers little-endian):
+
+    offset  size  field
+    0       4     magic b"CASN"
+    4       2     format version
+    6       1     dimensions (1 or 2)
+    7       1     simulation mode (index into MODES)
+    8       4     rule number
+    12      8     step delay in seconds (float64)
+    20      8     generation of the newest row
+    28      8     width in cells
+    36      4     number of rows (1D) or tiles (2D)
+    40      2     length of the Life rule (UTF-8)
+    42      1     boundary (index into storage.BOUNDARIES)
+    43      8     absolute cell of the first column (int64, infinite tape)
+    51      n     Life rule, e.g. "B3/S23"
+    ...           1D: rows, oldest first, each row_nbytes(width) bytes
+                  2D: tiles, each int64 x, int64 y and TILE_BYTES bytes
+    end - 4 4     CRC-32 of everything before it
+
+Files are written to a temporary name and renamed into place, so an
+interrupted save never replaces a good snapshot; a truncated or corrupted
+file fails the length or checksum check on load. Version 1 files, which
+end the header at offset 42, load as torus runs.
+"""
+
+import os
+import struct
+import zlib
+from typing import NamedTuple
+
+from automata.life import TILE, LifeGrid
+from automata.packed import row_from_bytes, row_nbytes, row_to_bytes
+from automata.ringbuffer import RowRing
+from automata.rules import decode_rule
+from automata.simulation import start_analysis, start_history
+from automata.storage import BOUNDARIES
+from automata.tape import tape_from_row
+
+MAGIC = b"CASN"
+VERSION = 2
+MODES = ("none", "auto", "step")
+SNAPSHOT_ROWS = ["window", "last"]
+TILE_BYTES = TILE * TILE // 8
+
+_HEADER_V1 = struct.Struct("<4sHBBIdQQIH")
+_HEADER = struct.Struct("<4sHBBIdQQIHBq")
+_TILE_KEY = struct.Struct("<qq")
+_CRC = struct.Struct("<I")
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot is malformed, truncated or unsupported."""
+
+
+class Snapshot(NamedTuple):
+    """Decoded snapshot contents."""
+
+    dimensions: int
+    rule_number: int
+    step_delay: float
+    simulation_mode: str
+    generation: int  # Generation of the newest row (or of the Life plane)
+    width: int
+    life_rule: str
+    rows: list  # Packed rows, oldest first (1D)
+    tiles: dict  # (tile x, tile y) -> 4096-bit int (2D)
+    boundary: str = "torus"  # "torus" | "infinite" (1D)
+    origin: int = 0  # Absolute cell of the first column (infinite tape)
+
+
+def encode_snapshot(state, rows: str = "window") -> bytes:
+    """
+    Serialize the parts of a State needed to resume it.
+
+    Args:
+        state: State object
+        rows: "window" to keep every retained row, "last" for the newest
+            row only (1D runs)
+
+    Returns:
+        Snapshot file contents
+    """
+    if rows not in SNAPSHOT_ROWS:
+        raise ValueError(f"unknown snapshot rows: {rows!r}")
+    life_rule = state.life_rule.encode("utf-8")
+    if state.dimensions == 2:
+        items = sorted(state.life.tiles.items())
+        generation = state.life.generation
+        body = b"".join(
+            _TILE_KEY.pack(tx, ty) + tile.to_bytes(TILE_BYTES, "little")
+            for (tx, ty), tile in items
+        )
+    else:
+        items = [state.grid.latest()] if rows == "last" else list(state.grid)
+        generation = state.current_row
+        body = b"".join(row_to_bytes(bits, state.width) for bits in items)
+
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        state.dimensions,
+        MODES.index(state.simulation_mode),
+        state.rule_number,
+        state.step_delay,
+        generation,
+        state.width,
+        len(items),
+        len(life_rule),
+        BOUNDARIES.index(state.boundary),
+        state.origin,
+    )
+    data = header + life_rule + body
+    return data + _CRC.pack(zlib.crc32(data))
+
+
+def decode_snapshot(data: bytes) -> Snapshot:
+    """
+    Parse and verify snapshot file contents.
+
+    Args:
+        data: Bytes from encode_snapshot()
+
+    Returns:
+        Snapshot
+
+    Raises:
+        SnapshotError: If the data is not a complete, intact snapshot
+    """
+    if len(data) < _HEADER_V1.size + _CRC.size or data[:4] != MAGIC:
+        raise SnapshotError("not a snapshot file")
+    (version,) = struct.unpack_from("<H", data, 4)
+    if version == 1:
+        header = _HEADER_V1
+    elif version == VERSION:
+        header = _HEADER
+    else:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+    if len(data) < header.size + _CRC.size:
+        raise SnapshotError("snapshot is truncated or has trailing data")
+    (
+        _,
+        _,
+        dimensions,
+        mode,
+        rule_number,
+        step_delay,
+        generation,
+        width,
+        count,
+        rule_length,
+        *placement,
+    ) = header.unpack_from(data)
+    boundary, origin = placement or (0, 0)
+    if (
+        dimensions not in (1, 2)
+        or mode >= len(MODES)
+        or rule_number > 255
+        or boundary >= len(BOUNDARIES)
+    ):
+        raise SnapshotError("corrupt snapshot header")
+
+    offset = header.size + rule_length
+    if dimensions == 2:
+        record = _TILE_KEY.size + TILE_BYTES
+    else:
+        record = row_nbytes(width)
+    if len(data) != offset + count * record + _CRC.size:
+        raise SnapshotError("snapshot is truncated or has trailing data")
+    (crc,) = _CRC.unpack_from(data, len(data) - _CRC.size)
+    if crc != zlib.crc32(memoryview(data)[: -_CRC.size]):
+        raise SnapshotError("snapshot checksum mismatch")
+
+    life_rule = data[header.size : offset].decode("utf-8")
+    rows = []
+    tiles = {}
+    for _ in range(count):
+        if dimensions == 2:
+            key = _TILE_KEY.unpack_from(data, offset)
+            start = offset + _TILE_KEY.size
+            tiles[key] = int.from_bytes(data[start : start + TILE_BYTES], "little")
+        else:
+            rows.append(row_from_bytes(data[offset : offset + record], width))
+        offset += record
+    if dimensions == 1 and not rows:
+        raise SnapshotError("snapshot contains no rows")
+
+    return Snapshot(
+        dimensions,
+        rule_number,
+        step_delay,
+        MODES[mode],
+        generation,
+        width,
+        life_rule,
+        rows,
+        tiles,
+        BOUNDARIES[boundary],
+        origin,
+    )
+
+
+def save_snapshot(state, path: str, rows: str = "window") -> int:
+    """
+    Write a snapshot atomically.
+
+    Args:
+        state: State object
+        path: Destination file
+        rows: "window" or "last" (see encode_snapshot())
+
+    Returns:
+        Number of bytes written
+    """
+    data = encode_snapshot(state, rows)
+    temporary = f"{path}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+    except BaseException:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        raise
+    return len(data)
+
+
+def load_snapshot(path: str) -> Snapshot:
+    """
+    Read and verify a snapshot file.
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        Snapshot
+
+    Raises:
+        OSError: If the file cannot be read
+        SnapshotError: If the file is not a complete, intact snapshot
+    """
+    with open(path, "rb") as f:
+        return decode_snapshot(f.read())
+
+
+def restore_state(state, snapshot: Snapshot) -> None:
+    """
+    Continue a State from a snapshot.
+
+    Any replay is dropped and the simulation carries on live. The snapshot
+    rows refill the ring buffer (keeping the newest state.height of them)
+    with their original generation numbers. Cycle detection is off for
+    the resumed run, since the rows before the snapshot are gone, and the
+    scrollable history starts at the oldest restored row. On an infinite
+    tape the newest row becomes the active span again.
+
+    Args:
+        state: State object to overwrite
+        snapshot: Snapshot from load_snapshot()
+    """
+    state.replay = None
+    state.dimensions = snapshot.dimensions
+    state.rule_number = snapshot.rule_number
+    state.rule_transitions = decode_rule(snapshot.rule_number)
+    state.step_delay = snapshot.step_delay
+    state.simulation_mode = snapshot.simulation_mode
+    state.step_requested = False
+    state.width = state.base_width = snapshot.width
+    state.life_rule = snapshot.life_rule
+    state.boundary = snapshot.boundary
+    state.origin = snapshot.origin
+    state.tape = None
+    state.history = None
+    state.cycle = None
+    state.view_x = state.view_y = 0
+
+    if snapshot.dimensions == 2:
+        state.analysis = None
+        state.life = LifeGrid(snapshot.life_rule)
+        state.life.restore(snapshot.tiles, snapshot.generation)
+        state.current_row = snapshot.generation
+        return
+
+    grid = RowRing(state.height)
+    for bits in snapshot.rows[-state.height :]:
+        grid.append(bits)
+    grid.next_generation = snapshot.generation + 1
+    state.grid = grid
+    state.current_row = snapshot.generation
+    if snapshot.boundary == "infinite":
+        state.tape = tape_from_row(grid.latest(), state.width, state.origin)
+    else:
+        state.history = start_history(state)
+    start_analysis(state)
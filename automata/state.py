@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass, field
 
+from automata.ringbuffer import RowRing
+
 
 @dataclass
 class State:
@@ -19,16 +21,69 @@ class State:
     menu_mode: str = "main"  # "main" | "rule_input" | "delay_input"
     menu_input: str = ""
 
-    # Grid state
-    grid: list = field(default_factory=list)
-    current_row: int = 0
+    # Grid state: ring buffer of the newest packed rows
+    grid: RowRing | None = None
+    current_row: int = 0  # Generation number of the newest row
+
+    # Cycle detection for the current run (cycles.CycleDetector)
+    cycle: object = None
+
+    # Checkpointed access to rows older than the ring (history.History),
+    # with a checkpoint every history_interval generations (0 tunes the
+    # interval to history_budget bytes)
+    history: object = None
+    history_interval: int = 0
+    history_budget: int = 16 << 20
+
+    # 1D boundary: "torus" wraps rows around; "infinite" evolves the
+    # active span of an unbounded line (tape.Tape) and widens the retained
+    # rows to fit, column 0 being absolute cell `origin`
+    boundary: str = "torus"  # "torus" | "infinite"
+    tape: object = None
+    origin: int = 0
+
+    # 1 for elementary rows; 2 for a Life-like plane (life.LifeGrid)
+    dimensions: int = 1
+    life: object = None
+    life_rule: str = "B3/S23"
+
+    # Recorded spacetime being replayed (storage.SpacetimeReader), if any
+    replay: object = None
+
+    # Viewport: leftmost column, lines scrolled up from the newest
+    # generation (top row in 2D), index into viewport.ZOOM_LEVELS, and dot
+    # aggregation
+    view_x: int = 0
+    view_y: int = 0
+    view_zoom: int = 0
+    view_aggregate: str = "any"  # "any" | "density"
+
+    # Live per-generation metrics on the status line (analysis.LiveAnalysis)
+    show_metrics: bool = False
+    analysis: object = None
+
+    # Hot-path timing (profiling.Profiler) and the status line overlay
+    profiler: object = None
+    show_stats: bool = False
+    stats_text: str = ""
+
+    # Snapshot file used by the Save/Load Snapshot menu entries, and
+    # whether saves keep the retained window or only the newest row
+    snapshot_path: str = "automata.snap"
+    snapshot_rows: str = "window"  # "window" | "last"
+
+    # One-line result of the last menu action, shown on the status line
+    message: str = ""
 
     # Application control
     running: bool = True
 
-    # Display dimensions
+    # Display dimensions (height is the number of generations retained)
     width: int = 80
     height: int = 160
+    # Width a reset starts from; an infinite tape widens width as it grows
+    # (None until the first reset, which takes the initial width)
+    base_width: int | None = None
 
     # Precomputed rule lookup table
     rule_transitions: list = field(default_factory=list)
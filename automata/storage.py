@@ -0,0 +1,281 @@
+"""Bit-packed on-disk spacetime storage with memory-mapped row access.
+
+File layout (all integers little-endian):
+
+    offset  size  field
+    0       4     magic b"CAST"
+    4       2     format version
+    6       2     boundary code (index into BOUNDARIES)
+    8       4     rule number
+    12      8     width in cells
+    20      4     length of the initial condition description
+    24      n     initial condition description (UTF-8)
+    ...           zero padding to a multiple of 8 bytes
+    header  ...   rows, each row_nbytes(width) bytes (see packed.row_to_bytes)
+
+The number of rows is derived from the file size, so a writer can keep
+appending and an interrupted write loses at most the partial final row.
+"""
+
+import mmap
+import struct
+
+from automata.packed import row_from_bytes, row_nbytes, row_to_bytes
+
+MAGIC = b"CAST"
+VERSION = 1
+BOUNDARIES = ("torus", "infinite")
+
+_HEADER = struct.Struct("<4sHHIQI")
+
+
+class StorageError(Exception):
+    """Raised when a spacetime file is malformed or unsupported."""
+
+
+def _header_bytes(rule_number: int, width: int, boundary: str, init: str) -> bytes:
+    """
+    Encode a file header.
+
+    Args:
+        rule_number: Rule used to produce the rows
+        width: Number of cells per row
+        boundary: Boundary condition name from BOUNDARIES
+        init: Free-form description of the initial condition
+
+    Returns:
+        Header bytes, padded to a multiple of 8
+    """
+    if boundary not in BOUNDARIES:
+        raise ValueError(f"unknown boundary: {boundary!r}")
+    description = init.encode("utf-8")
+    header = _HEADER.pack(
+        MAGIC, VERSION, BOUNDARIES.index(boundary), rule_number, width, len(description)
+    )
+    header += description
+    return header + b"\0" * (-len(header) % 8)
+
+
+class SpacetimeWriter:
+    """Append packed rows to a spacetime file as they are produced."""
+
+    def __init__(
+        self,
+        path: str,
+        rule_number: int,
+        width: int,
+        boundary: str = "torus",
+        init: str = "",
+    ):
+        """
+        Args:
+            path: File to create (truncated if it exists)
+            rule_number: Rule used to produce the rows
+            width: Number of cells per row
+            boundary: Boundary condition name from BOUNDARIES
+            init: Free-form description of the initial condition
+        """
+        self.width = width
+        self.rows_written = 0
+        self._file = open(path, "wb")
+        self._file.write(_header_bytes(rule_number, width, boundary, init))
+
+    def append(self, bits: int) -> None:
+        """
+        Write the next generation.
+
+        Args:
+            bits: Packed row
+        """
+        self._file.write(row_to_bytes(bits, self.width))
+        self.rows_written += 1
+
+    def extend(self, rows) -> None:
+        """
+        Write several generations.
+
+        Args:
+            rows: Iterable of packed rows
+        """
+        for bits in rows:
+            self.append(bits)
+
+    def flush(self) -> None:
+        """Push buffered rows to the operating system."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SpacetimeReader:
+    """
+    Random access to a spacetime file through mmap.
+
+    Row lookups are O(1): row t starts at ``header_size + t * stride``.
+    Views returned by row_view() and rows_view() point straight into the
+    mapping, which stays open until the last of them is released.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Spacetime file written by SpacetimeWriter
+        """
+        self._file = open(path, "rb")
+        self._mmap = None
+        try:
+            self._read_header()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_header(self) -> None:
+        """Parse the header and map the file."""
+        fixed = self._file.read(_HEADER.size)
+        if len(fixed) < _HEADER.size:
+            raise StorageError("file too short for a spacetime header")
+
+        magic, version, boundary, rule, width, init_len = _HEADER.unpack(fixed)
+        if magic != MAGIC:
+            raise StorageError("not a spacetime file")
+        if version != VERSION:
+            raise StorageError(f"unsupported spacetime version {version}")
+        if boundary >= len(BOUNDARIES):
+            raise StorageError(f"unknown boundary code {boundary}")
+
+        self.rule_number = rule
+        self.width = width
+        self.boundary = BOUNDARIES[boundary]
+        self.init = self._file.read(init_len).decode("utf-8")
+        self.stride = row_nbytes(width)
+
+        header_size = _HEADER.size + init_len
+        self.header_size = header_size + (-header_size % 8)
+
+        self._file.seek(0, 2)
+        size = self._file.tell()
+        self.generations = max(0, size - self.header_size) // max(self.stride, 1)
+        if size:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap) if self._mmap is not None else None
+
+    def __len__(self) -> int:
+        return self.generations
+
+    def _offset(self, t: int) -> int:
+        """Return the byte offset of row t, validating the index."""
+        if t < 0:
+            t += self.generations
+        if not 0 <= t < self.generations:
+            raise IndexError("row index out of range")
+        return self.header_size + t * self.stride
+
+    def row_view(self, t: int) -> memoryview:
+        """
+        Return the stored bytes of row t without copying.
+
+        Args:
+            t: Generation number (negative values count from the end)
+
+        Returns:
+            memoryview of row_nbytes(width) bytes
+        """
+        offset = self._offset(t)
+        return self._view[offset : offset + self.stride]
+
+    def rows_view(self, start: int, stop: int) -> memoryview:
+        """
+        Return rows start..stop-1 as a 2D view without copying.
+
+        The result has shape (stop - start, stride) and can be wrapped by
+        numpy.asarray() for vectorized processing.
+
+        Args:
+            start: First generation
+            stop: One past the last generation
+
+        Returns:
+            2D memoryview of unsigned bytes
+        """
+        start, stop, _ = slice(start, stop).indices(self.generations)
+        stop = max(start, stop)
+        offset = self.header_size + start * self.stride
+        block = self._view[offset : offset + (stop - start) * self.stride]
+        return block.cast("B", (stop - start, self.stride))
+
+    def row(self, t: int) -> int:
+        """
+        Return row t as a packed int.
+
+        Args:
+            t: Generation number (negative values count from the end)
+
+        Returns:
+            Packed row
+        """
+        return row_from_bytes(self.row_view(t), self.width)
+
+    def region(self, start: int, stop: int, x0: int, x1: int) -> list[int]:
+        """
+        Extract a rectangular region as packed rows.
+
+        Only the bytes that overlap columns x0..x1-1 are read from each row.
+
+        Args:
+            start: First generation
+            stop: One past the last generation
+            x0: First column
+            x1: One past the last column
+
+        Returns:
+            List of packed rows, each x1 - x0 cells wide
+        """
+        x0 = max(0, x0)
+        x1 = min(self.width, x1)
+        if x1 <= x0:
+            return [0] * max(0, stop - start)
+
+        first_byte = x0 // 8
+        last_byte = (x1 + 7) // 8
+        shift = last_byte * 8 - x1
+        mask = (1 << (x1 - x0)) - 1
+
+        region = []
+        for t in range(start, stop):
+            offset = self._offset(t)
+            chunk = self._view[offset + first_byte : offset + last_byte]
+            region.append((int.from_bytes(chunk, "big") >> shift) & mask)
+        return region
+
+    def __iter__(self):
+        for t in range(self.generations):
+            yield self.row(t)
+
+    def close(self) -> None:
+        """Release the mapping and close the file."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views handed out by row_view() are still alive; the
+                # mapping is released when the last of them goes away
+                pass
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
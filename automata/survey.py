@@ -0,0 +1,370 @@
+"""Rule-space survey: summary statistics for many rules and initial rows.
+
+Every (rule, width, seed, generations) run is independent, so runs are
+fanned out over a process pool. Results are appended to a JSON-lines cache
+as they finish; a rerun, or a sweep that overlaps an earlier one, only
+computes the runs the cache does not already hold.
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from automata.cycles import CycleDetector
+from automata.entropy import block_entropy
+from automata.packed import evolve_packed_row
+from automata.simulation import random_row
+
+# Bump whenever a change to the engine or the metrics alters results, so
+# stale cache entries are ignored rather than reused.
+ENGINE_VERSION = 1
+
+OUTPUT_FORMATS = ["csv", "jsonl"]
+
+
+class SurveyResult(NamedTuple):
+    """Summary of one run from a random initial row."""
+
+    rule: int
+    width: int
+    seed: int
+    generations: int
+    density: float  # Live cell fraction of the final row
+    entropy: float  # Block entropy of the final row, bits per cell
+    transient: int | None  # None if no cycle within the run
+    period: int | None
+    spread: float  # Cells per generation a single seed's influence spreads
+
+
+def spread_rate(rule_number: int, width: int, generations: int) -> float:
+    """
+    Measure how fast a single live cell's influence spreads.
+
+    The seeded run is compared with the run from an all-dead row, so rules
+    that flip the background are measured by the region that differs from
+    it. Measurement stops before the region could wrap around the torus.
+
+    Args:
+        rule_number: Integer 0-255 representing the CA rule
+        width: Number of cells in the row
+        generations: Maximum generations to run
+
+    Returns:
+        Average spread per side in cells per generation (0 to 1)
+    """
+    steps = min(generations, (width - 1) // 2)
+    if steps <= 0:
+        return 0.0
+    background = 0
+    bits = 1 << (width - 1 - width // 2)
+    for _ in range(steps):
+        background = evolve_packed_row(background, rule_number, width)
+        bits = evolve_packed_row(bits, rule_number, width)
+    damage = bits ^ background
+    if not damage:
+        return 0.0
+    extent = damage.bit_length() - (damage & -damage).bit_length() + 1
+    return (extent - 1) / (2 * steps)
+
+
+def survey_run(rule_number: int, width: int, seed: int, generations: int):
+    """
+    Run one survey configuration.
+
+    Args:
+        rule_number: Integer 0-255 representing the CA rule
+        width: Number of cells in the row
+        seed: Seed for the random initial row (density 0.5)
+        generations: Generations to run
+
+    Returns:
+        SurveyResult
+    """
+    bits = random_row(width, rng=random.Random(seed))
+    detector = CycleDetector(bits, rule_number, width)
+    for generation in range(1, generations + 1):
+        bits = evolve_packed_row(bits, rule_number, width)
+        if detector.observe(bits):
+            # Generations past here repeat the cycle; jump to the last one
+            remaining = (generations - generation) % detector.period
+            for _ in range(remaining):
+                bits = evolve_packed_row(bits, rule_number, width)
+            break
+
+    return SurveyResult(
+        rule_number,
+        width,
+        seed,
+        generations,
+        bits.bit_count() / width,
+        block_entropy(bits, width),
+        detector.transient,
+        detector.period,
+        spread_rate(rule_number, width, generations),
+    )
+
+
+def _survey_task(task: tuple[int, int, int, int]) -> SurveyResult:
+    """Pool entry point taking the run configuration as one tuple."""
+    return survey_run(*task)
+
+
+class SurveyCache:
+    """
+    Append-only JSON-lines store of survey results.
+
+    Entries are keyed by (rule, width, seed, generations, engine version);
+    entries written by another engine version are skipped when loading.
+    """
+
+    def __init__(self, path: str | None):
+        """
+        Args:
+            path: Cache file (created on first write), or None for no cache
+        """
+        self.path = path
+        self.results = {}
+        if path is None or not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Truncated by an interrupted run
+                if entry.pop("engine", None) != ENGINE_VERSION:
+                    continue
+                try:
+                    result = SurveyResult(**entry)
+                except TypeError:
+                    continue
+                self.results[result[:4]] = result
+
+    def get(self, key: tuple[int, int, int, int]) -> SurveyResult | None:
+        """
+        Look up a cached result.
+
+        Args:
+            key: (rule, width, seed, generations)
+
+        Returns:
+            Cached SurveyResult, or None
+        """
+        return self.results.get(key)
+
+    def add(self, results) -> None:
+        """
+        Store results, appending them to the cache file.
+
+        Args:
+            results: Iterable of SurveyResult
+        """
+        results = list(results)
+        for result in results:
+            self.results[result[:4]] = result
+        if self.path is None or not results:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            for result in results:
+                entry = result._asdict()
+                entry["engine"] = ENGINE_VERSION
+                f.write(json.dumps(entry) + "\n")
+
+
+def run_survey(
+    rules,
+    widths,
+    seeds,
+    generations: int,
+    cache: SurveyCache | None = None,
+    workers: int | None = None,
+) -> list[SurveyResult]:
+    """
+    Survey every combination of rule, width and seed.
+
+    Args:
+        rules: Rule numbers 0-255
+        widths: Row widths
+        seeds: Seeds for the random initial rows
+        generations: Generations per run
+        cache: Cache to consult and extend (default: none)
+        workers: Worker processes (default: one per CPU; 1 runs inline)
+
+    Returns:
+        One SurveyResult per combination, in rule, width, seed order
+    """
+    if cache is None:
+        cache = SurveyCache(None)
+    keys = [
+        (rule, width, seed, generations)
+        for rule in rules
+        for width in widths
+        for seed in seeds
+    ]
+    missing = [key for key in dict.fromkeys(keys) if cache.get(key) is None]
+
+    if missing:
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            cache.add(map(_survey_task, missing))
+        else:
+            chunksize = max(1, len(missing) // (workers * 8))
+            batch = []
+            try:
+                with ProcessPoolExecutor(workers) as pool:
+                    results = pool.map(_survey_task, missing, chunksize=chunksize)
+                    for result in results:
+                        batch.append(result)
+                        if len(batch) >= 256:
+                            cache.add(batch)
+                            batch = []
+            finally:
+                # Keep finished runs even if the sweep is interrupted
+                cache.add(batch)
+
+    return [cache.get(key) for key in keys]
+
+
+def parse_int_list(text: str) -> list[int]:
+    """
+    Parse a comma-separated list of integers and inclusive ranges.
+
+    Args:
+        text: For example "30,90,100-110"
+
+    Returns:
+        List of integers in the order given
+
+    Raises:
+        ValueError: If an item is not an integer or a range
+    """
+    values = []
+    for item in text.split(","):
+        low, sep, high = item.strip().partition("-")
+        if sep:
+            values.extend(range(int(low), int(high) + 1))
+        else:
+            values.append(int(low))
+    return values
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the survey subcommand.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m automata survey",
+        description="Compute summary statistics across rules and random initial rows.",
+    )
+    parser.add_argument(
+        "-r",
+        "--rules",
+        default="0-255",
+        help='rules to survey, e.g. "0-255" or "30,110"',
+    )
+    parser.add_argument(
+        "-w", "--widths", default="80", help='row widths, e.g. "64,128,256"'
+    )
+    parser.add_argument(
+        "-s", "--seeds", default="0-9", help="seeds for the random initial rows"
+    )
+    parser.add_argument(
+        "-g", "--generations", type=int, default=1000, help="generations per run"
+    )
+    parser.add_argument(
+        "-c",
+        "--cache",
+        default="survey-cache.jsonl",
+        help='result cache file ("" to disable)',
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="worker processes"
+    )
+    parser.add_argument(
+        "-f", "--format", choices=OUTPUT_FORMATS, default="csv", help="output format"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file (default: standard output)"
+    )
+    return parser
+
+
+def write_results(out, results, fmt: str) -> None:
+    """
+    Write survey results as CSV or JSON lines.
+
+    Args:
+        out: Writable text file object
+        results: Iterable of SurveyResult
+        fmt: One of OUTPUT_FORMATS
+    """
+    if fmt == "csv":
+        writer = csv.writer(out)
+        writer.writerow(SurveyResult._fields)
+        writer.writerows(
+            ["" if value is None else value for value in result] for result in results
+        )
+    else:
+        for result in results:
+            out.write(json.dumps(result._asdict()) + "\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Entry point for the survey subcommand.
+
+    Args:
+        argv: Command line arguments after "survey" (defaults to sys.argv)
+
+    Returns:
+        Exit code
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        rules = parse_int_list(args.rules)
+        widths = parse_int_list(args.widths)
+        seeds = parse_int_list(args.seeds)
+    except ValueError:
+        parser.error("--rules, --widths and --seeds take integers and ranges")
+    if not all(0 <= rule <= 255 for rule in rules):
+        parser.error("--rules must be between 0 and 255")
+    if not all(width >= 1 for width in widths):
+        parser.error("--widths must be at least 1")
+    if args.generations < 0:
+        parser.error("--generations must not be negative")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    try:
+        results = run_survey(
+            rules,
+            widths,
+            seeds,
+            args.generations,
+            SurveyCache(args.cache or None),
+            args.workers,
+        )
+    except KeyboardInterrupt:
+        return 130
+
+    if args.output == "-":
+        try:
+            write_results(sys.stdout, results, args.format)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            write_results(out, results, args.format)
+    return 0
@@ -0,0 +1,140 @@
+"""Unbounded tape for quiescent elementary rules.
+
+Rules that map 000 to 0 (the even rule numbers) leave every cell outside
+the pattern's light cone dead, so an infinite line only ever needs its
+active span: the cells from the leftmost to the rightmost live cell. A
+Tape stores that span as a packed row (see automata.packed) plus the
+absolute position of its first cell. Each generation evaluates the span
+and one cell either side with no wrap-around, then trims dead cells off
+both ends, so the cost follows the size of the pattern rather than any
+allocated width, and nothing ever wraps onto the other edge.
+"""
+
+from typing import NamedTuple
+
+from automata.packed import apply_rule, row_mask
+
+
+class Tape(NamedTuple):
+    """Active span of an infinite row."""
+
+    bits: int  # Packed span, cell `left` in the most significant bit
+    left: int  # Absolute position of the first cell of the span
+    width: int  # Cells in the span (0 when every cell is dead)
+
+    @property
+    def right(self) -> int:
+        """Absolute position one past the last cell of the span."""
+        return self.left + self.width
+
+
+def is_quiescent(rule_number: int) -> bool:
+    """
+    Check whether a rule keeps an all-dead background dead.
+
+    Args:
+        rule_number: Integer 0-255 representing the CA rule
+
+    Returns:
+        True if the rule maps 000 to 0
+    """
+    return not rule_number & 1
+
+
+def trim_tape(bits: int, left: int, width: int) -> Tape:
+    """
+    Build a Tape, dropping dead cells from both ends of the span.
+
+    Args:
+        bits: Packed cells
+        left: Absolute position of the first cell
+        width: Number of cells in bits
+
+    Returns:
+        Tape whose first and last cells are alive
+    """
+    if not bits:
+        return Tape(0, 0, 0)
+    trailing = (bits & -bits).bit_length() - 1
+    bits >>= trailing
+    span = bits.bit_length()
+    return Tape(bits, left + width - trailing - span, span)
+
+
+def evolve_tape(tape: Tape, rule_number: int) -> Tape:
+    """
+    Compute the next generation of an infinite row.
+
+    Args:
+        tape: Current row
+        rule_number: Even rule number (see is_quiescent())
+
+    Returns:
+        Next row
+
+    Raises:
+        ValueError: If the rule turns dead neighborhoods alive
+    """
+    if not is_quiescent(rule_number):
+        raise ValueError(f"rule {rule_number} is not quiescent (000 -> 1)")
+    if not tape.width:
+        return tape
+    # The span grows by at most one cell each side; the cells beyond are dead
+    width = tape.width + 2
+    center = tape.bits << 1
+    result = apply_rule(tape.bits, center, center << 1, rule_number, row_mask(width))
+    return trim_tape(result, tape.left - 1, width)
+
+
+def tape_from_row(bits: int, width: int, origin: int = 0) -> Tape:
+    """
+    Place a packed row on the infinite line.
+
+    Args:
+        bits: Packed row
+        width: Number of cells in the row
+        origin: Absolute position of the row's first cell
+
+    Returns:
+        Tape holding the row's live cells
+    """
+    return trim_tape(bits & row_mask(width), origin, width)
+
+
+def tape_to_row(tape: Tape, origin: int, width: int) -> int:
+    """
+    Cut a fixed window out of the infinite line.
+
+    Args:
+        tape: Row to read
+        origin: Absolute position of the window's first cell
+        width: Number of cells in the window
+
+    Returns:
+        Packed row of the window; cells outside the span are dead
+    """
+    shift = origin + width - tape.right
+    bits = tape.bits << shift if shift >= 0 else tape.bits >> -shift
+    return bits & row_mask(width)
+
+
+def iter_tape_rows(
+    tape: Tape, rule_number: int, origin: int, width: int, generations: int
+):
+    """
+    Yield a fixed window of successive generations, starting with the first.
+
+    Args:
+        tape: Initial row
+        rule_number: Even rule number (see is_quiescent())
+        origin: Absolute position of the window's first cell
+        width: Number of cells in the window
+        generations: Number of generations to compute after the initial row
+
+    Yields:
+        generations + 1 packed rows of width cells
+    """
+    yield tape_to_row(tape, origin, width)
+    for _ in range(generations):
+        tape = evolve_tape(tape, rule_number)
+        yield tape_to_row(tape, origin, width)
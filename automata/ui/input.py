@@ -15,17 +15,20 @@ def configure_input(stdscr) -> None:
     stdscr.keypad(True)  # Enable special keys
 
 
-def read_key(stdscr) -> int | None:
+def read_key(stdscr, timeout_ms: int = 0) -> int | None:
     """
-    Read a key from input in non-blocking mode.
+    Read a key from input, waiting at most timeout_ms milliseconds.
 
     Args:
         stdscr: curses window object
+        timeout_ms: Milliseconds to wait (0 returns immediately, -1 waits
+            until a key arrives)
 
     Returns:
         Key code (int) if a key was pressed, None otherwise
     """
     try:
+        stdscr.timeout(timeout_ms)
         key = stdscr.getch()
         return key if key != -1 else None
     except curses.error:
@@ -40,7 +43,9 @@ def handle_input(state, key: int) -> None:
         state: State object
         key: Key code from curses
     """
+    from automata.simulation import start_analysis
     from automata.ui.menu import handle_menu_input, open_menu
+    from automata.ui.viewport import handle_view_input
 
     if state.menu_open:
         handle_menu_input(state, key)
@@ -48,6 +53,13 @@ def handle_input(state, key: int) -> None:
         # Handle keys during simulation
         if key == 27:  # ESC
             open_menu(state)
+        elif handle_view_input(state, key):
+            pass
+        elif key == ord("p"):  # Performance overlay
+            state.show_stats = not state.show_stats
+        elif key == ord("m"):  # Live metrics
+            state.show_metrics = not state.show_metrics
+            start_analysis(state)
         elif state.simulation_mode == "none":
             # Waiting for user to choose mode
             if key == 13 or key == 10:  # Enter key
@@ -1,13 +1,20 @@
 """Menu system for the cellular automata application."""
 
+from automata.life import parse_rule
 from automata.simulation import reset_simulation
-
+from automata.snapshot import SnapshotError, load_snapshot, restore_state, save_snapshot
+from automata.tape import is_quiescent
 
 MENU_ITEMS = [
     "Set Rule Number",
     "Set Step Delay",
+    "Set Life Rule",
     "Toggle Mode",
+    "Switch 1D/2D",
+    "Switch Torus/Infinite",
     "Reset Simulation",
+    "Save Snapshot",
+    "Load Snapshot",
     "Resume",
     "Quit",
 ]
@@ -24,6 +31,7 @@ def open_menu(state) -> None:
     state.menu_mode = "main"
     state.menu_selection = 0
     state.menu_input = ""
+    state.message = ""
 
 
 def handle_menu_input(state, key: int) -> None:
@@ -40,6 +48,8 @@ def handle_menu_input(state, key: int) -> None:
         handle_text_input(state, key, "rule_input")
     elif state.menu_mode == "delay_input":
         handle_text_input(state, key, "delay_input")
+    elif state.menu_mode == "life_rule_input":
+        handle_text_input(state, key, "life_rule_input")
 
 
 def handle_main_menu(state, key: int) -> None:
@@ -62,12 +72,12 @@ def handle_main_menu(state, key: int) -> None:
 
 def handle_text_input(state, key: int, input_mode: str) -> None:
     """
-    Handle text input for rule number or delay.
+    Handle text input for rule number, delay or Life rule.
 
     Args:
         state: State object
         key: Key code
-        input_mode: "rule_input" or "delay_input"
+        input_mode: "rule_input", "delay_input" or "life_rule_input"
     """
     if key == 27:  # ESC to cancel
         state.menu_mode = "main"
@@ -81,6 +91,10 @@ def handle_text_input(state, key: int, input_mode: str) -> None:
     elif key == ord(".") and input_mode == "delay_input":  # Allow decimal point
         if "." not in state.menu_input:
             state.menu_input += chr(key)
+    elif input_mode == "life_rule_input" and key < 128:
+        # B/S notation such as B36/S23, or a preset name
+        if chr(key).isalpha() or key == ord("/"):
+            state.menu_input += chr(key)
 
 
 def confirm_text_input(state, input_mode: str) -> None:
@@ -89,12 +103,15 @@ def confirm_text_input(state, input_mode: str) -> None:
 
     Args:
         state: State object
-        input_mode: "rule_input" or "delay_input"
+        input_mode: "rule_input", "delay_input" or "life_rule_input"
     """
     if input_mode == "rule_input":
         try:
             rule = int(state.menu_input)
-            if 0 <= rule <= 255:
+            if state.boundary == "infinite" and not is_quiescent(rule):
+                state.message = f"Rule {rule} is not quiescent; use an even rule"
+                state.menu_input = ""
+            elif 0 <= rule <= 255:
                 state.rule_number = rule
                 reset_simulation(state)
                 state.menu_mode = "main"
@@ -110,6 +127,17 @@ def confirm_text_input(state, input_mode: str) -> None:
                 state.menu_input = ""
         except ValueError:
             state.menu_input = ""
+    elif input_mode == "life_rule_input":
+        try:
+            parse_rule(state.menu_input)
+        except ValueError:
+            state.menu_input = ""
+        else:
+            state.life_rule = state.menu_input
+            if state.dimensions == 2:
+                reset_simulation(state)
+            state.menu_mode = "main"
+            state.menu_input = ""
 
 
 def apply_menu_selection(state) -> None:
@@ -127,14 +155,58 @@ def apply_menu_selection(state) -> None:
     elif selection == "Set Step Delay":
         state.menu_mode = "delay_input"
         state.menu_input = str(state.step_delay)
+    elif selection == "Set Life Rule":
+        state.menu_mode = "life_rule_input"
+        state.menu_input = state.life_rule
     elif selection == "Toggle Mode":
         if state.simulation_mode == "auto":
             state.simulation_mode = "step"
         elif state.simulation_mode == "step":
             state.simulation_mode = "auto"
+    elif selection == "Switch 1D/2D":
+        # Recorded spacetimes are always 1D
+        if state.replay is None:
+            state.dimensions = 3 - state.dimensions
+            state.view_x = state.view_y = 0
+            reset_simulation(state)
+            state.menu_open = False
+    elif selection == "Switch Torus/Infinite":
+        # Recorded spacetimes keep the boundary they were recorded with
+        if state.replay is None:
+            if state.boundary == "torus" and not is_quiescent(state.rule_number):
+                state.message = (
+                    f"Rule {state.rule_number} is not quiescent; "
+                    "the infinite tape needs an even rule"
+                )
+            else:
+                state.boundary = "infinite" if state.boundary == "torus" else "torus"
+                state.view_x = 0
+                if state.dimensions == 1:
+                    reset_simulation(state)
+                state.message = f"Boundary: {state.boundary}"
+            state.menu_open = False
     elif selection == "Reset Simulation":
         reset_simulation(state)
         state.menu_open = False
+    elif selection == "Save Snapshot":
+        try:
+            size = save_snapshot(state, state.snapshot_path, state.snapshot_rows)
+        except OSError as exc:
+            state.message = f"Save failed: {exc.strerror or exc}"
+        else:
+            state.message = f"Saved {state.snapshot_path} ({size} bytes)"
+        state.menu_open = False
+    elif selection == "Load Snapshot":
+        try:
+            snapshot = load_snapshot(state.snapshot_path)
+        except OSError as exc:
+            state.message = f"Load failed: {exc.strerror or exc}"
+        except SnapshotError as exc:
+            state.message = f"Load failed: {exc}"
+        else:
+            restore_state(state, snapshot)
+            state.message = f"Resumed at generation {state.current_row}"
+        state.menu_open = False
     elif selection == "Resume":
         state.menu_open = False
     elif selection == "Quit":
@@ -1,37 +1,220 @@
 """Rendering system for the cellular automata application."""
 
+import curses
+import time
+
+from automata.simulation import first_available, rows_window
 from automata.ui.menu import MENU_ITEMS
+from automata.ui.viewport import (
+    cells_per_char,
+    clamp_view,
+    describe_view,
+    render_plane_lines,
+    render_zoomed_lines,
+    view_left,
+)
+
+PANEL_HEIGHT = 3  # Rule panel lines plus separator
+ROW_CACHE_LIMIT = 4096
+
+_CELL_GLYPHS = str.maketrans("01", " █")
 
 
-def render(stdscr, state) -> None:
+class Frame:
+    """
+    What is currently on screen, so render() only sends what changed.
+
+    Holds the lines last drawn, the state they were drawn from and a cache
+    of formatted grid rows. Create one per window and pass it to every
+    render() call.
+    """
+
+    def __init__(self):
+        self.size = None  # (height, width) of the last frame
+        self.key = None  # render_key() of the last frame
+        self.lines = []  # Line currently shown on each screen row
+        self.grid = None  # Row buffer the grid was drawn from
+        self.grid_top = None  # Generation shown on the first grid line
+        self.row_cache = {}  # (row, row width, screen width, x) -> line
+
+    def invalidate(self) -> None:
+        """Force the next render() to redraw every line."""
+        self.size = None
+        self.key = None
+
+
+def render_key(state, width: int, height: int) -> tuple:
+    """
+    Summarize everything that affects the display.
+
+    Args:
+        state: State object
+        width: Terminal width
+        height: Terminal height
+
+    Returns:
+        Tuple that changes whenever the screen content would
+    """
+    cycle_found = state.cycle is not None and state.cycle.found
+    analysis = state.analysis.summary() if state.analysis is not None else None
+    return (
+        width,
+        height,
+        id(state.grid),
+        state.current_row,
+        state.rule_number,
+        state.step_delay,
+        state.simulation_mode,
+        state.menu_open,
+        state.menu_mode,
+        state.menu_selection,
+        state.menu_input,
+        cycle_found,
+        state.view_x,
+        state.view_y,
+        state.view_zoom,
+        state.view_aggregate,
+        state.dimensions,
+        id(state.life),
+        state.stats_text,
+        state.show_metrics,
+        analysis,
+        state.message,
+    )
+
+
+def grid_bounds(height: int) -> tuple[int, int]:
+    """
+    Locate the CA grid on screen.
+
+    Args:
+        height: Terminal height
+
+    Returns:
+        (first grid line, number of grid lines)
+    """
+    grid_start = PANEL_HEIGHT + 1
+    grid_height = max(height - grid_start - 1, 0)  # Reserve bottom for status
+    return grid_start, grid_height
+
+
+def render(stdscr, state, frame: Frame | None = None) -> bool:
     """
     Main rendering entry point.
 
+    Only lines that differ from the previous frame are written, nothing at
+    all is done when the state is unchanged, and output is flushed once
+    with noutrefresh()/doupdate(). When new generations push the grid up,
+    the grid region is scrolled so only the new rows have to be drawn.
+
+    When state.profiler is set, building the lines and writing them out
+    are timed as the "build" and "output" sections.
+
     Args:
         stdscr: curses window object
         state: State object
+        frame: Frame from the previous call (a fresh frame redraws all)
+
+    Returns:
+        True if a frame was drawn, False if nothing had changed
     """
-    stdscr.clear()
+    if frame is None:
+        frame = Frame()
 
     try:
         height, width = stdscr.getmaxyx()
-    except:
+    except curses.error:
         height, width = state.height, state.width
 
-    lines = build_display_lines(state, width, height)
+    grid_start, grid_height = grid_bounds(height)
+    clamp_view(state, width, grid_height)
+
+    key = render_key(state, width, height)
+    if key == frame.key:
+        return False
+
+    profiler = state.profiler
+    if profiler is not None:
+        start = time.perf_counter_ns()
+    lines = build_display_lines(state, width, height, frame.row_cache)
+    if profiler is not None:
+        start = profiler.record("build", start)
+
+    # Generation on the first grid line; only tracked for 1D rows at full
+    # zoom, where new rows move the picture up by whole lines
+    grid_top = None
+    if state.dimensions == 1 and state.view_zoom == 0:
+        stop = state.grid.next_generation - state.view_y
+        grid_top = max(first_available(state), stop - grid_height)
+
+    if frame.size != (height, width):
+        stdscr.erase()
+        stdscr.idlok(True)
+        frame.size = (height, width)
+        frame.lines = [None] * height
+    elif (
+        frame.grid is state.grid
+        and grid_top is not None
+        and frame.grid_top is not None
+        and 0 < grid_top - frame.grid_top < grid_height
+    ):
+        scroll_grid(stdscr, frame, grid_start, grid_height, grid_top - frame.grid_top)
 
     for i, line in enumerate(lines):
         if i >= height:
             break
+        if line == frame.lines[i]:
+            continue
         try:
-            stdscr.addstr(i, 0, line[: width - 1])
-        except:
+            # Pad so the previous contents of the line are overwritten
+            stdscr.addstr(i, 0, line[: width - 1].ljust(width - 1))
+        except curses.error:
             pass
+        frame.lines[i] = line
+
+    stdscr.noutrefresh()
+    curses.doupdate()
+    if profiler is not None:
+        profiler.record("output", start)
 
-    stdscr.refresh()
+    frame.key = key
+    frame.grid = state.grid
+    frame.grid_top = grid_top
+    return True
 
 
-def build_display_lines(state, width: int, height: int) -> list[str]:
+def scroll_grid(
+    stdscr, frame: Frame, grid_start: int, grid_height: int, shift: int
+) -> None:
+    """
+    Scroll the grid region up, keeping the frame's line model in step.
+
+    Args:
+        stdscr: curses window object
+        frame: Frame being updated
+        grid_start: First grid line
+        grid_height: Number of grid lines
+        shift: Number of lines to scroll (less than grid_height)
+    """
+    grid_end = grid_start + grid_height
+    try:
+        stdscr.setscrreg(grid_start, grid_end - 1)
+        stdscr.scrollok(True)
+        stdscr.scroll(shift)
+        stdscr.scrollok(False)
+        stdscr.setscrreg(0, frame.size[0] - 1)
+    except curses.error:
+        # Fall back to redrawing the grid lines
+        frame.lines[grid_start:grid_end] = [None] * grid_height
+        return
+    frame.lines[grid_start:grid_end] = (
+        frame.lines[grid_start + shift : grid_end] + [None] * shift
+    )
+
+
+def build_display_lines(
+    state, width: int, height: int, row_cache: dict | None = None
+) -> list[str]:
     """
     Build the complete display as a list of strings.
 
@@ -39,6 +222,7 @@ def build_display_lines(state, width: int, height: int) -> list[str]:
         state: State object
         width: Terminal width
         height: Terminal height
+        row_cache: Optional dict reused across calls to cache grid rows
 
     Returns:
         List of strings, one per line to display
@@ -52,7 +236,7 @@ def build_display_lines(state, width: int, height: int) -> list[str]:
     lines[2] = "─" * width
 
     # Render CA grid
-    render_automata_grid(lines, state, width, height, 3)
+    render_automata_grid(lines, state, width, height, PANEL_HEIGHT, row_cache)
 
     # Render status line at bottom
     render_status_line(lines, state, height)
@@ -68,13 +252,22 @@ def render_ruleset_panel(lines: list[str], state, width: int) -> None:
     """
     Render the rule visualization at the top.
 
-    Shows the rule number and visual representation of all 8 transitions.
+    Shows the rule number and visual representation of all 8 transitions,
+    or the B/S rule, generation and population in 2D mode.
 
     Args:
         lines: List to modify in-place
         state: State object
         width: Terminal width
     """
+    if state.dimensions == 2:
+        life = state.life
+        lines[0] = f"Life {life.rule}".ljust(width)
+        lines[1] = (
+            f"  Generation {life.generation}  Population {life.population}"
+        ).ljust(width)
+        return
+
     # Line 0: Rule number
     rule_label = f"Rule {state.rule_number}"
     lines[0] = rule_label.ljust(width)
@@ -100,7 +293,12 @@ def render_ruleset_panel(lines: list[str], state, width: int) -> None:
 
 
 def render_automata_grid(
-    lines: list[str], state, width: int, height: int, panel_height: int
+    lines: list[str],
+    state,
+    width: int,
+    height: int,
+    panel_height: int,
+    row_cache: dict | None = None,
 ) -> None:
     """
     Render the CA grid.
@@ -111,19 +309,55 @@ def render_automata_grid(
         width: Terminal width
         height: Terminal height
         panel_height: Starting line for CA grid (skip rule panel)
+        row_cache: Optional dict of (row, row width, screen width, x) -> line
     """
     grid_start = panel_height + 1
-    grid_height = height - grid_start - 1  # Reserve bottom for status
-
-    for row in range(grid_start, min(grid_start + grid_height, height)):
+    grid_height = max(height - grid_start - 1, 0)  # Reserve bottom for status
+    grid_end = min(grid_start + grid_height, height)
+    clamp_view(state, width, grid_height)
+
+    if state.dimensions == 2:
+        lines[grid_start:grid_end] = render_plane_lines(state, width, grid_height)[
+            : grid_end - grid_start
+        ]
+        return
+
+    if state.view_zoom:
+        # Fetch the generations covered by the visible bands
+        _, cells_y = cells_per_char(state)
+        newest = state.grid.next_generation - 1
+        last_band = newest // cells_y - state.view_y
+        stop = min(newest + 1, (last_band + 1) * cells_y)
+        count = stop - (last_band - grid_height + 1) * cells_y
+        rows = rows_window(state, count, newest + 1 - stop)
+        first_generation = stop - len(rows)
+        lines[grid_start:grid_end] = render_zoomed_lines(
+            state, rows, first_generation, width, grid_height, newest
+        )[: grid_end - grid_start]
+        return
+
+    if row_cache is None:
+        row_cache = {}
+    elif len(row_cache) > ROW_CACHE_LIMIT:
+        row_cache.clear()
+
+    # Newest rows sit at the bottom once the history outgrows the screen
+    rows = rows_window(state, grid_height, state.view_y)
+    blank = " " * width
+    x0 = view_left(state, width)
+
+    for row in range(grid_start, grid_end):
         grid_row = row - grid_start
-        if grid_row < len(state.grid) and grid_row <= state.current_row:
-            line = ""
-            for cell in state.grid[grid_row][: width]:
-                line += "█" if cell else " "
-            lines[row] = line.ljust(width)
+        if grid_row < len(rows):
+            key = (rows[grid_row], state.width, width, x0)
+            line = row_cache.get(key)
+            if line is None:
+                line = format(rows[grid_row], f"0{state.width}b")[x0 : x0 + width]
+                line = line.translate(_CELL_GLYPHS).ljust(width)
+                row_cache[key] = line
+            lines[row] = line
         else:
-            lines[row] = " " * width
+            lines[row] = blank
 
 
 def render_status_line(lines: list[str], state, height: int) -> None:
@@ -144,6 +378,26 @@ def render_status_line(lines: list[str], state, height: int) -> None:
     else:  # step mode
         status = "[Space] Next Step  [ESC] Menu  (Step Mode)"
 
+    view = describe_view(state)
+    if view:
+        status += f"  {view}"
+
+    if state.tape is not None:
+        tape = state.tape
+        status += f"  Infinite [{tape.left}, {tape.right})"
+
+    if state.cycle is not None and state.cycle.found:
+        status += f"  Transient {state.cycle.transient}  Period {state.cycle.period}"
+
+    if state.analysis is not None:
+        status += f"  {state.analysis.summary()}"
+
+    if state.stats_text:
+        status += f"  {state.stats_text}"
+
+    if state.message:
+        status += f"  {state.message}"
+
     lines[status_line_idx] = status.ljust(len(lines[status_line_idx]))
 
 
@@ -177,6 +431,8 @@ def render_menu(lines: list[str], state, width: int, height: int) -> None:
         render_rule_input(lines, state, start_y, start_x, menu_width)
     elif state.menu_mode == "delay_input":
         render_delay_input(lines, state, start_y, start_x, menu_width)
+    elif state.menu_mode == "life_rule_input":
+        render_life_rule_input(lines, state, start_y, start_x, menu_width)
 
 
 def render_main_menu(lines, state, start_y, start_x, width, height) -> None:
@@ -197,6 +453,10 @@ def render_main_menu(lines, state, start_y, start_x, width, height) -> None:
             display_item = f"{item}: {state.rule_number}"
         elif item == "Set Step Delay":
             display_item = f"{item}: {state.step_delay}s"
+        elif item == "Set Life Rule":
+            display_item = f"{item}: {state.life_rule}"
+        elif item == "Switch 1D/2D":
+            display_item = f"{item}: [{state.dimensions}D]"
         elif item == "Toggle Mode":
             mode_str = "Auto" if state.simulation_mode == "auto" else "Step"
             display_item = f"{item}: [{mode_str}]"
@@ -255,3 +515,24 @@ def render_delay_input(lines, state, start_y, start_x, width) -> None:
     bottom_line = f"└{'─' * (width - 2)}┘"
     if start_y + 3 < len(lines):
         lines[start_y + 3] = " " * start_x + bottom_line
+
+
+def render_life_rule_input(lines, state, start_y, start_x, width) -> None:
+    """Render Life rule input dialog."""
+    title = "Enter Life Rule (e.g. B3/S23, highlife)"
+    title_line = f"┌{title.center(width - 2)}┐".ljust(width)
+    if start_y < len(lines):
+        lines[start_y] = " " * start_x + title_line
+
+    input_line = f"│ {state.menu_input:>{width-4}}│"
+    if start_y + 1 < len(lines):
+        lines[start_y + 1] = " " * start_x + input_line
+
+    help_text = "[Enter] OK  [ESC] Cancel"
+    help_line = f"│ {help_text:<{width-4}}│"
+    if start_y + 2 < len(lines):
+        lines[start_y + 2] = " " * start_x + help_line
+
+    bottom_line = f"└{'─' * (width - 2)}┘"
+    if start_y + 3 < len(lines):
+        lines[start_y + 3] = " " * start_x + bottom_line
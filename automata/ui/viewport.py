@@ -0,0 +1,365 @@
+"""Zoomable, scrollable view of the spacetime diagram.
+
+At zoom level 0 every cell is one full-block character. Zooming out packs
+more cells into each character: half blocks show 1x2 cells, Braille glyphs
+show 2x4 cells, and further levels make every Braille dot stand for an
+f x f block of cells (f = 2, 4, 8, ...). A dot is lit when any cell in its
+block is alive, or, in density mode, when at least half of them are.
+
+In 1D the view scrolls back through the retained generations; in 2D it
+pans freely over the unbounded Life plane. On an infinite tape the view
+follows the active span of the newest row, and panning moves it relative
+to that.
+"""
+
+import curses
+
+from automata.simulation import first_available
+
+# (glyph style, cells per dot along each axis)
+ZOOM_LEVELS = [
+    ("block", 1),
+    ("half", 1),
+    ("braille", 1),
+    ("braille", 2),
+    ("braille", 4),
+    ("braille", 8),
+    ("braille", 16),
+    ("braille", 32),
+]
+
+AGGREGATE_MODES = ["any", "density"]
+
+PAGE_LINES = 32  # Lines scrolled by Page Up/Page Down
+
+# Dots per character (columns, rows) for each glyph style
+_GLYPH_DOTS = {"block": (1, 1), "half": (1, 2), "braille": (2, 4)}
+
+_HALF_BLOCKS = [" ", "▄", "▀", "█"]  # Indexed by top * 2 + bottom
+
+# Braille dot bit for (dot row, dot column)
+_BRAILLE_BITS = [(0x01, 0x08), (0x02, 0x10), (0x04, 0x20), (0x40, 0x80)]
+
+
+def cells_per_char(state) -> tuple[int, int]:
+    """
+    Return how many cells one character covers at the current zoom.
+
+    Args:
+        state: State object
+
+    Returns:
+        (columns, generations) covered by one character
+    """
+    style, factor = ZOOM_LEVELS[state.view_zoom]
+    dots_x, dots_y = _GLYPH_DOTS[style]
+    return dots_x * factor, dots_y * factor
+
+
+def clamp_view(state, columns: int, lines: int) -> None:
+    """
+    Keep the view offsets inside the available spacetime.
+
+    The 2D plane is unbounded, so its view is left alone.
+
+    Args:
+        state: State object
+        columns: Screen columns available to the grid
+        lines: Screen lines available to the grid
+    """
+    if state.dimensions == 2:
+        return
+    cells_x, cells_y = cells_per_char(state)
+    if state.tape is not None:
+        # view_x is an offset from the centered view (see view_left())
+        centered = _centered_left(state, columns * cells_x)
+        low = -centered
+        high = max(0, state.width - columns * cells_x) - centered
+        state.view_x = max(min(low, 0), min(state.view_x, max(high, 0)))
+    else:
+        state.view_x = max(0, min(state.view_x, state.width - columns * cells_x))
+    history = 0
+    if state.grid is not None:
+        history = state.grid.next_generation - first_available(state)
+    max_up = max(0, (history - 1) // cells_y - (lines - 1))
+    state.view_y = max(0, min(state.view_y, max_up))
+
+
+def _centered_left(state, visible: int) -> int:
+    """
+    Return the first column that centers the infinite tape's active span.
+
+    The center moves in steps of an eighth of the view, so a slowly
+    drifting pattern does not shift the whole picture every generation.
+
+    Args:
+        state: State object on an infinite tape
+        visible: Cells that fit across the screen
+
+    Returns:
+        Column index, possibly outside the retained rows
+    """
+    tape = state.tape
+    if tape.width:
+        center = (tape.left + tape.right) // 2 - state.origin
+    else:
+        center = state.width // 2
+    step = max(1, visible // 8)
+    return center // step * step - visible // 2
+
+
+def view_left(state, columns: int) -> int:
+    """
+    Return the first column shown in 1D.
+
+    Args:
+        state: State object
+        columns: Screen columns available to the grid
+
+    Returns:
+        Index of the leftmost visible cell of each row
+    """
+    if state.tape is None:
+        return state.view_x
+    cells_x, _ = cells_per_char(state)
+    visible = columns * cells_x
+    left = _centered_left(state, visible) + state.view_x
+    return max(0, min(left, state.width - visible))
+
+
+def handle_view_input(state, key: int) -> bool:
+    """
+    Apply pan and zoom keys.
+
+    Args:
+        state: State object
+        key: Key code from curses
+
+    Returns:
+        True if the key was a view key
+    """
+    cells_x, cells_y = cells_per_char(state)
+    pan = max(1, 8 * cells_x)
+    # Up and down scroll through history in 1D and move the view in 2D
+    rise = 1 if state.dimensions == 1 else -4 * cells_y
+
+    if key == curses.KEY_LEFT:
+        state.view_x -= pan
+    elif key == curses.KEY_RIGHT:
+        state.view_x += pan
+    elif key == curses.KEY_UP:
+        state.view_y += rise
+    elif key == curses.KEY_DOWN:
+        state.view_y -= rise
+    elif key == curses.KEY_PPAGE:
+        state.view_y += PAGE_LINES * rise
+    elif key == curses.KEY_NPAGE:
+        state.view_y -= PAGE_LINES * rise
+    elif key == ord("-"):
+        state.view_zoom = min(state.view_zoom + 1, len(ZOOM_LEVELS) - 1)
+    elif key in (ord("+"), ord("=")):
+        state.view_zoom = max(state.view_zoom - 1, 0)
+    elif key == ord("a"):
+        index = AGGREGATE_MODES.index(state.view_aggregate)
+        state.view_aggregate = AGGREGATE_MODES[(index + 1) % len(AGGREGATE_MODES)]
+    elif key == ord("0"):
+        state.view_x = 0
+        state.view_y = 0
+        state.view_zoom = 0
+    else:
+        return False
+    return True
+
+
+def describe_view(state) -> str:
+    """
+    Summarize a non-default view for the status line.
+
+    Args:
+        state: State object
+
+    Returns:
+        Short description, or "" for the default view
+    """
+    if state.view_zoom == 0 and state.view_x == 0 and state.view_y == 0:
+        return ""
+    cells_x, cells_y = cells_per_char(state)
+    text = f"View {cells_x}x{cells_y} x={state.view_x}"
+    if state.dimensions == 2:
+        text += f" y={state.view_y}"
+    elif state.view_y:
+        text += f" up={state.view_y}"
+    if state.view_zoom:
+        text += f" {state.view_aggregate}"
+    return text
+
+
+def _segment(bits: int, width: int, x0: int, count: int) -> int:
+    """Return cells x0..x0+count-1 of a packed row, zero beyond the edge."""
+    end = x0 + count
+    if end <= width:
+        return (bits >> (width - end)) & ((1 << count) - 1)
+    return (bits << (end - width)) & ((1 << count) - 1)
+
+
+def sample_dots(
+    rows: list[int], width: int, x0: int, dots: int, factor: int, mode: str
+) -> str:
+    """
+    Aggregate a band of rows into one line of dots.
+
+    Args:
+        rows: Packed rows that make up one dot row (1 to factor rows)
+        width: Cells per packed row
+        x0: First column
+        dots: Number of dots to produce
+        factor: Cells per dot horizontally
+        mode: "any" or "density"
+
+    Returns:
+        String of dots characters, "1" for lit and "0" for dark
+    """
+    count = dots * factor
+    if not rows:
+        return "0" * dots
+
+    if mode == "any" or (factor == 1 and len(rows) == 1):
+        combined = 0
+        for bits in rows:
+            combined |= _segment(bits, width, x0, count)
+        # Fold each group onto its last cell, then read every factor-th cell
+        shift = 1
+        while shift < factor:
+            combined |= combined >> shift
+            shift *= 2
+        return format(combined, f"0{count}b")[factor - 1 :: factor]
+
+    totals = [0] * dots
+    for bits in rows:
+        cells = format(_segment(bits, width, x0, count), f"0{count}b")
+        for i in range(dots):
+            totals[i] += cells.count("1", i * factor, (i + 1) * factor)
+    threshold = factor * len(rows)
+    return "".join("1" if 2 * total >= threshold else "0" for total in totals)
+
+
+def render_zoomed_lines(
+    state,
+    rows: list[int],
+    first_generation: int,
+    columns: int,
+    lines_count: int,
+    newest: int | None = None,
+) -> list[str]:
+    """
+    Render rows at the current zoom level.
+
+    Characters cover fixed generation bands aligned to absolute generation
+    numbers, so the picture is stable while the simulation scrolls.
+
+    Args:
+        state: State object
+        rows: Consecutive packed rows, oldest first
+        first_generation: Generation number of rows[0]
+        columns: Characters per line
+        lines_count: Number of lines to produce (newest at the bottom)
+        newest: Generation number of the run's newest row, which the
+            bottom line shows when not scrolled (default: the last of rows)
+
+    Returns:
+        List of lines_count strings of length columns (blank lines first
+        when there is not enough history)
+    """
+    style, factor = ZOOM_LEVELS[state.view_zoom]
+    dots_x, dots_y = _GLYPH_DOTS[style]
+    cells_y = dots_y * factor
+    dot_count = columns * dots_x
+
+    if not rows:
+        return [" " * columns] * lines_count
+
+    x0 = view_left(state, columns)
+    if newest is None:
+        newest = first_generation + len(rows) - 1
+    last_band = newest // cells_y - state.view_y
+    lines = []
+    for band in range(last_band - lines_count + 1, last_band + 1):
+        dot_rows = []
+        for dot_row in range(dots_y):
+            start = band * cells_y + dot_row * factor - first_generation
+            band_rows = rows[max(start, 0) : max(start + factor, 0)]
+            dot_rows.append(
+                sample_dots(
+                    band_rows,
+                    state.width,
+                    x0,
+                    dot_count,
+                    factor,
+                    state.view_aggregate,
+                )
+            )
+        lines.append(_compose(style, dot_rows, columns))
+    return lines
+
+
+def render_plane_lines(state, columns: int, lines_count: int) -> list[str]:
+    """
+    Render the visible part of the 2D Life plane at the current zoom.
+
+    Args:
+        state: State object with a life.LifeGrid
+        columns: Characters per line
+        lines_count: Number of lines to produce
+
+    Returns:
+        List of lines_count strings of length columns
+    """
+    style, factor = ZOOM_LEVELS[state.view_zoom]
+    dots_x, dots_y = _GLYPH_DOTS[style]
+    width = columns * dots_x * factor
+    rows = state.life.region(
+        state.view_x, state.view_y, width, lines_count * dots_y * factor
+    )
+
+    lines = []
+    for line in range(lines_count):
+        dot_rows = []
+        for dot_row in range(dots_y):
+            start = (line * dots_y + dot_row) * factor
+            dot_rows.append(
+                sample_dots(
+                    rows[start : start + factor],
+                    width,
+                    0,
+                    columns * dots_x,
+                    factor,
+                    state.view_aggregate,
+                )
+            )
+        lines.append(_compose(style, dot_rows, columns))
+    return lines
+
+
+def _compose(style: str, dot_rows: list[str], columns: int) -> str:
+    """Turn dot rows into one line of glyphs."""
+    if style == "block":
+        return dot_rows[0].translate(str.maketrans("01", " █"))
+
+    if style == "half":
+        top, bottom = dot_rows
+        return "".join(
+            _HALF_BLOCKS[(top[i] == "1") * 2 + (bottom[i] == "1")]
+            for i in range(columns)
+        )
+
+    glyphs = []
+    for i in range(columns):
+        code = 0x2800
+        for dot_row, dots in enumerate(dot_rows):
+            left_bit, right_bit = _BRAILLE_BITS[dot_row]
+            if dots[2 * i] == "1":
+                code |= left_bit
+            if dots[2 * i + 1] == "1":
+                code |= right_bit
+        glyphs.append(chr(code))
+    return "".join(glyphs)
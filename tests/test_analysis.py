@@ -0,0 +1,105 @@
+"""Streaming metrics against naive per-cell references."""
+
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from automata.analysis import METRICS, LiveAnalysis, analyze, run_lengths
+from automata.entropy import block_entropy, packed_block_entropy
+from automata.packed import iter_packed_rows, rotate_row, unpack_row
+from tests.test_packed import reference_step
+
+
+def naive_entropy(cells, block):
+    width = len(cells)
+    block = min(block, width)
+    windows = Counter(
+        tuple(cells[(x + i) % width] for i in range(block)) for x in range(width)
+    )
+    return sum(n / width * math.log2(width / n) for n in windows.values()) / block
+
+
+def naive_runs(cells):
+    width = len(cells)
+    if all(cells):
+        return {width: 1}
+    # Start just after a dead cell so no run wraps
+    start = cells.index(0) + 1
+    lengths = Counter()
+    length = 0
+    for i in range(width):
+        if cells[(start + i) % width]:
+            length += 1
+        elif length:
+            lengths[length] += 1
+            length = 0
+    if length:
+        lengths[length] += 1
+    return dict(lengths)
+
+
+def random_cases(count=60):
+    rng = random.Random(24)
+    for width in [1, 2, 3, 5, 8, 13, 64, 101]:
+        for _ in range(count // 8):
+            yield rng.getrandbits(width), width
+        yield 0, width
+        yield (1 << width) - 1, width
+
+
+@pytest.mark.parametrize("bits, width", list(random_cases()))
+def test_entropy_matches_reference(bits, width):
+    cells = unpack_row(bits, width)
+    for block in [1, 2, 4]:
+        expected = naive_entropy(cells, block)
+        assert block_entropy(bits, width, block) == pytest.approx(expected)
+        assert packed_block_entropy(bits, width, block) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("bits, width", list(random_cases()))
+def test_run_lengths_match_reference(bits, width):
+    assert run_lengths(bits, width) == naive_runs(unpack_row(bits, width))
+
+
+def test_rotate_row():
+    for width in [1, 5, 9]:
+        bits = random.Random(width).getrandbits(width)
+        cells = unpack_row(bits, width)
+        for shift in range(-width, 2 * width):
+            rotated = [cells[(x + shift) % width] for x in range(width)]
+            assert unpack_row(rotate_row(bits, width, shift), width) == rotated
+
+
+@pytest.mark.parametrize("rule_number", [30, 90, 110, 184])
+def test_pipeline_matches_reference(rule_number):
+    width, generations, cell = 37, 60, 11
+    bits = random.Random(rule_number).getrandbits(width)
+    rows = list(iter_packed_rows(bits, rule_number, width, generations))
+    out = list(analyze(rows, width, METRICS, rule_number, start=5, damage_cell=cell))
+
+    twin = bits ^ (1 << (width - 1 - cell))
+    assert [sample.generation for sample in out] == list(range(5, 5 + len(rows)))
+    for sample, row in zip(out, rows):
+        cells = unpack_row(row, width)
+        lengths = naive_runs(cells)
+        values = sample.values
+        assert values["density"] == sum(cells) / width
+        assert values["entropy"] == pytest.approx(naive_entropy(cells, 4))
+        assert values["run_lengths"] == lengths
+        assert values["runs"] == sum(lengths.values())
+        assert values["max_run"] == max(lengths, default=0)
+        twin_cells = unpack_row(twin, width)
+        assert values["damage"] == sum(a != b for a, b in zip(cells, twin_cells))
+        twin = reference_step(twin, rule_number, width)
+
+
+def test_live_analysis_matches_batch():
+    width, rule_number = 29, 110
+    rows = list(iter_packed_rows(1 << 14, rule_number, width, 40))
+    live = LiveAnalysis(width, METRICS, rule_number)
+    batch = analyze(rows, width, METRICS, rule_number)
+    for row, sample in zip(rows, batch):
+        assert live.update(row) == sample.values
+    assert live.summary()
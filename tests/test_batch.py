@@ -0,0 +1,83 @@
+"""Batched multi-rule evolution against the packed single-row engine."""
+
+import random
+
+import pytest
+
+from automata import simulation
+from automata.packed import iter_packed_rows, pack_row, unpack_row
+from automata.simulation import evolve_batch, iter_batch
+
+np = simulation._load_numpy()
+needs_numpy = pytest.mark.skipif(np is None, reason="NumPy is not installed")
+
+WIDTHS = [1, 2, 3, 8, 13, 64]
+
+
+def random_batch(width, count, seed):
+    rng = random.Random(seed)
+    return [rng.getrandbits(width) for _ in range(count)]
+
+
+def expected_spacetime(bits, rules, width, generations):
+    runs = [
+        list(iter_packed_rows(row, rule, width, generations))
+        for row, rule in zip(bits, rules)
+    ]
+    return [[unpack_row(run[t], width) for run in runs] for t in range(generations + 1)]
+
+
+@needs_numpy
+@pytest.mark.parametrize("width", WIDTHS)
+def test_evolve_batch_matches_packed(width):
+    bits = random_batch(width, 12, width)
+    rules = [30, 90, 110, 184, 0, 255, 1, 45, 60, 102, 150, 204]
+    rows = [unpack_row(b, width) for b in bits]
+    spacetime = evolve_batch(rows, rules, 20)
+    assert spacetime.shape == (21, len(rows), width)
+    assert spacetime.tolist() == expected_spacetime(bits, rules, width, 20)
+
+
+@needs_numpy
+@pytest.mark.parametrize("width", WIDTHS)
+def test_packed_input_matches_unpacked(width):
+    bits = random_batch(width, 5, width)
+    rows = np.array([unpack_row(b, width) for b in bits], dtype=np.uint8)
+    packed = np.packbits(rows, axis=1)
+    unpacked = evolve_batch(rows, 110, 10)
+    assert (evolve_batch(packed, 110, 10, width=width, packed=True) == unpacked).all()
+
+
+@needs_numpy
+def test_single_rule_and_numpy_rules():
+    bits = random_batch(40, 4, 1)
+    rows = [unpack_row(b, 40) for b in bits]
+    expected = expected_spacetime(bits, [30] * 4, 40, 8)
+    assert evolve_batch(rows, 30, 8).tolist() == expected
+    assert evolve_batch(rows, np.int64(30), 8).tolist() == expected
+    assert evolve_batch(rows, np.full(4, 30), 8).tolist() == expected
+
+
+@needs_numpy
+def test_iter_batch_yields_each_generation():
+    rows = [unpack_row(1 << 10, 21)]
+    batches = list(iter_batch(rows, 90, 5))
+    assert len(batches) == 6
+    assert batches[0].tolist() == rows
+
+
+def test_rule_count_must_match():
+    with pytest.raises(ValueError):
+        evolve_batch([[0, 1, 0], [1, 0, 1]], [30], 1)
+
+
+def test_without_numpy_matches(monkeypatch):
+    bits = random_batch(13, 6, 2)
+    rules = [30, 90, 110, 184, 1, 45]
+    rows = [unpack_row(b, 13) for b in bits]
+    expected = expected_spacetime(bits, rules, 13, 15)
+    monkeypatch.setattr(simulation, "_load_numpy", lambda: None)
+    assert evolve_batch(rows, rules, 15) == expected
+    with pytest.raises(ValueError):
+        evolve_batch(rows, rules, 1, width=13, packed=True)
+    assert [pack_row(r) for r in evolve_batch(rows, rules, 0)[0]] == bits
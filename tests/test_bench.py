@@ -0,0 +1,60 @@
+"""Benchmark comparison and timing helpers."""
+
+import json
+
+import pytest
+
+from automata.bench import __main__ as bench
+from automata.bench.compare import compare
+from automata.bench.suite import SUITE_VERSION, measure
+
+
+def results(*cases, version=SUITE_VERSION):
+    return {
+        "metadata": {"suite_version": version},
+        "results": [
+            {"name": "evolve", "params": {"width": width}, "seconds": seconds}
+            for width, seconds in cases
+        ],
+    }
+
+
+def test_compare_flags_regressions():
+    comparisons = compare(results((80, 1.0), (100, 1.0)), results((80, 1.5)), 0.1)
+    assert len(comparisons) == 1
+    assert comparisons[0].regressed
+    assert comparisons[0].change == pytest.approx(0.5)
+
+
+def test_compare_refuses_other_versions():
+    with pytest.raises(ValueError):
+        compare(results((80, 1.0), version=SUITE_VERSION - 1), results((80, 1.0)))
+
+
+def test_compare_refuses_no_matches():
+    with pytest.raises(ValueError):
+        compare(results((80, 1.0)), results((100, 1.0)))
+
+
+def test_compare_command_exit_codes(tmp_path):
+    paths = {}
+    for name, data in {
+        "base": results((80, 1.0)),
+        "same": results((80, 1.0)),
+        "slow": results((80, 2.0)),
+        "other": results((100, 1.0)),
+    }.items():
+        paths[name] = str(tmp_path / f"{name}.json")
+        with open(paths[name], "w") as f:
+            json.dump(data, f)
+    assert bench.main(["compare", paths["base"], paths["same"]]) == 0
+    assert bench.main(["compare", paths["base"], paths["slow"]]) == 1
+    with pytest.raises(SystemExit) as exc:
+        bench.main(["compare", paths["base"], paths["other"]])
+    assert exc.value.code == 2
+
+
+def test_measure_leaves_out_setup():
+    calls = []
+    measure(lambda: calls.append("run"), 2, 0.0, setup=lambda: calls.append("setup"))
+    assert calls == ["setup", "run"] * (len(calls) // 2)
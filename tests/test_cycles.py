@@ -0,0 +1,69 @@
+"""Cycle detection against brute force and rules with known cycles."""
+
+import random
+
+import pytest
+
+from automata.cycles import CycleDetector, find_cycle, row_at
+from automata.packed import evolve_packed_row, iter_packed_rows
+
+
+def brute_cycle(bits, rule_number, width):
+    seen = {}
+    generation = 0
+    while bits not in seen:
+        seen[bits] = generation
+        bits = evolve_packed_row(bits, rule_number, width)
+        generation += 1
+    return seen[bits], generation - seen[bits]
+
+
+@pytest.mark.parametrize(
+    "rule_number, bits, width, expected",
+    [
+        (204, 0b1011, 4, (0, 1)),  # Identity
+        (0, 0b1011, 4, (1, 1)),  # Everything dies at once
+        (51, 0b1011, 4, (0, 2)),  # Complement
+        (170, 1, 7, (0, 7)),  # Shift: a lone cell goes round the torus
+        (170, 0b101101, 6, (0, 3)),  # Shift of a pattern with period 3
+        (90, 1 << 7, 16, (8, 1)),  # Width a power of two: dies out
+    ],
+)
+def test_known_cycles(rule_number, bits, width, expected):
+    assert find_cycle(bits, rule_number, width) == expected
+    assert brute_cycle(bits, rule_number, width) == expected
+
+
+@pytest.mark.parametrize("rule_number", [30, 45, 90, 110, 150, 184])
+def test_matches_brute_force(rule_number):
+    rng = random.Random(rule_number)
+    for width in [3, 5, 8, 11, 14]:
+        bits = rng.getrandbits(width)
+        assert find_cycle(bits, rule_number, width) == brute_cycle(
+            bits, rule_number, width
+        )
+
+
+def test_max_steps():
+    assert find_cycle(1, 30, 16, max_steps=3) is None
+
+
+@pytest.mark.parametrize("rule_number", [30, 110])
+def test_row_at_and_reduce(rule_number):
+    width = 9
+    bits = 0b100110101
+    transient, period = brute_cycle(bits, rule_number, width)
+    rows = list(iter_packed_rows(bits, rule_number, width, 3 * (transient + period)))
+    for t, expected in enumerate(rows):
+        assert row_at(bits, rule_number, width, t).row == expected
+    query = row_at(bits, rule_number, width, 10**9)
+    assert (query.transient, query.period) == (transient, period)
+
+    detector = CycleDetector(bits, rule_number, width)
+    for row in rows[1:]:
+        if detector.observe(row):
+            break
+    assert detector.found
+    for t, expected in enumerate(rows):
+        assert detector.reduce(t) < transient + period
+        assert detector.row_at(t) == expected
@@ -0,0 +1,64 @@
+"""Batched ensembles against rows evolved one at a time."""
+
+import random
+import statistics
+
+import pytest
+
+from automata.ensemble import BatchLayout, RunningStats, random_batch, run_ensemble
+from automata.entropy import block_entropy
+from automata.packed import evolve_packed_row, row_mask
+
+
+def members(layout, bits):
+    """Split a batch into its members' packed rows."""
+    data = bits.to_bytes(layout.nbytes * layout.count, "big")
+    n = layout.nbytes
+    return [
+        int.from_bytes(data[i : i + n], "big") >> layout.pad
+        for i in range(0, len(data), n)
+    ]
+
+
+@pytest.mark.parametrize("width", [1, 2, 7, 8, 13, 64])
+@pytest.mark.parametrize("rule_number", [30, 90, 110, 184])
+def test_batch_matches_single_rows(width, rule_number):
+    layout = BatchLayout(width, 9)
+    bits = random_batch(layout, rng=random.Random(width))
+    rows = members(layout, bits)
+    for _ in range(20):
+        assert bits & ~layout.mask == 0  # Padding stays clear
+        assert layout.counts(bits) == [row.bit_count() for row in rows]
+        entropies = layout.entropies(bits)
+        for row, entropy in zip(rows, entropies):
+            assert entropy == pytest.approx(block_entropy(row, width))
+        bits = layout.evolve(bits, rule_number)
+        rows = [evolve_packed_row(row, rule_number, width) for row in rows]
+        assert members(layout, bits) == rows
+
+
+def test_repeat_and_rotate():
+    layout = BatchLayout(5, 3)
+    bits = layout.repeat(0b10011)
+    assert members(layout, bits) == [0b10011] * 3
+    assert members(layout, layout.rotate(bits, 2)) == [0b01110] * 3
+    assert members(layout, layout.mask) == [row_mask(5)] * 3
+
+
+def test_running_stats():
+    rng = random.Random(1)
+    values = [rng.random() for _ in range(50)]
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    assert stats.mean == pytest.approx(statistics.fmean(values))
+    assert stats.stdev == pytest.approx(statistics.stdev(values))
+    low, high = stats.interval()
+    assert low < stats.mean < high
+
+
+def test_run_ensemble_is_reproducible():
+    kwargs = dict(rule_number=30, width=40, count=25, generations=10, seed=3)
+    first = list(run_ensemble(**kwargs))
+    assert first == list(run_ensemble(**kwargs))
+    assert {summary.count for summary in first} == {25}
@@ -0,0 +1,64 @@
+"""Image export round trips."""
+
+import io
+import struct
+import zlib
+
+import pytest
+
+from automata.export import write_image
+from automata.packed import row_nbytes, row_to_bytes
+from tests.test_storage import random_rows
+
+
+def decode_png(data: bytes) -> tuple[int, int, int, list[bytes]]:
+    """Return width, height, bit depth and the unfiltered scanlines."""
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    pos, idat = 8, b""
+    while pos < len(data):
+        (length,) = struct.unpack(">I", data[pos : pos + 4])
+        kind = data[pos + 4 : pos + 8]
+        body = data[pos + 8 : pos + 8 + length]
+        (crc,) = struct.unpack(">I", data[pos + 8 + length : pos + 12 + length])
+        assert crc == zlib.crc32(body, zlib.crc32(kind))
+        if kind == b"IHDR":
+            width, height, depth = struct.unpack(">IIB", body[:9])
+        elif kind == b"IDAT":
+            idat += body
+        pos += 12 + length
+
+    raw = zlib.decompress(idat)
+    stride = row_nbytes(width) if depth == 1 else width
+    lines, previous = [], bytes(stride)
+    for y in range(height):
+        line = raw[y * (stride + 1) : (y + 1) * (stride + 1)]
+        kind, cells = line[0], bytearray(line[1:])
+        for i in range(stride):
+            if kind == 1 and i:
+                cells[i] = (cells[i] + cells[i - 1]) & 0xFF
+            elif kind == 2:
+                cells[i] = (cells[i] + previous[i]) & 0xFF
+        lines.append(bytes(cells))
+        previous = lines[-1]
+    return width, height, depth, lines
+
+
+@pytest.mark.parametrize("width", [5, 64, 70])
+def test_png_round_trip(width):
+    rows = random_rows(width, 30)
+    out = io.BytesIO()
+    write_image(out, rows, width, len(rows), "png")
+    size_x, size_y, depth, lines = decode_png(out.getvalue())
+    assert (size_x, size_y, depth) == (width, len(rows), 1)
+    # PNG 0 is black, so live cells are stored as 0 bits
+    assert lines == [row_to_bytes(~bits & ((1 << width) - 1), width) for bits in rows]
+
+
+def test_pbm_round_trip():
+    width, rows = 12, random_rows(12, 7)
+    out = io.BytesIO()
+    write_image(out, rows, width, len(rows), "pbm")
+    header = f"P4\n{width} {len(rows)}\n".encode()
+    data = out.getvalue()
+    assert data.startswith(header)
+    assert data[len(header) :] == b"".join(row_to_bytes(bits, width) for bits in rows)
@@ -0,0 +1,35 @@
+"""Hashlife engine against iterated packed evolution."""
+
+import random
+
+import pytest
+
+from automata.hashlife import HashlifeEngine
+from automata.packed import evolve_packed_row
+
+
+def iterate(bits: int, rule_number: int, width: int, generations: int) -> int:
+    for _ in range(generations):
+        bits = evolve_packed_row(bits, rule_number, width)
+    return bits
+
+
+@pytest.mark.parametrize("rule_number", [30, 90, 110, 184, 73])
+@pytest.mark.parametrize("width", [1, 7, 64, 100, 333])
+def test_hashlife_matches_packed(rule_number, width):
+    bits = random.Random(width).getrandbits(width)
+    engine = HashlifeEngine(rule_number)
+    for generations in [0, 1, 5, 64, 77, 300]:
+        assert engine.advance(bits, width, generations) == iterate(
+            bits, rule_number, width, generations
+        ), generations
+
+
+def test_hashlife_survives_small_caches():
+    width = 200
+    bits = random.Random(1).getrandbits(width)
+    engine = HashlifeEngine(110, max_nodes=64, max_results=64)
+    assert engine.advance(bits, width, 500) == iterate(bits, 110, width, 500)
+    stats = engine.cache_info()
+    assert stats.nodes <= 64 and stats.results <= 64
+    assert stats.evictions and stats.result_evictions
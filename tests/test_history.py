@@ -0,0 +1,52 @@
+"""Checkpointed history against every stored row."""
+
+import random
+
+import pytest
+
+from automata.history import History
+from automata.packed import evolve_packed_row
+
+
+def record_run(history: History, bits: int, generations: int) -> list[int]:
+    rows = [bits]
+    for _ in range(generations):
+        bits = evolve_packed_row(bits, history.rule_number, history.width)
+        history.record(bits)
+        rows.append(bits)
+    return rows
+
+
+@pytest.mark.parametrize("interval,budget", [(1, 0), (7, 0), (64, 0), (None, 400)])
+def test_history_rows_match_stored_rows(interval, budget):
+    width = 90
+    bits = random.Random(3).getrandbits(width)
+    kwargs = {"budget": budget} if interval is None else {}
+    history = History(bits, 110, width, start=5, interval=interval, **kwargs)
+    rows = record_run(history, bits, 600)
+    if interval is None:
+        # Auto-tuning kept the checkpoints within the budget
+        assert history.stats().checkpoint_bytes <= 400
+        assert history.interval > 1
+
+    rng = random.Random(4)
+    for t in [5, 6, 300, 604, 605] + [rng.randrange(5, 606) for _ in range(50)]:
+        assert history.row(t) == rows[t - 5], t
+    assert history.rows(200, 380) == rows[195:375]
+    # Generations past the latest are evolved forward from it
+    future = [rows[-1]]
+    for _ in range(4):
+        future.append(evolve_packed_row(future[-1], 110, width))
+    assert history.rows(600, 610) == rows[595:] + future[1:]
+    assert history.cell(0, 100) == rows[95] >> (width - 1)
+    with pytest.raises(IndexError):
+        history.row(4)
+
+
+def test_history_window_costs_one_pass():
+    width, interval = 80, 1000
+    bits = random.Random(5).getrandbits(width)
+    history = History(bits, 30, width, interval=interval)
+    rows = record_run(history, bits, 3000)
+    assert history.rows(1500, 1660) == rows[1500:1660]
+    assert history.stats().recomputed < interval + 160
@@ -0,0 +1,20 @@
+"""Block-table k-state engine against the elementary packed engine."""
+
+import pytest
+
+from automata.kstate import evolve_packed, evolve_row
+from automata.packed import evolve_packed_row, pack_row, unpack_row
+from automata.rules import wolfram_rule
+from tests.test_packed import WIDTHS, sample_rows
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+def test_block_table_matches_packed_for_elementary_rules(width):
+    rows = sample_rows(width, 4)
+    for rule_number in range(256):
+        rule = wolfram_rule(rule_number, 2, 1)
+        for bits in rows:
+            expected = evolve_packed_row(bits, rule_number, width)
+            assert evolve_packed(bits, rule, width) == expected, (rule_number, bits)
+            cells = evolve_row(unpack_row(bits, width), rule)
+            assert pack_row(cells) == expected, (rule_number, bits)
@@ -0,0 +1,36 @@
+"""Sparse tiled Life engine."""
+
+from automata.life import TILE, LifeGrid
+
+GLIDER = [(1, 0), (2, 1), (0, 2), (1, 2), (2, 2)]  # Moves (+1, +1) every 4
+
+
+def reference_step(cells: set) -> set:
+    """One B3/S23 generation on a set of live cells."""
+    counts = {}
+    for x, y in cells:
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                if dx or dy:
+                    key = (x + dx, y + dy)
+                    counts[key] = counts.get(key, 0) + 1
+    return {c for c, n in counts.items() if n == 3 or (n == 2 and c in cells)}
+
+
+def test_glider_crosses_tile_edges():
+    # Start just short of a tile corner so the glider crosses into three
+    # neighboring tiles, and another in negative coordinates
+    x0 = y0 = TILE - 3
+    grid = LifeGrid("B3/S23")
+    grid.set_cells([(x0 + x, y0 + y) for x, y in GLIDER])
+    grid.set_cells([(-TILE - 2 + x, -2 + y) for x, y in GLIDER])
+    expected = set(grid.cells())
+
+    for generation in range(1, 41):
+        grid.step()
+        expected = reference_step(expected)
+        assert set(grid.cells()) == expected, generation
+
+    moved = {(x0 + x + 10, y0 + y + 10) for x, y in GLIDER}
+    assert moved <= set(grid.cells())
+    assert grid.population == 2 * len(GLIDER)
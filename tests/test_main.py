@@ -0,0 +1,26 @@
+"""Command line validation of the interactive viewer."""
+
+import pytest
+
+from automata.main import build_parser, main
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--width", "0"],
+        ["--width", "80", "--replay", "run.cast"],
+        ["-w", "80", "--resume", "automata.snap"],
+        ["--width", "120", "--replay", "run.cast"],
+    ],
+)
+def test_width_rejected(argv, capsys):
+    with pytest.raises(SystemExit) as exc:
+        main(argv)
+    assert exc.value.code == 2
+    assert "--width" in capsys.readouterr().err
+
+
+def test_width_defaults_to_unset():
+    assert build_parser().parse_args([]).width is None
+    assert build_parser().parse_args(["-w", "80"]).width == 80
@@ -0,0 +1,35 @@
+"""Packed and block-table engines against the per-cell reference engine."""
+
+import random
+
+import pytest
+
+from automata.packed import evolve_packed_row, pack_row, unpack_row
+from automata.rules import decode_rule
+from automata.simulation import evolve_next_row
+
+WIDTHS = [1, 2, 63, 64, 65]
+
+
+def reference_step(bits: int, rule_number: int, width: int) -> int:
+    """Evolve one generation with simulation.evolve_next_row()."""
+    grid = [unpack_row(bits, width), [0] * width]
+    evolve_next_row(grid, 0, decode_rule(rule_number), width)
+    return pack_row(grid[1])
+
+
+def sample_rows(width: int, count: int = 8) -> list[int]:
+    rng = random.Random(width)
+    rows = [0, (1 << width) - 1, 1 << (width // 2)]
+    rows += [rng.getrandbits(width) for _ in range(count)]
+    return rows
+
+
+@pytest.mark.parametrize("width", WIDTHS)
+def test_packed_matches_reference_for_every_rule(width):
+    rows = sample_rows(width)
+    for rule_number in range(256):
+        for bits in rows:
+            assert evolve_packed_row(bits, rule_number, width) == reference_step(
+                bits, rule_number, width
+            ), (rule_number, bits)
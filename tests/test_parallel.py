@@ -0,0 +1,34 @@
+"""Multi-process engine against iterated packed evolution."""
+
+import random
+
+import pytest
+
+from automata.parallel import ParallelEngine
+from tests.test_hashlife import iterate
+
+
+@pytest.mark.parametrize("width,workers,halo", [(100, 2, 3), (1000, 3, 64), (17, 4, 5)])
+def test_parallel_matches_packed(width, workers, halo):
+    bits = random.Random(width).getrandbits(width)
+    with ParallelEngine(30, width, workers, halo) as engine:
+        assert engine.advance(bits, 1) == iterate(bits, 30, width, 1)
+        assert engine.advance(bits, 250) == iterate(bits, 30, width, 250)
+        engine.load(bits)
+        engine.step(7)
+        engine.step(11)
+        assert engine.row() == iterate(bits, 30, width, 18)
+
+
+def test_parallel_reports_dead_worker():
+    engine = ParallelEngine(30, 1000, workers=2)
+    try:
+        engine.step(1)
+        engine._processes[0].kill()
+        engine._processes[0].join()
+        with pytest.raises(RuntimeError):
+            engine.step(3)
+    finally:
+        engine.close()
+    with pytest.raises(RuntimeError):
+        engine.step(1)
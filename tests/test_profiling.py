@@ -0,0 +1,34 @@
+"""Main-loop profiling on a fake terminal."""
+
+import json
+
+from automata.bench.loop import (
+    EndOfScript,
+    FakeScreen,
+    ScriptedInput,
+    fake_terminal,
+    scenario_events,
+)
+from automata.main import _run
+
+
+def run_traced(path, events):
+    script = ScriptedInput(events)
+    screen = FakeScreen(24, 80, script)
+    with fake_terminal(screen):
+        try:
+            _run(screen, trace=str(path), clock=script.clock)
+        except EndOfScript:
+            pass
+    text = path.read_text().rstrip().rstrip(",")
+    events = json.loads(text if text.endswith("]") else text + "]")
+    return screen, [event["name"] for event in events]
+
+
+def test_frames_recorded_only_when_drawn(tmp_path):
+    # Unbound keys wake the loop without changing what is on screen
+    events = [(0.0, ord("z"))] * 5 + scenario_events("step", False, 1.0)
+    screen, names = run_traced(tmp_path / "trace.json", events)
+    assert names.count("frame") == screen.refreshes
+    assert names.count("evolve") > screen.refreshes
+    assert names.count("input") == len(events)
@@ -0,0 +1,65 @@
+"""Redraw skipping: render() draws again exactly when the display changes."""
+
+import pytest
+
+from automata.bench.loop import FakeScreen, ScriptedInput, fake_terminal
+from automata.simulation import advance_simulation, reset_simulation, start_analysis
+from automata.state import State
+from automata.ui.renderer import Frame, render, render_key
+
+
+class Summary:
+    def __init__(self, text):
+        self.text = text
+
+    def summary(self):
+        return self.text
+
+
+@pytest.fixture
+def state():
+    state = State(rule_number=30, width=40, height=20)
+    reset_simulation(state)
+    return state
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda state: advance_simulation(state, 1),
+        lambda state: setattr(state, "rule_number", 90),
+        lambda state: setattr(state, "simulation_mode", "auto"),
+        lambda state: setattr(state, "menu_open", True),
+        lambda state: setattr(state, "view_x", 3),
+        lambda state: setattr(state, "message", "saved"),
+        lambda state: setattr(state, "show_metrics", True),
+        lambda state: setattr(state, "analysis", Summary("H=0.9")),
+    ],
+)
+def test_render_key_changes(state, change):
+    before = render_key(state, 80, 24)
+    assert render_key(state, 80, 24) == before
+    change(state)
+    assert render_key(state, 80, 24) != before
+
+
+def test_render_key_tracks_analysis_values(state):
+    state.analysis = Summary("H=0.9")
+    before = render_key(state, 80, 24)
+    state.analysis.text = "H=0.8"
+    assert render_key(state, 80, 24) != before
+
+
+def test_render_skips_unchanged_frames(state):
+    screen = FakeScreen(24, 80, ScriptedInput([]))
+    frame = Frame()
+    with fake_terminal(screen):
+        assert render(screen, state, frame)
+        assert not render(screen, state, frame)
+        state.show_metrics = True
+        start_analysis(state)
+        assert render(screen, state, frame)
+        assert not render(screen, state, frame)
+        advance_simulation(state, 1)
+        assert render(screen, state, frame)
+    assert screen.refreshes == 3
@@ -0,0 +1,55 @@
+"""Ring buffer eviction and absolute generation numbering."""
+
+import pytest
+
+from automata.ringbuffer import RowRing
+
+
+def test_eviction_keeps_newest_rows():
+    ring = RowRing(4)
+    for generation in range(10):
+        ring.append(generation)
+        assert len(ring) == min(generation + 1, 4)
+        assert ring.next_generation == generation + 1
+        assert ring.first_generation == max(0, generation - 3)
+        assert list(ring) == list(range(ring.first_generation, generation + 1))
+        assert ring.latest() == generation
+
+
+def test_indexing_is_oldest_first():
+    ring = RowRing(3)
+    for row in "abcde":
+        ring.append(row)
+    assert [ring[0], ring[1], ring[2]] == ["c", "d", "e"]
+    assert [ring[-1], ring[-3]] == ["e", "c"]
+    with pytest.raises(IndexError):
+        ring[3]
+    with pytest.raises(IndexError):
+        ring[-4]
+
+
+def test_window():
+    ring = RowRing(5)
+    for row in range(8):
+        ring.append(row)
+    assert ring.window(3) == [5, 6, 7]
+    assert ring.window(3, offset=1) == [4, 5, 6]
+    assert ring.window(10) == [3, 4, 5, 6, 7]
+    assert ring.window(10, offset=4) == [3]
+    assert ring.window(2, offset=9) == []
+    assert ring.window(0) == []
+
+
+def test_clear_restarts_numbering():
+    ring = RowRing(2)
+    for row in range(5):
+        ring.append(row)
+    ring.clear()
+    assert len(ring) == 0 and ring.next_generation == 0
+    ring.append("x")
+    assert ring.first_generation == 0 and list(ring) == ["x"]
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        RowRing(0)
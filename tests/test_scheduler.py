@@ -0,0 +1,60 @@
+"""Deadline pacing: how many generations are due and how long to sleep."""
+
+import pytest
+
+from automata.scheduler import MAX_CATCH_UP, StepScheduler
+
+
+def test_first_call_starts_pacing():
+    scheduler = StepScheduler()
+    assert not scheduler.running
+    assert scheduler.timeout_ms(0.0) == -1
+    assert scheduler.due(10.0, 0.5) == 0
+    assert scheduler.running
+    assert scheduler.timeout_ms(10.0) == 500
+
+
+def test_due_on_fixed_grid():
+    scheduler = StepScheduler()
+    scheduler.start(0.0, 0.25)
+    assert scheduler.due(0.2, 0.25) == 0
+    assert scheduler.due(0.25, 0.25) == 1
+    # A late frame does not shift later deadlines
+    assert scheduler.due(0.625, 0.25) == 1
+    assert scheduler.timeout_ms(0.625) == 125
+    assert scheduler.due(1.375, 0.25) == 3
+    assert scheduler.timeout_ms(1.375) == 125
+
+
+def test_long_run_rate_matches_delay():
+    scheduler = StepScheduler()
+    scheduler.start(0.0, 0.1)
+    total = 0
+    now = 0.0
+    while now < 100.0:
+        now += 0.037  # Frames that do not line up with the deadlines
+        total += scheduler.due(now, 0.1)
+    assert total == pytest.approx(1000, abs=1)
+
+
+def test_catch_up_is_capped():
+    scheduler = StepScheduler()
+    scheduler.start(0.0, 0.125)
+    assert scheduler.due(3600.0, 0.125) == MAX_CATCH_UP
+    # The backlog is dropped: the next generation is one delay away
+    assert scheduler.timeout_ms(3600.0) == 125
+    assert scheduler.due(3600.0625, 0.125) == 0
+
+    scheduler = StepScheduler(max_catch_up=5)
+    scheduler.start(0.0, 1.0)
+    assert scheduler.due(4.5, 1.0) == 4
+    assert scheduler.due(100.0, 1.0) == 5
+
+
+def test_stop_and_overdue_timeout():
+    scheduler = StepScheduler()
+    scheduler.start(0.0, 1.0)
+    assert scheduler.timeout_ms(2.0) == 0
+    scheduler.stop()
+    assert not scheduler.running
+    assert scheduler.timeout_ms(2.0) == -1
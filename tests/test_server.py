@@ -0,0 +1,66 @@
+"""Control validation and stepping of the shared server simulation."""
+
+import asyncio
+
+import pytest
+
+from automata.server import MAX_STEP, SharedSimulation
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        {"rule": 256},
+        {"rule": -1},
+        {"rule": True},
+        {"rule": 30.0},
+        {"delay": 0},
+        {"delay": -0.5},
+        {"delay": float("inf")},
+        {"delay": float("nan")},
+        {"delay": True},
+        {"delay": "0.1"},
+        {"mode": "fast"},
+        {"step": MAX_STEP + 1},
+        {"step": -1},
+        {"step": False},
+        {"rule": 90, "delay": float("inf")},
+    ],
+)
+def test_control_rejects_bad_values(command):
+    sim = SharedSimulation()
+    before = sim.config()
+    with pytest.raises(ValueError):
+        sim.control(command)
+    # Nothing is applied when any value is rejected
+    assert sim.config() == before
+
+
+def test_control_applies_values():
+    sim = SharedSimulation()
+    sim.control({"delay": 2, "mode": "step", "step": 5})
+    assert sim.config()["delay"] == 2.0
+    assert sim.config()["mode"] == "step"
+    assert sim.state.current_row == 5
+    sim.control({"rule": 90})
+    assert sim.config()["rule"] == 90
+    assert sim.state.current_row == 0
+
+
+def test_run_survives_failed_step():
+    sim = SharedSimulation(mode="auto", step_delay=0.001)
+
+    def fail(generations):
+        raise OverflowError("boom")
+
+    sim.advance = fail
+
+    async def drive():
+        task = asyncio.create_task(sim.run())
+        await asyncio.sleep(0.05)
+        alive = not task.done()
+        task.cancel()
+        return alive
+
+    assert asyncio.run(drive())
+    assert sim.config()["mode"] == "none"
@@ -0,0 +1,73 @@
+"""Snapshot encoding, decoding and resuming."""
+
+import struct
+import zlib
+
+import pytest
+
+from automata.packed import row_to_bytes
+from automata.snapshot import (
+    _HEADER_V1,
+    MAGIC,
+    SnapshotError,
+    decode_snapshot,
+    encode_snapshot,
+    load_snapshot,
+    restore_state,
+    save_snapshot,
+)
+from automata.simulation import advance_simulation, reset_simulation
+from automata.state import State
+from tests.test_storage import random_rows
+
+
+def test_snapshot_round_trip(tmp_path):
+    state = State(width=50, height=20, rule_number=110)
+    reset_simulation(state)
+    advance_simulation(state, 35)
+    path = str(tmp_path / "run.snap")
+    save_snapshot(state, path)
+
+    snapshot = load_snapshot(path)
+    assert snapshot.generation == state.current_row
+    assert snapshot.rows == list(state.grid)
+
+    resumed = State(width=50, height=20)
+    restore_state(resumed, snapshot)
+    advance_simulation(state, 10)
+    advance_simulation(resumed, 10)
+    assert resumed.grid.latest() == state.grid.latest()
+    assert resumed.current_row == state.current_row
+
+
+def test_snapshot_infinite_tape_round_trip():
+    state = State(width=40, height=10, rule_number=90, boundary="infinite")
+    reset_simulation(state)
+    advance_simulation(state, 60)
+    snapshot = decode_snapshot(encode_snapshot(state, "last"))
+    assert snapshot.boundary == "infinite"
+    assert snapshot.origin == state.origin
+    assert snapshot.rows == [state.grid.latest()]
+
+
+def test_snapshot_version_1_loads_as_torus():
+    width, rows = 20, random_rows(20, 3)
+    body = b"".join(row_to_bytes(bits, width) for bits in rows)
+    header = _HEADER_V1.pack(MAGIC, 1, 1, 1, 30, 0.25, 9, width, len(rows), 0)
+    data = header + body
+    snapshot = decode_snapshot(data + struct.pack("<I", zlib.crc32(data)))
+    assert snapshot.rows == rows
+    assert snapshot.boundary == "torus"
+    assert (snapshot.rule_number, snapshot.generation) == (30, 9)
+    assert snapshot.simulation_mode == "auto"
+
+
+def test_snapshot_rejects_corruption():
+    state = State(width=16, height=4)
+    reset_simulation(state)
+    data = bytearray(encode_snapshot(state))
+    data[-6] ^= 1
+    with pytest.raises(SnapshotError):
+        decode_snapshot(bytes(data))
+    with pytest.raises(SnapshotError):
+        decode_snapshot(bytes(data[:-1]))
@@ -0,0 +1,28 @@
+"""Spacetime file round trips."""
+
+import random
+
+import pytest
+
+from automata.storage import SpacetimeReader, SpacetimeWriter
+
+
+def random_rows(width: int, count: int) -> list[int]:
+    rng = random.Random(width * count)
+    return [rng.getrandbits(width) for _ in range(count)]
+
+
+@pytest.mark.parametrize("width", [1, 8, 13, 100])
+def test_spacetime_round_trip(tmp_path, width):
+    rows = random_rows(width, 50)
+    path = str(tmp_path / "run.cast")
+    with SpacetimeWriter(path, 30, width, init="random") as writer:
+        writer.extend(rows)
+    with SpacetimeReader(path) as reader:
+        assert len(reader) == len(rows)
+        assert list(reader) == rows
+        assert reader.row(17) == rows[17]
+        x0, x1 = width // 3, width
+        mask = (1 << (x1 - x0)) - 1
+        expected = [(bits >> (width - x1)) & mask for bits in rows[5:9]]
+        assert reader.region(5, 9, x0, x1) == expected
@@ -0,0 +1,73 @@
+"""Infinite tape against a torus wide enough that nothing wraps."""
+
+import random
+
+import pytest
+
+from automata import headless
+from automata.cycles import CycleDetector
+from automata.packed import evolve_packed_row
+from automata.simulation import advance_simulation, reset_simulation
+from automata.state import State
+from automata.storage import SpacetimeReader
+from automata.tape import evolve_tape, tape_from_row, tape_to_row
+
+
+@pytest.mark.parametrize("rule_number", range(0, 256, 2))
+def test_tape_matches_wide_torus(rule_number):
+    width, generations = 24, 40
+    bits = random.Random(rule_number).getrandbits(width)
+    # The pattern grows at most one cell per side per generation
+    margin = generations + 1
+    torus_width = width + 2 * margin
+    torus = bits << margin
+    tape = tape_from_row(bits, width, origin=0)
+    for generation in range(1, generations + 1):
+        torus = evolve_packed_row(torus, rule_number, torus_width)
+        tape = evolve_tape(tape, rule_number)
+        assert tape_to_row(tape, -margin, torus_width) == torus, generation
+        if tape.width:
+            assert tape.bits >> (tape.width - 1) == 1 and tape.bits & 1
+
+
+def test_tape_rejects_odd_rules():
+    with pytest.raises(ValueError):
+        evolve_tape(tape_from_row(1, 3), 1)
+
+
+def test_infinite_recording_replays(tmp_path):
+    path = str(tmp_path / "tape.cast")
+    args = ["-r", "90", "-b", "infinite", "-w", "20", "-g", "100"]
+    assert headless.main(args + ["--record", path, "-o", str(tmp_path / "out")]) == 0
+
+    with SpacetimeReader(path) as reader:
+        state = State(replay=reader, height=40)
+        reset_simulation(state)
+        assert state.cycle is None
+        advance_simulation(state, 200)
+        assert state.current_row == len(reader) - 1
+        assert state.grid.latest() == reader.row(len(reader) - 1)
+
+
+def test_cycle_detector_gives_up_on_foreign_rows():
+    # Windows of rule 90 on an infinite line repeat (the window empties
+    # out) without being a toroidal orbit of rule 90 at that width
+    detector = CycleDetector(1 << 10, 90, 20)
+    tape = tape_from_row(1 << 10, 20)
+    for _ in range(100):
+        tape = evolve_tape(tape, 90)
+        assert not detector.observe(tape_to_row(tape, 0, 20))
+
+
+def test_reset_restores_configured_width():
+    state = State(width=40, height=20, rule_number=90, boundary="infinite")
+    reset_simulation(state)
+    advance_simulation(state, 200)
+    assert state.width > 40
+
+    reset_simulation(state)
+    assert state.width == 40 and state.origin == 0
+    advance_simulation(state, 200)
+    state.boundary = "torus"
+    reset_simulation(state)
+    assert state.width == 40